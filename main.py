@@ -1,3 +1,6 @@
+import time
+STARTED = time.perf_counter() # Before any heavy import, so --profile-startup can time them
+
 import sys
 import os
 import argparse
@@ -7,24 +10,39 @@ import traceback
 # Unlocks the GPU for smooth 60FPS scrolling
 os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--enable-gpu-rasterization --enable-zero-copy --ignore-gpu-blocklist"
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from src.hn_station import HNBrowser, APP_NAME
-
 def main():
     # --- 2. ARGUMENT PARSING (Future Proofing) ---
     parser = argparse.ArgumentParser(description="HN Station - The Hacker's Browser")
     parser.add_argument("--debug", action="store_true", help="Enable verbose console logging")
     parser.add_argument("--reset", action="store_true", help="Reset session and cookies on startup")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Log per-phase startup timings to startup_profile.jsonl in the data folder")
+    parser.add_argument("--quit-after-startup", action="store_true", help=argparse.SUPPRESS) # tools/bench_startup.py
+    commands = parser.add_subparsers(dest="command")
+    # Headless curator: plain Python, Qt is never imported (cron / servers)
+    from src.curator import add_arguments, run_cli
+    add_arguments(commands.add_parser("curate", help="Run the story curator without the GUI (once, or as a daemon)"))
     args = parser.parse_args()
+    if args.command == "curate":
+        sys.exit(run_cli(args))
+
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+    from src.hn_station import HNBrowser, APP_NAME
+    from src.startup import StartupProfiler
+    IMPORTED = time.perf_counter()
+
+    profiler = StartupProfiler(enabled=args.profile_startup, started=STARTED)
+    profiler.mark("imports", at=IMPORTED)
 
     # --- 3. APP LAUNCH ---
     try:
         app = QApplication(sys.argv)
         app.setApplicationName(APP_NAME)
+        profiler.mark("qapplication")
         
         # Pass args to the browser if you want to use them later
         # e.g., if args.reset: os.remove(session_file)
-        window = HNBrowser()
+        window = HNBrowser(profiler=profiler, quit_after_startup=args.quit_after_startup, debug=args.debug)
         window.showMaximized()
         
         sys.exit(app.exec())
@@ -0,0 +1,109 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+
+from src.filter_engine import FilterEngine
+
+ResourceType = QWebEngineUrlRequestInfo.ResourceType
+
+# Chromium resource type -> filter-list option name
+RESOURCE_TYPES = {
+    ResourceType.ResourceTypeSubFrame: "subdocument",
+    ResourceType.ResourceTypeStylesheet: "stylesheet",
+    ResourceType.ResourceTypeScript: "script",
+    ResourceType.ResourceTypeImage: "image",
+    ResourceType.ResourceTypeFavicon: "image",
+    ResourceType.ResourceTypeFontResource: "font",
+    ResourceType.ResourceTypeObject: "object",
+    ResourceType.ResourceTypePluginResource: "object",
+    ResourceType.ResourceTypeMedia: "media",
+    ResourceType.ResourceTypeXhr: "xmlhttprequest",
+    ResourceType.ResourceTypeJson: "xmlhttprequest",
+    ResourceType.ResourceTypePing: "ping",
+    ResourceType.ResourceTypeCspReport: "ping",
+    ResourceType.ResourceTypeWebSocket: "websocket",
+    ResourceType.ResourceTypeWorker: "script",
+    ResourceType.ResourceTypeSharedWorker: "script",
+    ResourceType.ResourceTypeServiceWorker: "script",
+}
+# Rough transfer size of what a blocked request would have fetched (bytes saved is an estimate)
+EST_BYTES = {"script": 25_000, "subdocument": 40_000, "image": 8_000, "stylesheet": 10_000, "font": 20_000,
+             "media": 100_000, "object": 20_000, "xmlhttprequest": 2_000, "ping": 500, "websocket": 0, "other": 5_000}
+FILTERED_SCHEMES = {"http", "https", "ws", "wss"}
+MAX_PAGES = 500  # Pages whose blocked counts are remembered
+
+
+class ContentBlocker(QWebEngineUrlRequestInterceptor):
+    """Profile-wide request interceptor backed by a FilterEngine.
+
+    The filter list is compiled (or loaded from its cache) on a worker
+    thread, so startup doesn't wait on it; requests pass unfiltered until
+    it's ready. Counts are kept per page URL: every request a tab makes
+    carries its page as the first-party URL, and a fresh navigation to a
+    page resets that page's count.
+    """
+    blocked = pyqtSignal(str)  # page URL
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.engine = None
+        self.enabled = True
+        self.pages = OrderedDict()  # page URL -> [blocked requests, estimated bytes]
+        self.stats = {"checked": 0, "blocked": 0, "bytes": 0, "match_s": 0.0}
+
+    def load(self, paths, cache_path):
+        def run():
+            t = time.perf_counter()
+            try:
+                engine = FilterEngine.load(paths, cache_path)
+            except Exception as e:
+                logging.error(f"Filter List Load Error: {e}")
+                return
+            self.engine = engine
+            logging.info(f"Content blocker ready in {(time.perf_counter() - t) * 1000:.0f} ms: {engine.summary()}")
+        threading.Thread(target=run, name="filter-load", daemon=True).start()
+
+    def interceptRequest(self, info):
+        engine = self.engine
+        if engine is None or not self.enabled:
+            return
+        kind = info.resourceType()
+        if kind == ResourceType.ResourceTypeMainFrame:
+            self.pages.pop(info.requestUrl().toString(), None)  # New visit, new count
+            return
+        url = info.requestUrl()
+        if url.scheme() not in FILTERED_SCHEMES:
+            return
+        page = info.firstPartyUrl()
+        kind = RESOURCE_TYPES.get(kind, "other")
+        t = time.perf_counter()
+        block = engine.should_block(url.toString(), page.host(), kind)
+        self.stats["match_s"] += time.perf_counter() - t
+        self.stats["checked"] += 1
+        if not block:
+            return
+        info.block(True)
+        page_url = page.toString()
+        counts = self.pages.pop(page_url, None) or [0, 0]
+        counts[0] += 1
+        counts[1] += EST_BYTES[kind]
+        self.pages[page_url] = counts
+        if len(self.pages) > MAX_PAGES:
+            self.pages.popitem(last=False)
+        self.stats["blocked"] += 1
+        self.stats["bytes"] += EST_BYTES[kind]
+        self.blocked.emit(page_url)
+
+    def page_stats(self, url):
+        """(blocked requests, estimated bytes saved) for a page URL."""
+        return tuple(self.pages.get(url, (0, 0)))
+
+    def summary(self):
+        s = self.stats
+        per_request = s["match_s"] / s["checked"] * 1e6 if s["checked"] else 0
+        return (f"content blocker: {s['blocked']}/{s['checked']} requests blocked, "
+                f"~{s['bytes'] / (1024 * 1024):.1f} MB saved, {per_request:.1f} us/request")
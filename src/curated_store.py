@@ -0,0 +1,149 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+
+
+class CuratedStore:
+    """Indexed, append-friendly store for curator finds (SQLite in WAL mode).
+
+    Replaces my_hn_links.json: writes are single transactions (a crash can't
+    leave a half-written file), and lookups by id, rule or date hit indexes
+    instead of loading the whole history.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def _db(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS finds (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT,
+                    url TEXT,
+                    matched TEXT,
+                    score REAL DEFAULT 1,
+                    found_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS finds_found_at ON finds(found_at);
+                CREATE TABLE IF NOT EXISTS find_rules (
+                    id INTEGER NOT NULL,
+                    rule TEXT NOT NULL,
+                    PRIMARY KEY (rule, id)
+                );
+            """)
+        return self.conn
+
+    @staticmethod
+    def _row(row, rules):
+        entry = dict(row)
+        entry["rules"] = rules
+        return entry
+
+    def _with_rules(self, db, rows):
+        rows = list(rows)
+        if not rows:
+            return []
+        ids = [r["id"] for r in rows]
+        marks = ",".join("?" * len(ids))
+        rules = {}
+        for rid, rule in db.execute(f"SELECT id, rule FROM find_rules WHERE id IN ({marks})", ids):
+            rules.setdefault(rid, []).append(rule)
+        return [self._row(r, sorted(rules.get(r["id"], []))) for r in rows]
+
+    # --- WRITES ---
+    def add_many(self, entries):
+        """Insert finds in one transaction. Returns the number actually added (existing ids are kept)."""
+        added = 0
+        with self.lock:
+            db = self._db()
+            with db:
+                for e in entries:
+                    cur = db.execute(
+                        "INSERT OR IGNORE INTO finds (id, title, url, matched, score, found_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (e["id"], e.get("title"), e.get("url"), e.get("matched"), e.get("score", 1), e["found_at"]))
+                    if cur.rowcount:
+                        added += 1
+                        rules = e.get("rules") or ([e["matched"]] if e.get("matched") else [])
+                        db.executemany("INSERT OR IGNORE INTO find_rules VALUES (?, ?)", [(e["id"], r) for r in rules])
+        return added
+
+    def add(self, entry):
+        return self.add_many([entry]) == 1
+
+    # --- READS ---
+    def known(self, ids):
+        """Subset of ids already stored."""
+        ids = list(ids)
+        out = set()
+        with self.lock:
+            db = self._db()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                out.update(r[0] for r in db.execute(f"SELECT id FROM finds WHERE id IN ({marks})", chunk))
+        return out
+
+    def get(self, item_id):
+        with self.lock:
+            db = self._db()
+            found = self._with_rules(db, db.execute("SELECT * FROM finds WHERE id=?", (item_id,)))
+        return found[0] if found else None
+
+    def page(self, offset=0, limit=50):
+        """Newest first."""
+        with self.lock:
+            db = self._db()
+            return self._with_rules(db, db.execute(
+                "SELECT * FROM finds ORDER BY found_at DESC, id DESC LIMIT ? OFFSET ?", (limit, offset)))
+
+    def by_keyword(self, rule, offset=0, limit=50):
+        with self.lock:
+            db = self._db()
+            return self._with_rules(db, db.execute(
+                "SELECT f.* FROM find_rules r JOIN finds f ON f.id = r.id WHERE r.rule = ? "
+                "ORDER BY f.found_at DESC LIMIT ? OFFSET ?", (rule.lower(), limit, offset)))
+
+    def between(self, start, end, offset=0, limit=50):
+        """Finds with start <= found_at < end (ISO-8601 strings or datetimes)."""
+        start = start.isoformat() if hasattr(start, "isoformat") else start
+        end = end.isoformat() if hasattr(end, "isoformat") else end
+        with self.lock:
+            db = self._db()
+            return self._with_rules(db, db.execute(
+                "SELECT * FROM finds WHERE found_at >= ? AND found_at < ? ORDER BY found_at DESC LIMIT ? OFFSET ?",
+                (start, end, limit, offset)))
+
+    def count(self):
+        with self.lock:
+            return self._db().execute("SELECT COUNT(*) FROM finds").fetchone()[0]
+
+    # --- MIGRATION ---
+    def migrate_json(self, json_path):
+        """One-shot import of the legacy my_hn_links.json; the file is renamed once imported."""
+        if not os.path.exists(json_path):
+            return 0
+        try:
+            with open(json_path, "r") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Curated JSON migration skipped, unreadable {json_path}: {e}")
+            return 0
+        added = self.add_many(e for e in legacy if "id" in e and "found_at" in e)
+        os.replace(json_path, json_path + ".migrated")
+        logging.info(f"Migrated {added} curated stories from {os.path.basename(json_path)}")
+        return added
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
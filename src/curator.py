@@ -0,0 +1,201 @@
+import os
+import sys
+import time
+import signal
+import logging
+import threading
+from datetime import datetime
+
+from src.fetcher import HNFetcher, API_BASE
+from src.item_cache import ItemCache
+from src.matcher import KeywordMatcher
+from src.curated_store import CuratedStore
+from src.search_index import SearchIndex
+
+FEEDS = {
+    "top": "topstories.json",
+    "new": "newstories.json",
+    "best": "beststories.json",
+    "ask": "askstories.json",
+    "show": "showstories.json",
+}
+STORY_TYPES = {"story", "job", "poll"}
+# Incremental mode: cap how far back a pass will walk after a long gap. HN creates
+# roughly 10 items a minute, so this is ~2-3 hours of activity and ~150 s of
+# fetching at the fetcher's default 10 requests/s
+MAX_BACKFILL = 1500
+
+
+class CuratorEngine:
+    """Fetch -> match -> store, with no Qt in sight.
+
+    One run_once() is one curator pass: candidates come either from the HN
+    lists (poll mode) or from every item since the last checkpoint
+    (incremental mode); stories matching the watch terms go into
+    curated.db and the local search index in the data folder. The GUI's
+    HNCurator thread and the headless `main.py curate` command both drive
+    this class, and share the same store when pointed at the same folder.
+    """
+
+    def __init__(self, data_path, keywords, incremental=False, feeds=("top",), per_feed=60, api_base=API_BASE):
+        self.data_path = data_path
+        self.api_base = api_base
+        self.matcher = KeywordMatcher(keywords)
+        self.incremental = incremental
+        self.feeds = feeds
+        self.per_feed = per_feed
+
+    def list_candidates(self, fetcher, cache, store):
+        # Poll mode: one request per feed, items only for ids we haven't matched yet
+        ids = []
+        for feed in self.feeds:
+            for hn_id in fetcher.get_json(FEEDS[feed])[:self.per_feed]:
+                if hn_id not in ids:
+                    ids.append(hn_id)
+        seen = store.known(ids)
+        ids = [i for i in ids if i not in seen]
+        stories = cache.fetch_items(fetcher, ids)
+        return [stories[i] for i in ids if stories.get(i)]
+
+    def incremental_candidates(self, fetcher, cache, store):
+        # Incremental mode: walk (cursor, maxitem] plus whatever the updates feed reports
+        max_item = fetcher.get_json("maxitem.json")
+        cursor = cache.get_meta("curator_cursor")
+        if cursor is None:
+            # First run: seed from the lists so we don't walk the whole item history
+            stories = self.list_candidates(fetcher, cache, store)
+            cache.set_meta("curator_cursor", max_item)
+            return stories
+
+        start = cursor + 1
+        if max_item - cursor > MAX_BACKFILL:
+            logging.warning(f"Curator: {max_item - cursor} items since last checkpoint, skipping to the last {MAX_BACKFILL}")
+            start = max_item - MAX_BACKFILL + 1
+        new_ids = list(range(start, max_item + 1))
+
+        # Titles can be edited; only re-check updated items we already know are stories
+        updated = fetcher.get_json("updates.json").get("items", [])
+        kinds = cache.kinds(updated)
+        seen = store.known(updated)
+        changed = [i for i in updated if kinds.get(i) in STORY_TYPES and i not in seen]
+        cache.invalidate(changed)
+
+        ids = new_ids + changed
+        failed = set()
+        items = cache.fetch_items(fetcher, ids, failed)
+        stories = [items[i] for i in ids if items.get(i) and items[i].get("type") in STORY_TYPES]
+        # Stop just short of the first new id that failed to fetch, so the next pass retries it
+        missed = [i for i in failed if i >= start]
+        cache.set_meta("curator_cursor", min(missed) - 1 if missed else max_item)
+        if missed:
+            logging.warning(f"Curator: {len(missed)} new items failed to fetch, checkpoint held at {min(missed) - 1}")
+        return stories
+
+    def match(self, stories):
+        new_finds = []
+        for story in stories:
+            hn_id = story['id']
+            rules = self.matcher.match(story.get('title', ''))
+            if rules:
+                new_finds.append({
+                    "id": hn_id,
+                    "title": story.get('title'),
+                    "url": story.get('url', f"https://news.ycombinator.com/item?id={hn_id}"),
+                    "matched": rules[0].term,
+                    "rules": [r.term for r in rules],
+                    "score": sum(r.weight for r in rules),
+                    "found_at": datetime.now().isoformat()
+                })
+        return new_finds
+
+    def run_once(self):
+        """One curator pass. Returns the number of new finds stored; errors propagate to the caller."""
+        fetcher = HNFetcher(base_url=self.api_base)
+        cache = ItemCache(os.path.join(self.data_path, "item_cache.db"))
+        store = CuratedStore(os.path.join(self.data_path, "curated.db"))
+        try:
+            store.migrate_json(os.path.join(self.data_path, "my_hn_links.json"))
+
+            if self.incremental:
+                stories = self.incremental_candidates(fetcher, cache, store)
+            else:
+                stories = self.list_candidates(fetcher, cache, store)
+
+            new_finds = self.match(stories)
+            added = store.add_many(new_finds)
+            if new_finds:
+                search = SearchIndex(os.path.join(self.data_path, "search.db"))
+                search.add_many(new_finds)
+                search.close()
+            logging.info(f"Curator pass: {len(stories)} candidates, {added} new finds, "
+                         f"{fetcher.stats['requests']} requests, {cache.summary()}")
+            return added
+        finally:
+            fetcher.close()
+            cache.close()
+            store.close()
+
+
+# --- HEADLESS CLI (python main.py curate) ---
+def add_arguments(parser):
+    parser.add_argument("--daemon", action="store_true", help="Keep running, one pass every --interval minutes")
+    parser.add_argument("--interval", type=float, help="Minutes between passes in daemon mode (default: settings.json)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Check every new item since the last pass instead of only the front of the lists")
+    parser.add_argument("--feeds", help="Comma-separated lists to poll: " + ", ".join(FEEDS))
+    parser.add_argument("--per-feed", type=int, default=60, help="Stories taken from the top of each list")
+    parser.add_argument("--keywords", help="Comma-separated watch terms (default: curator_keywords in settings.json)")
+    parser.add_argument("--data-dir", help="Folder holding settings.json, curated.db and search.db (default: the app data folder)")
+    parser.add_argument("--api-base", default=API_BASE, help="HN API root (e.g. a local tools/stub_hn_server.py)")
+
+
+def run_cli(args):
+    """Entry point for `main.py curate`. Returns the process exit code."""
+    from src.paths import get_user_data_path
+    from src.settings import load_settings
+
+    data_path = args.data_dir or get_user_data_path()
+    os.makedirs(data_path, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(data_path, "curator.log"), mode='a', encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    settings = load_settings(os.path.join(data_path, "settings.json"))  # --data-dir is self-contained
+    keywords = [k.strip() for k in args.keywords.split(",")] if args.keywords else settings["curator_keywords"]
+    feeds = [f.strip() for f in args.feeds.split(",")] if args.feeds else settings["curator_feeds"]
+    unknown = [f for f in feeds if f not in FEEDS]
+    if unknown:
+        logging.error(f"Unknown feed(s): {', '.join(unknown)} (choose from {', '.join(FEEDS)})")
+        return 2
+    if not keywords:
+        logging.error("No watch terms: pass --keywords or set curator_keywords in settings.json")
+        return 2
+
+    engine = CuratorEngine(data_path, [k for k in keywords if k], incremental=args.incremental, feeds=tuple(feeds),
+                           per_feed=args.per_feed, api_base=args.api_base)
+    if not args.daemon:
+        try:
+            engine.run_once()
+            return 0
+        except Exception as e:
+            logging.error(f"Curator Error: {e}")
+            return 1
+
+    interval = 60 * (args.interval if args.interval is not None else settings["curator_interval_minutes"])
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    logging.info(f"Curator daemon: {len(keywords)} watch terms, every {interval / 60:g} min, data in {data_path}")
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            engine.run_once()
+        except Exception as e:
+            logging.error(f"Curator Error: {e}")  # Next pass tries again
+        stop.wait(max(0, interval - (time.monotonic() - started)))
+    logging.info("Curator daemon stopped")
+    return 0
@@ -0,0 +1,237 @@
+import json
+import time
+import random
+import logging
+import threading
+import http.client
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# --- CONFIGURATION ---
+API_BASE = "https://hacker-news.firebaseio.com/v0/"
+USER_AGENT = "HNStation/1.0 (+https://github.com/rajeshkumarblr/myhn)"
+
+# Politeness defaults: ~10 req/s sustained, never more than 8 sockets open at once.
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_IN_FLIGHT = 8
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 30.0
+
+
+class FetchError(Exception):
+    def __init__(self, url, status=None, reason=""):
+        super().__init__(f"{url} -> {status or 'error'} {reason}".strip())
+        self.url = url
+        self.status = status
+
+
+# --- RATE LIMITING ---
+class TokenBucket:
+    """Thread-safe token bucket. acquire() blocks until a token is free.
+
+    pause() lets a 429's Retry-After (capped at MAX_BACKOFF) hold back
+    *every* worker sharing the bucket, not just the one that got throttled.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return
+                    wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def try_acquire(self, tokens=1):
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return False
+            self._refill(now)
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def pause(self, seconds):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+def parse_retry_after(value):
+    """Retry-After is either delta-seconds or an HTTP date. Returns seconds or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=0.5, cap=MAX_BACKOFF):
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# --- FETCH ENGINE ---
+class HNFetcher:
+    """Concurrent JSON fetcher for the HN Firebase API.
+
+    Every request takes a token from a shared TokenBucket and runs on a
+    bounded thread pool (max_in_flight). Each worker thread keeps its own
+    keep-alive HTTP(S) connection, so a pass over 60 items costs a handful
+    of TLS handshakes instead of 60.
+    """
+
+    def __init__(self, base_url=API_BASE, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, retries=3, timeout=10, bucket=None):
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        parts = urlsplit(self.base_url)
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.base_path = parts.path
+        self.bucket = bucket or TokenBucket(rate, burst)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.retries = retries
+        self.timeout = timeout
+        self.local = threading.local()
+        self.pool = None
+        self.pool_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "errors": 0, "connections": 0}
+
+    def _count(self, key, n=1):
+        with self.stats_lock:
+            self.stats[key] += n
+
+    def _executor(self):
+        with self.pool_lock:
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="hn-fetch")
+            return self.pool
+
+    def _connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            conn = cls(self.netloc, timeout=self.timeout)
+            self.local.conn = conn
+            self._count("connections")
+        return conn
+
+    def _drop_connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+    def _request(self, path):
+        conn = self._connection()
+        try:
+            conn.request("GET", path, headers={"User-Agent": USER_AGENT, "Accept": "application/json",
+                                               "Connection": "keep-alive"})
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive socket; reconnect once before counting it as a failure
+            self._drop_connection()
+            conn = self._connection()
+            conn.request("GET", path, headers={"User-Agent": USER_AGENT, "Accept": "application/json",
+                                               "Connection": "keep-alive"})
+            resp = conn.getresponse()
+            body = resp.read()
+        if resp.will_close:
+            self._drop_connection()
+        return resp.status, resp.getheader("Retry-After"), body
+
+    def url_for(self, path):
+        return f"{self.scheme}://{self.netloc}{self.base_path}{path}"
+
+    def get_json(self, path):
+        """Fetch base_url + path, honouring the rate budget and retrying 429/5xx."""
+        full_path = self.base_path + path
+        for attempt in range(self.retries):
+            self.bucket.acquire()
+            self._count("requests")
+            try:
+                status, retry_after, body = self._request(full_path)
+            except (http.client.HTTPException, OSError) as e:
+                self._drop_connection()
+                if attempt == self.retries - 1:
+                    self._count("errors")
+                    raise FetchError(self.url_for(path), reason=str(e))
+                self._count("retries")
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if status == 200:
+                return json.loads(body.decode())
+            if status not in RETRY_STATUSES or attempt == self.retries - 1:
+                self._count("errors")
+                raise FetchError(self.url_for(path), status)
+
+            self._count("retries")
+            delay = parse_retry_after(retry_after)
+            if status == 429:
+                self._count("throttled")
+                # Throttling is a signal for the whole pool, not just this worker
+                self.bucket.pause(min(MAX_BACKOFF, delay) if delay is not None else backoff_delay(attempt + 1, base=1.0))
+            else:
+                time.sleep(min(MAX_BACKOFF, delay) if delay is not None else backoff_delay(attempt))
+        return None
+
+    def get_item(self, item_id):
+        return self.get_json(f"item/{item_id}.json")
+
+    def iter_items(self, ids, failed=None):
+        """Yield (id, item) as they complete. Failed items yield (id, None) and go into `failed` if given.
+
+        Items the API answers with null (deleted ids, ids not propagated yet) also
+        yield None but are not failures.
+        """
+        futures = {self._executor().submit(self.get_item, i): i for i in ids}
+        for fut in as_completed(futures):
+            item_id = futures[fut]
+            try:
+                yield item_id, fut.result()
+            except FetchError as e:
+                logging.warning(f"Failed to fetch item {item_id}: {e}")
+                if failed is not None:
+                    failed.add(item_id)
+                yield item_id, None
+
+    def fetch_items(self, ids):
+        return dict(self.iter_items(ids))
+
+    def close(self):
+        with self.pool_lock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=True)
+                self.pool = None
+        self._drop_connection()
@@ -0,0 +1,334 @@
+import os
+import re
+import pickle
+import hashlib
+import logging
+
+# --- FILTER SYNTAX (the EasyList / Adblock Plus subset we understand) ---
+#   ||ads.example.com^         block a domain and its subdomains (hash set, no pattern work)
+#   &adurl=  -ad-300x250.      substring anywhere in the URL
+#   |https://x.com/a*.js|      | anchors start/end, * is a wildcard, ^ a separator (/ ? & : end ...)
+#   /ads?\d+\./                regular expression
+#   @@...                      exception: allows what a blocking rule would stop
+#   $script,third-party        options: resource types (~ negates), third-party, domain=a.com|~b.com
+#                              @@...$document exempts whole pages on a domain
+# Element hiding (##), comments (!) and rules with options we can't honour are skipped.
+CACHE_VERSION = 1
+
+TYPES = ("document", "subdocument", "stylesheet", "script", "image", "font", "object", "xmlhttprequest",
+         "ping", "media", "websocket", "other")
+TYPE_BITS = {name: 1 << i for i, name in enumerate(TYPES)}
+TYPE_ALIASES = {"xhr": "xmlhttprequest", "css": "stylesheet", "frame": "subdocument", "beacon": "ping",
+                "object-subrequest": "object"}
+ALL_TYPES = (1 << len(TYPES)) - 1
+DEFAULT_TYPES = ALL_TYPES & ~TYPE_BITS["document"]  # ABP: a rule without types never blocks the page itself
+IGNORED_OPTIONS = {"match-case", "important", "~third-party-is-first-party", "all"}
+
+# Rule kinds
+SUBSTRING, REGEX = 0, 1
+
+URL_TOKEN_RE = re.compile(r"[a-z0-9%]+")
+PATTERN_TOKEN_RE = re.compile(r"[a-z0-9%]+")
+OPTIONS_RE = re.compile(r"^[\w~,=|.\-]+$")
+# Tokens so common in URLs that indexing a rule under them saves nothing
+BAD_TOKENS = {"http", "https", "www", "com", "net", "org", "js", "html", "php", "static", "cdn", "img"}
+SEPARATOR = r"(?:[^a-z0-9_.%-]|$)"
+HOST_ANCHOR = r"^[a-z][a-z0-9+.-]*://(?:[^/?#]*\.)?"
+SECOND_LEVEL = {"co", "com", "org", "net", "gov", "ac", "edu", "ne", "or"}
+
+
+def host_suffixes(host):
+    """a.b.example.com -> a.b.example.com, b.example.com, example.com"""
+    labels = host.split(".")
+    return [".".join(labels[i:]) for i in range(max(1, len(labels) - 1))]
+
+
+def base_domain(host):
+    # Without the public suffix list: last two labels, three for foo.co.uk style names
+    labels = host.split(".")
+    n = 3 if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL else 2
+    return ".".join(labels[-n:])
+
+
+def pattern_regex(pattern):
+    if len(pattern) > 2 and pattern.startswith("/") and pattern.endswith("/"):
+        return pattern[1:-1]
+    out = []
+    if pattern.startswith("||"):
+        out.append(HOST_ANCHOR)
+        pattern = pattern[2:]
+    elif pattern.startswith("|"):
+        out.append("^")
+        pattern = pattern[1:]
+    end = ""
+    if pattern.endswith("|"):
+        end = "$"
+        pattern = pattern[:-1]
+    for ch in pattern:
+        if ch == "*":
+            out.append(".*")
+        elif ch == "^":
+            out.append(SEPARATOR)
+        else:
+            out.append(re.escape(ch))
+    return "".join(out) + end
+
+
+def compile_pattern(body):
+    # URLs are matched lowercased, so IGNORECASE is only needed for sources with capitals
+    # (\D, \W, ...); without it re keeps its fast literal-prefix search
+    return re.compile(body, re.IGNORECASE if any(c.isupper() for c in body) else 0)
+
+
+def best_token(pattern):
+    """Longest token that must appear whole in any URL the pattern matches (None if there isn't one)."""
+    if pattern.startswith("/") and pattern.endswith("/"):
+        return None
+    best = None
+    for m in PATTERN_TOKEN_RE.finditer(pattern):
+        start, end = m.span()
+        before = pattern[start - 1] if start else ""
+        after = pattern[end] if end < len(pattern) else ""
+        # Unanchored ends and wildcards mean the URL token may be longer than this one
+        if before in ("", "*"):
+            continue
+        if after in ("", "*"):
+            continue
+        token = m.group()
+        if token in BAD_TOKENS or len(token) < 2:
+            continue
+        if best is None or len(token) > len(best):
+            best = token
+    return best
+
+
+def parse_options(text):
+    """-> (types mask, third_party True/False/None, include domains, exclude domains, document) or None if unsupported."""
+    types = 0
+    negated = 0
+    third_party = None
+    include, exclude = set(), set()
+    document = False
+    for opt in text.split(","):
+        opt = opt.strip()
+        name = opt.lstrip("~")
+        name = TYPE_ALIASES.get(name, name)
+        if opt.startswith("domain="):
+            for d in opt[7:].split("|"):
+                (exclude if d.startswith("~") else include).add(d.lstrip("~"))
+        elif name == "third-party":
+            third_party = not opt.startswith("~")
+        elif name == "first-party":
+            third_party = opt.startswith("~")
+        elif name in TYPE_BITS:
+            if opt.startswith("~"):
+                negated |= TYPE_BITS[name]
+            else:
+                types |= TYPE_BITS[name]
+            document = document or (name == "document" and not opt.startswith("~"))
+        elif opt in IGNORED_OPTIONS:
+            continue
+        else:
+            return None  # popup, csp, redirect, removeparam, ...: not something a request filter can do
+    if not types:
+        types = DEFAULT_TYPES
+    types &= ~negated
+    return types, third_party, frozenset(include) or None, frozenset(exclude) or None, document
+
+
+class RuleSet:
+    """One side (block or allow) of a compiled list."""
+
+    def __init__(self):
+        self.domains = set()  # ||domain^ with no options: a hash lookup per host suffix
+        self.tokens = {}      # token -> [rule]
+        self.generic = []     # rules with no usable token, tried on every request
+
+    def add(self, rule, token):
+        if token:
+            self.tokens.setdefault(token, []).append(rule)
+        else:
+            self.generic.append(rule)
+
+    def __len__(self):
+        return len(self.domains) + sum(map(len, self.tokens.values())) + len(self.generic)
+
+
+class FilterEngine:
+    """Compiled EasyList-style filter list for a request interceptor.
+
+    Plain ||domain^ rules (the bulk of real lists) go in a hash set checked
+    once per host suffix. Every other rule is indexed under its longest
+    token that any matching URL must contain, so a request only tests the
+    handful of rules sharing a token with its URL; regexes are compiled on
+    first use. The compiled form is pickled next to the lists and reused
+    while the list files are unchanged.
+    """
+
+    def __init__(self):
+        self.block = RuleSet()
+        self.allow = RuleSet()
+        self.allow_pages = set()  # @@||domain^$document: nothing is blocked on these sites
+        self.skipped = 0
+        self.regex_cache = {}
+
+    # --- COMPILING ---
+    @classmethod
+    def from_text(cls, text):
+        engine = cls()
+        for line in text.splitlines():
+            engine.add_rule(line)
+        return engine
+
+    def add_rule(self, line):
+        line = line.strip()
+        if not line or line.startswith(("!", "[")) or "##" in line or "#@#" in line or "#?#" in line:
+            return False
+        target = self.block
+        if line.startswith("@@"):
+            target = self.allow
+            line = line[2:]
+        pattern, options = line, None
+        dollar = line.rfind("$")
+        if dollar > 0 and OPTIONS_RE.match(line[dollar + 1:]) and not (line.startswith("/") and line.endswith("/")):
+            pattern, options = line[:dollar], parse_options(line[dollar + 1:].lower())
+            if options is None:
+                self.skipped += 1
+                return False
+        is_regex = len(pattern) > 2 and pattern.startswith("/") and pattern.endswith("/")
+        if not is_regex:
+            pattern = pattern.lower()
+        if pattern in ("", "*", "|", "||"):
+            self.skipped += 1
+            return False
+
+        types, third_party, include, exclude, document = options or (DEFAULT_TYPES, None, None, None, False)
+        host_only = re.fullmatch(r"\|\|([a-z0-9.-]+)\^", pattern)
+        if host_only and target is self.allow and document:
+            self.allow_pages.add(host_only.group(1))
+            return True
+        if host_only and options is None:
+            target.domains.add(host_only.group(1))
+            return True
+
+        if is_regex:
+            kind, body = REGEX, pattern[1:-1]
+        elif any(c in pattern for c in "*^|"):
+            kind, body = REGEX, pattern_regex(pattern)
+        else:
+            kind, body = SUBSTRING, pattern
+        target.add((kind, body, types, third_party, include, exclude), best_token(pattern))
+        return True
+
+    @classmethod
+    def load(cls, paths, cache_path=None):
+        """Compile the list files (missing ones are skipped), reusing cache_path while none of them changed."""
+        sources = []
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    sources.append(f.read())
+            except FileNotFoundError:
+                continue
+        digest = hashlib.sha256(b"\0".join([str(CACHE_VERSION).encode()] + sources)).hexdigest()
+        if cache_path:
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_digest, state = pickle.load(f)
+                if cached_digest == digest:
+                    engine = cls()
+                    engine.__dict__.update(state)
+                    return engine
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.error(f"Filter Cache Load Error: {e}")
+
+        engine = cls.from_text("\n".join(s.decode("utf-8", "replace") for s in sources))
+        if cache_path:
+            tmp = cache_path + ".tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump((digest, engine.__getstate__()), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except OSError as e:
+                logging.error(f"Filter Cache Write Error: {e}")
+        return engine
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["regex_cache"] = {}  # Compiled patterns don't pickle any faster than they compile
+        return state
+
+    # --- MATCHING ---
+    def should_block(self, url, first_party_host="", resource_type="other"):
+        """True if url (as requested from a page on first_party_host) should be blocked."""
+        url = url.lower()
+        host = url.split("://", 1)[-1].split("/", 1)[0].split("?", 1)[0].rsplit("@", 1)[-1].split(":", 1)[0]
+        if first_party_host and self.allow_pages and any(h in self.allow_pages for h in host_suffixes(first_party_host)):
+            return False
+        suffixes = host_suffixes(host)
+        tokens = None
+        if not any(h in self.block.domains for h in suffixes):
+            tokens = set(URL_TOKEN_RE.findall(url))
+            if not self.match_rules(self.block, url, tokens, host, first_party_host, resource_type):
+                return False
+        if any(h in self.allow.domains for h in suffixes):
+            return False
+        if tokens is None:
+            tokens = set(URL_TOKEN_RE.findall(url))
+        return not self.match_rules(self.allow, url, tokens, host, first_party_host, resource_type)
+
+    def match_rules(self, rules, url, tokens, host, first_party_host, resource_type):
+        type_bit = TYPE_BITS.get(resource_type, TYPE_BITS["other"])
+        index = rules.tokens
+        for token in tokens:
+            for rule in index.get(token, ()):
+                if self.rule_matches(rule, url, host, first_party_host, type_bit):
+                    return True
+        if rules.generic and self.generic_prefilter(rules).search(url):
+            for rule in rules.generic:
+                if self.rule_matches(rule, url, host, first_party_host, type_bit):
+                    return True
+        return False
+
+    def generic_prefilter(self, rules):
+        # Token-less rules are few but would be tried on every request: one combined
+        # regex tells whether any of them can match before checking them one by one
+        key = id(rules)
+        compiled = self.regex_cache.get(key)
+        if compiled is None:
+            bodies = [re.escape(body) if kind == SUBSTRING else body for kind, body, *_ in rules.generic]
+            try:
+                compiled = compile_pattern("|".join(f"(?:{b})" for b in bodies))
+            except re.error:
+                compiled = re.compile("")  # Some rule can't be combined: always check them all
+            self.regex_cache[key] = compiled
+        return compiled
+
+    def rule_matches(self, rule, url, host, first_party_host, type_bit):
+        kind, body, types, third_party, include, exclude = rule
+        if not types & type_bit:
+            return False
+        if third_party is not None and first_party_host and \
+                (base_domain(host) != base_domain(first_party_host)) != third_party:
+            return False
+        if include or exclude:
+            page = host_suffixes(first_party_host) if first_party_host else []
+            if include and not any(h in include for h in page):
+                return False
+            if exclude and any(h in exclude for h in page):
+                return False
+        if kind == SUBSTRING:
+            return body in url
+        compiled = self.regex_cache.get(body)
+        if compiled is None:
+            try:
+                compiled = self.regex_cache[body] = compile_pattern(body)
+            except re.error:
+                compiled = self.regex_cache[body] = re.compile(r"(?!)")
+        return compiled.search(url) is not None
+
+    def summary(self):
+        return (f"filters: {len(self.block)} block, {len(self.allow) + len(self.allow_pages)} allow rules "
+                f"({len(self.block.domains)} domains), {self.skipped} skipped")
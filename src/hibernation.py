@@ -0,0 +1,163 @@
+import time
+import weakref
+import logging
+
+from PyQt6.QtWebEngineCore import QWebEnginePage
+from PyQt6.QtCore import QObject, QTimer, Qt
+
+try:
+    import psutil  # Optional: only used to report how much renderer memory was freed
+except ImportError:
+    psutil = None
+
+Lifecycle = QWebEnginePage.LifecycleState
+HIBERNATED_MARK = "💤 "
+
+
+def process_rss(pid):
+    if psutil is None or not pid:
+        return 0
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return 0
+
+
+class TabHibernator(QObject):
+    """Discards the renderer of background tabs that sit idle or exceed the live-tab budget.
+
+    A hibernated HNView keeps its tab, URL, title, group colour, a thumbnail
+    and the scroll offset. Chromium keeps the navigation entry, so switching
+    back (wake) just flips the page to Active, which reloads it, and the
+    scroll offset is restored once the load finishes.
+    """
+
+    def __init__(self, main_window, idle_minutes=15, max_live_tabs=12, check_interval_ms=30_000):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.idle_seconds = idle_minutes * 60
+        self.max_live_tabs = max_live_tabs
+        self.freed_bytes = 0
+        self.pending_pids = {}
+        self.current = None  # weakref to the tab in front; a closed tab must not be kept alive here
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.enforce)
+        if self.idle_seconds or self.max_live_tabs:
+            self.timer.start(check_interval_ms)
+
+    # --- BOOKKEEPING ---
+    def views(self):
+        tabs = self.main_window.tabs
+        return [tabs.widget(i) for i in range(tabs.count())]
+
+    def touch(self, view):
+        view.last_active = time.monotonic()
+
+    def activated(self, view):
+        """Current tab changed: the tab left behind was in use right up to now."""
+        previous = self.current() if self.current else None
+        if previous is not None and previous is not view:
+            self.touch(previous)
+        self.current = weakref.ref(view)
+        self.wake(view)
+
+    def is_hibernated(self, view):
+        return getattr(view, "hibernated", False)
+
+    def has_renderer(self, view):
+        """False for placeholders (lazy restore, queued) that have never loaded anything."""
+        if getattr(view, "pending_url", None) or getattr(view, "queued_url", None):
+            return False
+        return view.url().isValid() and not view.url().isEmpty()
+
+    # --- POLICY ---
+    def enforce(self):
+        current = self.main_window.tabs.currentWidget()
+        if current:
+            self.touch(current)  # Still being read
+        now = time.monotonic()
+        live = [v for v in self.views() if v is not current and not self.is_hibernated(v) and self.has_renderer(v)]
+        victims = []
+        if self.idle_seconds:
+            victims = [v for v in live if now - getattr(v, "last_active", now) > self.idle_seconds]
+        if self.max_live_tabs:
+            # +1: the current tab is always live and counts against the budget
+            over = len(live) + 1 - self.max_live_tabs
+            if over > 0:
+                by_age = sorted((v for v in live if v not in victims), key=lambda v: getattr(v, "last_active", 0))
+                victims += by_age[:max(0, over - len(victims))]
+        if victims:
+            self.hibernate_many(victims)
+
+    def hibernate_all_background(self):
+        current = self.main_window.tabs.currentWidget()
+        self.hibernate_many([v for v in self.views() if v is not current])
+
+    def hibernate_many(self, views):
+        count = sum(1 for v in views if self.hibernate(v))
+        if count:
+            QTimer.singleShot(3000, lambda: self.report(count))
+
+    # --- HIBERNATE / WAKE ---
+    def hibernate(self, view):
+        tabs = self.main_window.tabs
+        page = view.page()
+        if self.is_hibernated(view) or view is tabs.currentWidget() or page is None:
+            return False
+        if not self.has_renderer(view):
+            return False
+
+        view.saved_scroll = view.page_scroll()
+        view.saved_title = view.title()
+        view.thumbnail = view.grab().scaled(320, 200, Qt.AspectRatioMode.KeepAspectRatio,
+                                            Qt.TransformationMode.SmoothTransformation)
+        pid = page.renderProcessPid()
+        if pid and pid not in self.pending_pids:
+            self.pending_pids[pid] = process_rss(pid)
+
+        page.setLifecycleState(Lifecycle.Discarded)
+        view.hibernated = True
+
+        idx = tabs.indexOf(view)
+        if idx >= 0:
+            text = tabs.tabText(idx)
+            if not text.startswith(HIBERNATED_MARK):
+                tabs.setTabText(idx, HIBERNATED_MARK + text)
+            tabs.tabBar().setTabTextColor(idx, view.group_color)
+        self.main_window.tab_updated(view)
+        logging.info(f"Hibernated tab: {view.url().toString()}")
+        return True
+
+    def wake(self, view):
+        self.touch(view)
+        if not self.is_hibernated(view):
+            return
+        view.hibernated = False
+        if view.saved_scroll != (0, 0):
+            view.restore_scroll_after_load(*view.saved_scroll)
+
+        # Active on a discarded page reloads it from the preserved navigation entry
+        view.page().setLifecycleState(Lifecycle.Active)
+
+        tabs = self.main_window.tabs
+        idx = tabs.indexOf(view)
+        if idx >= 0 and tabs.tabText(idx).startswith(HIBERNATED_MARK):
+            tabs.setTabText(idx, tabs.tabText(idx)[len(HIBERNATED_MARK):])
+        self.main_window.tab_updated(view)
+
+    def report(self, count):
+        freed = 0
+        if psutil is not None:
+            live_pids = {v.page().renderProcessPid() for v in self.views() if not self.is_hibernated(v)}
+            for pid, rss in list(self.pending_pids.items()):
+                # Renderers are shared per site; only count processes that actually went away
+                if pid not in live_pids and not psutil.pid_exists(pid):
+                    freed += rss
+                    del self.pending_pids[pid]
+        self.freed_bytes += freed
+        hibernated = sum(1 for v in self.views() if self.is_hibernated(v))
+        msg = f"💤 Hibernated {count} tab(s) ({hibernated} sleeping)"
+        if freed:
+            msg += f", freed ~{freed / (1024 * 1024):.0f} MB"
+        self.main_window.status_bar.showMessage(msg, 5000)
@@ -2,22 +2,50 @@ import sys
 import os
 import json
 import time
-import urllib.request
 import random
+import queue
+import atexit
 import logging
+import logging.handlers
 from datetime import datetime
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QTabWidget, 
                              QToolBar, QStatusBar, QWidget, QStyle, QLineEdit, QProgressBar,
-                             QSizePolicy, QMenu)
+                             QSizePolicy, QMenu, QCompleter, QLabel)
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import (QWebEngineProfile, QWebEnginePage, 
-                                   QWebEngineSettings, QWebEngineScript)
-from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut, QColor
+                                   QWebEngineSettings)
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut, QColor, QStandardItemModel, QStandardItem
 from PyQt6.QtCore import QUrl, QTimer, QSize, QThread, pyqtSignal, Qt
 
+from src.fetcher import HNFetcher, TokenBucket
+from src.item_cache import ItemCache
+from src.curated_store import CuratedStore
+from src.curator import CuratorEngine
+from src.hibernation import TabHibernator, HIBERNATED_MARK
+from src.preloader import TabPreloader
+from src.session_store import atomic_write_json, read_json_with_backups
+from src.prefetch import CommentPrefetcher, item_id_from_url, HN_HOST, HN_ITEM_URL
+from src.reader import ReaderSession
+from src.tab_registry import TabRegistry
+from src.tab_lifecycle import TabLifecycle
+from src.tab_panel import TabPanel
+from src.ui_updates import UiUpdateScheduler
+from src.preconnect import Preconnector
+from src.navigator import navigator_script, attach_navigator
+from src.startup import StartupProfiler
+from src.load_metrics import LoadMetrics, PerfPanel
+from src.load_scheduler import LoadScheduler, PRIORITY_FOREGROUND, PRIORITY_BACKGROUND
+from src.offline_archive import OfflineArchive, HTML
+from src.offline_saver import OfflineSaver
+from src.search_index import SearchIndex
+from src.content_blocker import ContentBlocker
+from src.paths import APP_NAME, get_asset_path, get_data_path
+from src.settings import load_settings
+from src.io_executor import IOExecutor, DISK, SEARCH
+from src.watchdog import StallWatchdog
+
 # --- CONFIGURATION ---
-APP_NAME = "HN Station"
 HOME_URL = "https://news.ycombinator.com/"
 PROFILE_NAME = "HN_Profile"
 
@@ -45,108 +73,69 @@ GROUP_COLORS = [
     QColor("#8D6E63"), # Light Brown
 ]
 
-# --- HELPER FUNCTIONS ---
-def get_base_path():
-    if getattr(sys, 'frozen', False):
-        return sys._MEIPASS
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-def get_user_data_path():
-    base_path = os.getenv('LOCALAPPDATA') 
-    app_path = os.path.join(base_path, APP_NAME)
-    if not os.path.exists(app_path):
-        os.makedirs(app_path)
-    return app_path
-
-def get_asset_path(filename):
-    return os.path.join(get_base_path(), "assets", filename)
-
-def get_data_path(filename):
-    return os.path.join(get_user_data_path(), filename)
+# --- SESSION ---
+SESSION_BACKUPS = 2        # session.json.1 .. .N
+SESSION_SAVE_DELAY = 1500  # ms of quiet after the last tab change before writing
+MAX_SAVED_HISTORY = 20     # history entries kept per tab
+READER_JOIN_TIMEOUT = 2    # s to wait on exit for each reader walk to finish its batch
 
 # --- LOGGING SETUP ---
+LOG_LISTENER = None
+
 def setup_logging():
+    # Callers only enqueue records; a listener thread does the file and console writes
+    global LOG_LISTENER
+    if LOG_LISTENER:
+        return LOG_LISTENER
     log_file = get_data_path("app.log")
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file, mode='a', encoding='utf-8'), logging.StreamHandler(sys.stdout)]
+    for h in handlers:
+        h.setFormatter(formatter)
+    records = queue.SimpleQueue()
+    LOG_LISTENER = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    LOG_LISTENER.start()
+    atexit.register(LOG_LISTENER.stop) # Flushes whatever is still queued at exit
+    enqueue = logging.handlers.QueueHandler(records)
+    enqueue.setFormatter(logging.Formatter('%(message)s')) # Full format is applied by the listener's handlers
+    logging.basicConfig(level=logging.INFO, handlers=[enqueue])
     sys.stderr = open(log_file, 'a')
+    return LOG_LISTENER
 
 # --- SMART CURATOR THREAD (DISABLED FOR NOW) ---
+# The engine lives in src/curator.py so it can also run headless: python main.py curate [--daemon]
 class HNCurator(QThread):
     status_update = pyqtSignal(str, bool)
 
-    def __init__(self, data_path, keywords):
+    def __init__(self, data_path, keywords, incremental=False, feeds=("top",), per_feed=60):
         super().__init__()
-        self.data_path = data_path
-        self.keywords = [k.lower() for k in keywords]
-        self.seen_ids = set()
-
-    def fetch_with_retry(self, url, retries=3):
-        for i in range(retries):
-            try:
-                with urllib.request.urlopen(url, timeout=10) as response:
-                    return json.loads(response.read().decode())
-            except Exception as e:
-                if i == retries - 1: 
-                    logging.warning(f"Failed to fetch {url} after {retries} attempts: {e}")
-                    raise e
-                time.sleep(1 * (i + 1))
-        return None
+        self.engine = CuratorEngine(data_path, keywords, incremental, feeds, per_feed)
 
     def run(self):
         try:
-            curated_file = os.path.join(self.data_path, "my_hn_links.json")
-            existing_data = []
-            if os.path.exists(curated_file):
-                with open(curated_file, 'r') as f:
-                    existing_data = json.load(f)
-                    self.seen_ids = {item['id'] for item in existing_data}
-
-            url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            top_ids = self.fetch_with_retry(url)[:60]
-
-            new_finds = []
-            for hn_id in top_ids:
-                if hn_id in self.seen_ids: continue
-                
-                item_url = f"https://hacker-news.firebaseio.com/v0/item/{hn_id}.json"
-                try:
-                    story = self.fetch_with_retry(item_url)
-                except:
-                    continue
-
-                if not story: continue
-                
-                title = story.get('title', '').lower()
-                matched_keyword = next((k for k in self.keywords if k in title), None)
-                if matched_keyword:
-                    entry = {
-                        "id": hn_id,
-                        "title": story.get('title'),
-                        "url": story.get('url', f"https://news.ycombinator.com/item?id={hn_id}"),
-                        "matched": matched_keyword,
-                        "found_at": datetime.now().isoformat()
-                    }
-                    new_finds.append(entry)
-                    self.seen_ids.add(hn_id)
-                
-                # FIX: 0.5s Delay to prevent 429 Throttling
-                time.sleep(0.5) 
-
-            if new_finds:
-                updated_data = new_finds + existing_data
-                with open(curated_file, 'w') as f:
-                    json.dump(updated_data, f, indent=2)
-                self.status_update.emit(f"🍊 Curator found {len(new_finds)} new stories!", False)
+            added = self.engine.run_once()
+            if added:
+                self.status_update.emit(f"🍊 Curator found {added} new stories!", False)
         except Exception as e:
             logging.error(f"Curator Error: {e}")
 
+# --- TAB LABELS ---
+def classify_url(qurl):
+    host = qurl.host()
+    if "ycombinator.com" in host and "item" in qurl.toString():
+        return "💬"
+    elif "ycombinator.com" in host:
+        return "HN"
+    elif not host:
+        return "⏳"
+    return "📄"
+
+def tab_label(content_type, title):
+    if content_type in ("💬", "HN"):
+        return content_type
+    short_title = title[:20] + ".." if len(title) > 20 else title
+    return f"{content_type} {short_title}"
+
 # --- CUSTOM PAGE & VIEW ---
 class HNPage(QWebEnginePage):
     def __init__(self, profile, main_window):
@@ -164,7 +153,79 @@ class HNView(QWebEngineView):
         self.main_window = main_window
         self.group_color = QColor("#000000")
         self.content_type = ""
-        self.retries = 0 # Safety counter for auto-retry
+        self.retries = 0 # Total auto-retries (LoadScheduler)
+        self.hibernated = False
+        self.last_active = time.monotonic()
+        self.pending_url = None # Placeholder tabs (lazy session restore) load this on first activation
+        self.queued_url = None # Submitted to the LoadScheduler, waiting for a host slot
+        self.archived_url = None # Showing the offline copy of this URL
+        self.indexed_url = None # Last URL added to the search index
+        self.saved_title = ""
+        self.saved_scroll = (0, 0)
+        self.restored_back = [] # Back entries from a restored session; Chromium's own history starts empty
+        self.disposed = False # Closed: the C++ side is deleted, only stale Python references remain
+        self.navigator = None # NavigatorBridge: the in-page navigator's link back to this tab
+
+    def page_url(self):
+        url = self.pending_url or self.queued_url or self.archived_url
+        return QUrl(url) if url else self.url()
+
+    def page_title(self):
+        return self.title() or self.saved_title
+
+    def page_scroll(self):
+        if self.pending_url or self.queued_url or self.hibernated:
+            return self.saved_scroll
+        pos = self.page().scrollPosition()
+        return (round(pos.x()), round(pos.y()))
+
+    def history_state(self):
+        entries = list(self.restored_back)
+        if self.pending_url or self.queued_url:
+            entries.append({"url": self.pending_url or self.queued_url, "title": self.saved_title})
+            return {"entries": entries, "index": len(entries) - 1}
+        h = self.history()
+        entries += [{"url": it.url().toString(), "title": it.title()} for it in h.items()]
+        return {"entries": entries[-MAX_SAVED_HISTORY:],
+                "index": max(0, min(len(entries), MAX_SAVED_HISTORY) - (h.count() - h.currentItemIndex()))}
+
+    def restore_state(self, state):
+        self.saved_scroll = tuple(state.get("scroll") or (0, 0))
+        history = state.get("history") or {}
+        self.restored_back = history.get("entries", [])[:history.get("index", 0)]
+
+    def ensure_loaded(self, priority=PRIORITY_FOREGROUND):
+        if self.pending_url:
+            url, self.pending_url = self.pending_url, None
+            if self.saved_scroll != (0, 0):
+                self.restore_scroll_after_load(*self.saved_scroll)
+            if not self.main_window.open_offline(self, url):
+                self.main_window.scheduler.submit(self, url, priority)
+        elif self.queued_url and priority < PRIORITY_BACKGROUND:
+            # Activated while still waiting in the queue: jump it
+            self.main_window.scheduler.submit(self, self.queued_url, priority)
+
+    def restore_scroll_after_load(self, x, y):
+        page = self.page()
+        def restore_scroll(ok):
+            page.loadFinished.disconnect(restore_scroll)
+            if ok:
+                page.runJavaScript(f"window.scrollTo({x}, {y});")
+        page.loadFinished.connect(restore_scroll)
+
+    def go_back(self):
+        if self.history().canGoBack() or not self.restored_back:
+            self.back()
+            return
+        # Step into the restored session's history, then drop the live entry so
+        # the next Back continues down the restored list
+        entry = self.restored_back.pop()
+        page = self.page()
+        def prune(ok):
+            page.loadFinished.disconnect(prune)
+            self.history().clear()
+        page.loadFinished.connect(prune)
+        self.setUrl(QUrl(entry["url"]))
 
     def contextMenuEvent(self, event):
         menu = self.createStandardContextMenu()
@@ -175,6 +236,9 @@ class HNView(QWebEngineView):
 
         dual_action = QAction("Open Article & Comments", self)
         dual_action.triggered.connect(self.extract_and_open_dual)
+
+        reader_action = QAction("Open Comments in Reader", self)
+        reader_action.triggered.connect(self.extract_and_open_reader)
         
         open_action = QAction("Open Link in New Tab", self)
         open_action.triggered.connect(self.extract_and_open)
@@ -186,57 +250,37 @@ class HNView(QWebEngineView):
         if first:
             if is_hn_list:
                 menu.insertAction(first, dual_action)
+            if "news.ycombinator.com" in current_url:
+                menu.insertAction(first, reader_action)
             
             menu.insertAction(first, open_action)
             menu.insertAction(first, copy_action)
             menu.insertSeparator(first)
         menu.exec(event.globalPos())
 
-    def get_hovered_url_js(self):
-        return """
-        (function() {
-            var path = window._lastClickPath;
-            if (!path || path.length === 0) return "";
-            for (var i = 0; i < Math.min(path.length, 5); i++) {
-                var el = path[i];
-                if (el.tagName === 'A' && el.href) return el.href;
-            }
-            return "";
-        })();
-        """
-
-    def get_dual_urls_js(self):
-        return """
-        (function() {
-            var path = window._lastClickPath;
-            if (!path) return null;
-            var anchor = null;
-            for (var i = 0; i < Math.min(path.length, 5); i++) {
-                if (path[i].tagName === 'A' && path[i].href) { anchor = path[i]; break; }
-            }
-            if (!anchor) return null;
-            var row = anchor.closest('.athing');
-            if (row && row.id) {
-                return {
-                    article: anchor.href,
-                    comments: "https://news.ycombinator.com/item?id=" + row.id
-                };
-            }
-            return null;
-        })();
-        """
-    
     def extract_and_open(self):
-        self.page().runJavaScript(self.get_hovered_url_js(), self.handle_open)
+        self.handle_open(self.navigator.context.get("link"))
 
     def extract_and_open_dual(self):
-        self.page().runJavaScript(self.get_dual_urls_js(), self.handle_dual_open)
+        context = self.navigator.context
+        self.handle_dual_open(context if context.get("comments") else None)
+
+    def extract_and_open_reader(self):
+        self.handle_reader_open(self.navigator.context)
 
     def extract_and_copy(self):
-        self.page().runJavaScript(self.get_hovered_url_js(), lambda u: QApplication.clipboard().setText(u) if u else None)
+        link = self.navigator.context.get("link")
+        if link: QApplication.clipboard().setText(link)
 
     def handle_open(self, url):
-        if url: self.main_window.add_new_tab(url)
+        if url and not self.main_window.focus_existing(url): self.main_window.add_new_tab(url)
+
+    def handle_reader_open(self, data):
+        # Story row under the pointer, else the thread we're on
+        url = data.get('comments') if isinstance(data, dict) else None
+        if not url and item_id_from_url(self.url().toString()):
+            url = self.url().toString()
+        if url and not self.main_window.focus_existing(url): self.main_window.add_new_tab(url, reader=True)
 
     def handle_dual_open(self, data):
         if data and isinstance(data, dict):
@@ -244,13 +288,26 @@ class HNView(QWebEngineView):
 
 # --- MAIN WINDOW ---
 class HNBrowser(QMainWindow):
-    def __init__(self):
+    def __init__(self, profiler=None, quit_after_startup=False, debug=False):
         super().__init__()
+        self.profiler = profiler or StartupProfiler()
+        self.quit_after_startup = quit_after_startup # Benchmark runs exit once startup is recorded
         self.setWindowTitle(APP_NAME)
         self.resize(1200, 800)
         
         setup_logging()
+        if debug: logging.getLogger().setLevel(logging.DEBUG)
         logging.info("Starting HN Station...")
+        self.app_settings = load_settings()
+
+        # --- BACKGROUND I/O ---
+        # Disk and network work runs here; results come back on the GUI thread
+        self.io = IOExecutor(self)
+        self.saved_session = None # Read while the window is being built; post_init_setup waits for it
+        self.startup_waiting = False
+        self.io.submit(DISK, self.read_session, on_done=self.on_session_read)
+        self.watchdog = StallWatchdog(self, threshold_ms=self.app_settings["stall_warn_ms"],
+                                      log_path=get_data_path("perf.log"))
 
         self.color_index = 0
         
@@ -263,6 +320,41 @@ class HNBrowser(QMainWindow):
         self.profile.setPersistentStoragePath(profile_path)
         self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies)
         self.inject_scripts()
+        # Ad/tracker filtering for every tab; the list compiles (or loads from cache) in the background
+        self.blocker = ContentBlocker(self)
+        if self.app_settings["content_blocking"]:
+            self.blocker.load([get_asset_path("filters.txt"), get_data_path("filters.txt")], get_data_path("filters.cache"))
+            self.profile.setUrlRequestInterceptor(self.blocker)
+        self.profiler.mark("profile")
+
+        # Background HN traffic (prefetching) shares one politeness budget
+        self.hn_budget = TokenBucket(rate=self.app_settings["hn_requests_per_second"], burst=2)
+        self.prefetcher = CommentPrefetcher(self.profile, self.hn_budget)
+        # Tab navigations: per-host slots, backoff on failure; an HN 429 also pauses the prefetcher
+        self.scheduler = LoadScheduler(self, host_limits={HN_HOST: self.app_settings["hn_concurrent_loads"]},
+                                       max_retries=self.app_settings["load_retries"], hn_bucket=self.hn_budget)
+        # Reader mode talks to the Firebase API, not the HN website, so it has its own budget
+        self.api_fetcher = HNFetcher()
+        self.item_cache = None # Opened by start_background_services()
+        # Finds written by a headless curator (python main.py curate) sharing this data folder
+        self.curated = CuratedStore(get_data_path("curated.db"))
+        self.curated_seen = None
+        self.curated_timer = QTimer(self)
+        self.curated_timer.setInterval(60000)
+        self.curated_timer.timeout.connect(self.check_curated_finds)
+
+        # --- LOAD METRICS ---
+        self.debug = debug
+        self.load_metrics = LoadMetrics(self, debug=debug)
+        # Speculative connection warm-up for story links; load timings tell how much it saves
+        self.preconnector = Preconnector(self, max_warm=self.app_settings["preconnect_max_hosts"])
+        self.load_metrics.timed.connect(self.preconnector.observe)
+        self.perf_panel = None
+        if debug:
+            self.metrics_dump_timer = QTimer(self)
+            self.metrics_dump_timer.timeout.connect(lambda: logging.debug(self.load_metrics.dump()))
+            self.metrics_dump_timer.start(60000)
+        self.services_started = False
 
         self.tabs = QTabWidget()
         self.tabs.setDocumentMode(True)
@@ -273,6 +365,8 @@ class HNBrowser(QMainWindow):
         self.tabs.setUsesScrollButtons(False)
         self.tabs.tabBar().setElideMode(Qt.TextElideMode.ElideRight)
         
+        self.registry = TabRegistry(self.tabs)
+        self.lifecycle = TabLifecycle(self)
         self.tabs.tabCloseRequested.connect(self.close_tab)
         self.tabs.currentChanged.connect(self.handle_tab_change)
         
@@ -281,20 +375,88 @@ class HNBrowser(QMainWindow):
         
         self.setCentralWidget(self.tabs)
 
+        # --- VERTICAL TABS ---
+        # Optional tree of tabs grouped by thread; replaces the tab bar, which doesn't scale past a few dozen tabs
+        self.tab_panel = None
+        if self.app_settings["vertical_tabs"]:
+            self.tab_panel = TabPanel(self, lambda v: tab_label(v.content_type, v.page_title()))
+            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.tab_panel)
+            self.tabs.tabBar().hide()
+            self.tabs.setTabsClosable(False) # Per-tab close buttons are most of the cost of adding a tab
+            self.tabs.currentChanged.connect(lambda i: self.tab_panel.select(self.tabs.widget(i)))
+            self.tabs.tabBar().tabMoved.connect(self.tab_moved)
+
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximumWidth(120)
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
+        self.background_loads_label = QLabel()
+        self.background_loads_label.setVisible(False)
+        self.status_bar.addPermanentWidget(self.background_loads_label)
+        # Title / URL / progress signals from every tab are applied at most once per frame
+        self.ui_updates = UiUpdateScheduler(self, self.progress_bar, self.background_loads_label)
+        # Blocked requests on the current tab; bursts of blocks repaint it at most every 250 ms
+        self.block_label = QLabel()
+        self.status_bar.addPermanentWidget(self.block_label)
+        self.block_timer = QTimer(self)
+        self.block_timer.setSingleShot(True)
+        self.block_timer.setInterval(250)
+        self.block_timer.timeout.connect(self.update_block_label)
+        self.blocker.blocked.connect(self.on_request_blocked)
+        self.scheduler.retrying.connect(
+            lambda v, delay, n: self.status_bar.showMessage(f"Load failed. Retrying in {delay:.0f}s... ({n}/{self.scheduler.max_retries})", 5000))
+        self.scheduler.gave_up.connect(lambda v, reason: self.status_bar.showMessage(f"Load failed: {reason}", 8000))
+
+        # --- OFFLINE ARCHIVE ---
+        self.archive = OfflineArchive(get_data_path("offline"),
+                                      max_bytes=self.app_settings["offline_archive_mb"] * 1024 * 1024)
+        self.offline_saver = OfflineSaver(self.profile, self.archive, self.io, self)
+        self.offline_saver.saved.connect(lambda url, title, raw, stored: self.status_bar.showMessage(
+            f"📦 Saved for offline: {title or url} ({raw // 1024} KB -> {stored // 1024} KB)", 5000))
+        self.offline_saver.failed.connect(lambda url, reason: self.status_bar.showMessage(f"Offline save failed: {reason}", 8000))
+
+        # --- LOCAL SEARCH ---
+        self.search_index = SearchIndex(get_data_path("search.db"))
 
         self.setup_toolbar()
         self.setup_shortcuts()
 
-        QTimer.singleShot(100, self.post_init_setup)
-        self.save_timer = QTimer()
+        self.hibernator = TabHibernator(self,
+                                        idle_minutes=self.app_settings["hibernate_after_minutes"],
+                                        max_live_tabs=self.app_settings["max_live_tabs"])
+        # Never preload more tabs than the hibernator would keep awake
+        preload_limit = self.app_settings["restore_preload_tabs"]
+        if self.app_settings["max_live_tabs"]:
+            preload_limit = min(preload_limit, self.app_settings["max_live_tabs"] - 1)
+        self.preloader = TabPreloader(self, concurrency=self.app_settings["restore_preload_concurrency"],
+                                      limit=preload_limit)
+        self.restoring = False
+
+        # --- FAST LAUNCH ---
+        # post_init_setup runs right after the first paint; this timer only covers a window that never paints
+        self.started = False
+        QTimer.singleShot(500, self.post_init_setup)
+        # --- SESSION PERSISTENCE (dirty-tracked + debounced) ---
+        self.last_session_text = None
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SESSION_SAVE_DELAY)
         self.save_timer.timeout.connect(self.save_session)
-        self.save_timer.start(5000)
+        # Scroll offsets don't emit signals; re-check occasionally (no write unless something changed)
+        self.scroll_check_timer = QTimer(self)
+        self.scroll_check_timer.timeout.connect(self.mark_session_dirty)
+        self.scroll_check_timer.start(30000)
+        self.tabs.currentChanged.connect(self.mark_session_dirty)
+        self.tabs.tabBar().tabMoved.connect(self.mark_session_dirty)
+        self.profiler.mark("window_init")
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.started:
+            self.profiler.mark("first_paint")
+            QTimer.singleShot(0, self.post_init_setup)
 
     def get_next_group_color(self):
         color = GROUP_COLORS[self.color_index % len(GROUP_COLORS)]
@@ -341,7 +503,7 @@ class HNBrowser(QMainWindow):
         """)
         
         style = self.style()
-        toolbar.addAction(QAction(style.standardIcon(QStyle.StandardPixmap.SP_ArrowBack), "Back", self, triggered=lambda: self.tabs.currentWidget().back()))
+        toolbar.addAction(QAction(style.standardIcon(QStyle.StandardPixmap.SP_ArrowBack), "Back", self, triggered=lambda: self.tabs.currentWidget().go_back()))
         toolbar.addAction(QAction(style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload), "Ref", self, triggered=lambda: self.tabs.currentWidget().reload()))
         toolbar.addAction(QAction(style.standardIcon(QStyle.StandardPixmap.SP_DirHomeIcon), "Home", self, triggered=lambda: self.tabs.currentWidget().setUrl(QUrl(HOME_URL))))
         
@@ -350,45 +512,236 @@ class HNBrowser(QMainWindow):
         self.urlbar.returnPressed.connect(self.navigate)
         self.urlbar.setMinimumWidth(300)
         toolbar.addWidget(self.urlbar)
+        self.setup_url_completer()
+
+    def setup_url_completer(self):
+        # Suggestions from the local search index: "title — url" shown, the URL inserted
+        self.suggestions = QStandardItemModel(self)
+        completer = QCompleter(self.suggestions, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCompletionRole(Qt.ItemDataRole.UserRole)
+        completer.activated.connect(lambda url: self.urlbar.setText(url) or self.navigate())
+        self.urlbar.setCompleter(completer)
+        self.suggest_query = ""
+
+        # Typing fast only queries once the keys pause
+        self.suggest_timer = QTimer(self)
+        self.suggest_timer.setSingleShot(True)
+        self.suggest_timer.setInterval(60)
+        self.suggest_timer.timeout.connect(self.update_suggestions)
+        self.urlbar.textEdited.connect(lambda _: self.suggest_timer.start())
+
+    def update_suggestions(self):
+        # The query runs on the search lane; results only land if the text they were for is still there
+        text = self.urlbar.text().strip()
+        self.suggest_query = text
+        if len(text) < 2 or "://" in text:
+            self.suggestions.clear()
+            return
+
+        def query():
+            if self.suggest_query != text:
+                return None # Superseded while queued
+            return self.search_index.search(text)
+
+        def show(results):
+            if results is None or self.suggest_query != text or self.urlbar.text().strip() != text:
+                return
+            self.suggestions.clear()
+            for r in results:
+                item = QStandardItem(f"{r['title'] or r['url']} — {r['url']}")
+                item.setData(r["url"], Qt.ItemDataRole.UserRole)
+                self.suggestions.appendRow(item)
+            if self.suggestions.rowCount():
+                self.urlbar.completer().complete()
+
+        self.io.submit(SEARCH, query, on_done=show)
 
     def setup_shortcuts(self):
         QShortcut(QKeySequence("Ctrl+L"), self, lambda: self.urlbar.setFocus() or self.urlbar.selectAll())
         QShortcut(QKeySequence("Ctrl+T"), self, self.open_new_tab)
         QShortcut(QKeySequence("Ctrl+W"), self, lambda: self.close_tab(self.tabs.currentIndex()))
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.lifecycle.reopen)
         QShortcut(QKeySequence("Ctrl+R"), self, lambda: self.tabs.currentWidget().reload())
-        
-        self.scroll_j = QShortcut(QKeySequence("J"), self)
-        self.scroll_j.activated.connect(lambda: self.run_js("window.scrollBy({top: 100, behavior: 'smooth'});"))
-        self.scroll_k = QShortcut(QKeySequence("K"), self)
-        self.scroll_k.activated.connect(lambda: self.run_js("window.scrollBy({top: -100, behavior: 'smooth'});"))
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, self.show_perf_panel)
+        QShortcut(QKeySequence("Ctrl+S"), self, lambda: self.save_for_offline(self.tabs.currentWidget()))
 
-    def run_js(self, code):
-        if self.tabs.currentWidget():
-            self.tabs.currentWidget().page().runJavaScript(code)
+        # j / k / o / c / x are handled inside the page by the navigator (src/navigator.py)
+
+    # --- OFFLINE ARCHIVE ---
+    def open_offline(self, view, url):
+        """Load url from the offline archive if it was saved, else live. Returns False if there's no archive at all.
+
+        The lookup runs on the disk lane with the read, so opening a tab never
+        queries SQLite on the GUI thread; the tab keeps its URL meanwhile.
+        """
+        if not self.archive.exists():
+            return False
+        view.archived_url = url
+
+        def read():
+            row = self.archive.find(url)
+            if not row:
+                return None
+            path = self.archive.open_path(url)
+            if not path:
+                raise FileNotFoundError(f"offline copy of {url} is gone")
+            if row["mime"] != HTML:
+                return row, path, None
+            with open(path, "r", encoding="utf-8") as f:
+                return row, path, f.read()
+
+        def show(result):
+            if not self.is_open(view) or view.archived_url != url:
+                return # Closed or navigated elsewhere meanwhile
+            if result is None:
+                load_live(None)
+                return
+            row, path, html = result
+            if html is not None:
+                view.archived_url = None
+                view.setHtml(html, QUrl(url)) # Real base URL keeps links and reloads live
+            else:
+                view.setUrl(QUrl.fromLocalFile(path))
+            saved = datetime.fromtimestamp(row["saved_at"]).strftime("%Y-%m-%d %H:%M")
+            self.status_bar.showMessage(f"📦 Offline copy saved {saved}", 4000)
+
+        def load_live(e):
+            if e is not None:
+                logging.error(f"Offline Open Error: {e}")
+            if self.is_open(view) and view.archived_url == url:
+                view.archived_url = None
+                self.scheduler.submit(view, url, PRIORITY_FOREGROUND if view is self.tabs.currentWidget() else PRIORITY_BACKGROUND)
+
+        self.io.submit(DISK, read, on_done=show, on_error=load_live)
+        return True
+
+    def story_item_id(self, url):
+        # Comments URL -> its id; article URL -> the HN story it was opened from (front-page scan)
+        return item_id_from_url(url) or self.prefetcher.story_links.get(url)
+
+    def save_for_offline(self, view):
+        """Snapshot the tab plus its article/comments partner (same group, same HN item)."""
+        if not view: return
+        url = view.page_url().toString()
+        item_id = self.story_item_id(url)
+        targets = [view]
+        if item_id:
+            targets += [w for w in self.registry.group(view.group_color.name())
+                        if w is not view and self.story_item_id(w.page_url().toString()) == item_id]
+        saving = 0
+        for w in targets:
+            if w.pending_url or w.queued_url or w.hibernated or w.archived_url:
+                continue # Nothing live to snapshot
+            self.offline_saver.snapshot(w, w.page_url().toString(), item_id)
+            saving += 1
+        # Comments not open in a tab but prefetched: archive those too
+        thread_url = HN_ITEM_URL.format(item_id) if item_id else None
+        if thread_url and not any(w.page_url().toString() == thread_url for w in targets):
+            html = self.prefetcher.peek(item_id)
+            if html:
+                self.offline_saver.store_html(thread_url, html, view.page_title(), item_id)
+                saving += 1
+        self.status_bar.showMessage(f"📦 Saving {saving} page(s) for offline..." if saving
+                                    else "Nothing to save: load the tab first", 3000)
+
+    def load_live(self, view):
+        url, view.archived_url = view.archived_url, None
+        if url: self.scheduler.submit(view, url, PRIORITY_FOREGROUND)
+
+    def show_perf_panel(self):
+        if self.perf_panel is None:
+            self.perf_panel = PerfPanel(self.load_metrics, self, watchdog=self.watchdog)
+        self.perf_panel.refresh()
+        self.perf_panel.show()
+        self.perf_panel.raise_()
 
     def inject_scripts(self):
-        s = QWebEngineScript()
-        s.setSourceCode("document.addEventListener('contextmenu', e => window._lastClickPath = e.composedPath(), true);")
-        s.setName("ClickTracker")
-        s.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
-        s.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
-        self.profile.scripts().insert(s)
+        s = navigator_script()
+        if s: self.profile.scripts().insert(s)
 
     def post_init_setup(self):
-        if not self.load_session():
+        # Fast launch: the Home tab goes first; the rest of the session and the
+        # background services follow once it is on screen
+        if self.started: return
+        if self.saved_session is None:
+            self.startup_waiting = True # on_session_read comes back here
+            return
+        self.started = True
+
+        saved = self.saved_session
+        home_pos = next((i for i, t in enumerate(saved) if classify_url(QUrl(t.get("url", ""))) == "HN"), None)
+        if home_pos is None:
             self.add_new_tab(HOME_URL)
-        
-        # FIX: Auto-Focus Home Tab after 5 seconds
-        QTimer.singleShot(5000, self.focus_home_tab)
+        else:
+            self.restore_tabs([saved[home_pos]])
+            self.focus_home_tab()
+        home = self.tabs.currentWidget()
+        self.profiler.mark("home_tab")
+
+        def report_ready(ok):
+            home.loadFinished.disconnect(report_ready)
+            self.profiler.mark("first_load_finished")
+            self.start_background_services(home_ok=ok)
+        home.loadFinished.connect(report_ready)
+        # A hung first load must not keep the rest of the app waiting
+        QTimer.singleShot(5000, self.start_background_services)
+
+        rest = [t for i, t in enumerate(saved) if i != home_pos]
+        QTimer.singleShot(0, lambda: self.restore_rest_of_session(rest, home, home_pos or 0))
+
+    def on_session_read(self, saved):
+        self.saved_session = saved
+        if self.startup_waiting:
+            self.post_init_setup()
+
+    def restore_rest_of_session(self, rest, home, home_pos):
+        self.restore_tabs(rest)
+        # Put Home back where it was saved without switching away from it
+        idx = self.tabs.indexOf(home)
+        if 0 <= idx != home_pos and home_pos < self.tabs.count():
+            self.restoring = True
+            self.tabs.tabBar().moveTab(idx, home_pos)
+            self.restoring = False
+        self.profiler.mark("session_restored")
+        self.preloader.schedule([self.tabs.widget(i) for i in range(self.tabs.count()) if self.tabs.widget(i) is not home])
+
+    def start_background_services(self, home_ok=None):
+        # Everything not needed to show the first page: cookie dump + prefetch workers, item cache
+        if self.services_started: return
+        self.services_started = True
+        self.prefetcher.start()
+        self.item_cache = ItemCache(get_data_path("item_cache.db"))
+        self.curated_timer.start()
+        self.check_curated_finds()
+        if self.watchdog.threshold_ms:
+            self.watchdog.start()
+        self.profiler.mark("services")
+        logging.info(f"Startup: {self.profiler.summary()} ({self.tabs.count()} tabs open)")
+        self.profiler.write(get_data_path("startup_profile.jsonl"), tabs=self.tabs.count(), home_ok=home_ok)
+        if self.quit_after_startup:
+            QTimer.singleShot(0, self.close)
+
+    def check_curated_finds(self):
+        def count():
+            # No curator has run yet: don't create the store
+            return self.curated.count() if os.path.exists(get_data_path("curated.db")) else None
+        self.io.submit(DISK, count, on_done=self.on_curated_count)
+
+    def on_curated_count(self, count):
+        if count is None:
+            return
+        if self.curated_seen is not None and count > self.curated_seen:
+            self.status_bar.showMessage(f"🍊 Curator found {count - self.curated_seen} new stories!", 8000)
+        self.curated_seen = count
 
     def focus_home_tab(self):
-        # 1. Search for existing Home tab
-        for i in range(self.tabs.count()):
-            w = self.tabs.widget(i)
-            url = w.url().toString()
-            if "news.ycombinator.com" in url and "item?id=" not in url:
-                self.tabs.setCurrentIndex(i)
-                return
+        # 1. Existing Home tab
+        home = self.registry.home_view()
+        if home:
+            self.tabs.setCurrentWidget(home)
+            home.ensure_loaded()
+            return
         
         # 2. If not found, open a fresh one
         self.add_new_tab(HOME_URL)
@@ -411,11 +764,22 @@ class HNBrowser(QMainWindow):
         
         # 1. Open Article (Immediate + Focus)
         self.add_new_tab(article_url, forced_color=new_color, force_append=True, focus=True)
+        if self.registry.find_url(comments_url) or self.registry.find_item(item_id_from_url(comments_url)):
+            return # Thread already open; the article tab is enough
         
-        # 2. Open Comments (Delayed 1.5s + Background)
-        QTimer.singleShot(1500, lambda: self.add_new_tab(comments_url, forced_color=new_color, force_append=False, focus=False))
-
-    def add_new_tab(self, url=None, title="New Tab", forced_color=None, restored_color=None, force_append=False, focus=True):
+        # 2. Open Comments in the background: instantly if prefetched, else queued for an HN slot
+        self.add_new_tab(comments_url, forced_color=new_color, force_append=False, focus=False)
+
+    def focus_existing(self, url):
+        # An already-open thread is focused instead of opened twice
+        item_id = item_id_from_url(url)
+        view = self.registry.find_item(item_id) if item_id else self.registry.find_url(url)
+        if view:
+            self.tabs.setCurrentWidget(view)
+        return view
+
+    def add_new_tab(self, url=None, title="New Tab", forced_color=None, restored_color=None, force_append=False, focus=True,
+                    lazy=False, content_type="", restored_state=None, reader=None):
         browser = HNView(self)
         browser.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
@@ -452,82 +816,159 @@ class HNBrowser(QMainWindow):
         browser.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
         page.permissionRequested.connect(lambda p: p.grant())
         page.linkHovered.connect(self.status_bar.showMessage)
+        page.linkHovered.connect(self.prefetcher.prefetch_url)
+        page.linkHovered.connect(lambda url: self.preconnector.hover(page, url))
         browser.setPage(page)
+        browser.navigator = attach_navigator(browser, page)
+        self.load_metrics.watch(browser)
+        self.scheduler.watch(browser)
         
-        if url: browser.setUrl(QUrl(url))
+        if url and lazy:
+            # Placeholder: no navigation (and so no renderer) until the tab is activated or preloaded
+            browser.pending_url = url
+            browser.saved_title = title if title != "New Tab" else QUrl(url).host()
+            browser.content_type = content_type or classify_url(QUrl(url))
+            if restored_state:
+                browser.restore_state(restored_state)
+        elif url:
+            browser.content_type = classify_url(QUrl(url))
+            item_id = item_id_from_url(url)
+            use_reader = self.app_settings["reader_mode"] if reader is None else reader
+            warm_html = None if use_reader else self.prefetcher.take(item_id)
+            if item_id and use_reader:
+                self.start_background_services()
+                browser.reader = ReaderSession(browser, item_id, self.api_fetcher, self.item_cache)
+            elif warm_html:
+                # Prefetched comment page: render from memory, baseUrl keeps links and reloads real
+                browser.setHtml(warm_html, QUrl(url))
+                self.status_bar.showMessage("⚡ Comments loaded from prefetch", 2000)
+            elif self.open_offline(browser, url):
+                pass
+            else:
+                browser.queued_url = url # Submitted once the tab exists
         
         # --- STUCK LOADING FAILSAFE ---
         def force_title_update():
+            if not self.is_open(browser): return
             if browser.title() in ["", "New Tab"] and browser.url().toString():
                 host = browser.url().host()
                 if host:
-                     update_tab_visuals(browser.url())
+                     self.ui_updates.mark(browser)
 
         QTimer.singleShot(3000, force_title_update)
 
-        # --- SAFE AUTO-RETRY LOGIC ---
+        # Failed loads are retried by the LoadScheduler (per-host backoff)
         def handle_load_finished(success):
-            self.progress_bar.setVisible(False)
-            if not success and browser.retries < 1:
-                # If failed (e.g. 429), wait 2s and try ONCE more
-                browser.retries += 1
-                self.status_bar.showMessage(f"Load failed. Retrying in 2s... ({browser.retries}/1)")
-                QTimer.singleShot(2000, browser.reload)
-
-        browser.loadProgress.connect(self.progress_bar.setValue)
-        browser.loadStarted.connect(lambda: self.progress_bar.setVisible(True))
+            self.ui_updates.load_finished(browser)
+            if success and browser.content_type == "HN":
+                self.prefetch_front_page(browser)
+            elif success and browser.content_type == "📄" and self.app_settings["index_article_text"]:
+                self.index_article_text(browser)
+
+        browser.loadProgress.connect(lambda p: self.ui_updates.load_progress(browser, p))
+        browser.loadStarted.connect(lambda: self.ui_updates.load_started(browser))
         browser.loadFinished.connect(handle_load_finished)
 
-        def update_tab_visuals(qurl):
-            if browser == self.tabs.currentWidget():
-                self.urlbar.setText(qurl.toString())
-            
-            host = qurl.host()
-            if "ycombinator.com" in host and "item" in qurl.toString():
-                browser.content_type = "💬"
-            elif "ycombinator.com" in host:
-                browser.content_type = "HN" 
-            elif not host:
-                browser.content_type = "⏳"
-            else:
-                browser.content_type = "📄"
-            
-            title = browser.title()
-            if not title: title = host if host else "Loading..."
-            short_title = title[:20] + ".." if len(title) > 20 else title
-            
-            idx = self.tabs.indexOf(browser)
-            if idx >= 0:
-                self.tabs.setTabToolTip(idx, title) 
-                
-                if browser.content_type == "💬":
-                    self.tabs.setTabText(idx, "💬")
-                elif browser.content_type == "HN":
-                    self.tabs.setTabText(idx, "HN")
-                else:
-                    self.tabs.setTabText(idx, f"{browser.content_type} {short_title}")
-                
-                self.tabs.tabBar().setTabTextColor(idx, browser.group_color)
-
-        browser.urlChanged.connect(update_tab_visuals)
-        browser.titleChanged.connect(lambda t: update_tab_visuals(browser.url()))
+        browser.urlChanged.connect(lambda _: self.ui_updates.mark(browser))
+        browser.titleChanged.connect(lambda _: self.ui_updates.mark(browser))
+        browser.urlChanged.connect(self.mark_session_dirty)
+        browser.titleChanged.connect(self.mark_session_dirty)
 
         if insert_mode == "APPEND":
             i = self.tabs.addTab(browser, "New Tab")
         else:
             i = self.tabs.insertTab(current_index + 1, browser, "New Tab")
+        if self.tab_panel:
+            # Restores add tabs by the dozen: one regroup at the end instead of a row insert each
+            if self.restoring: self.tab_panel.model.schedule_rebuild()
+            else: self.tab_panel.model.tab_added(browser)
             
+        if browser.pending_url and not self.tab_panel:
+            self.tabs.setTabText(i, tab_label(browser.content_type, browser.saved_title))
+            self.tabs.setTabToolTip(i, browser.saved_title)
+
         if focus:
             self.tabs.setCurrentIndex(i)
             
         self.tabs.tabBar().setTabTextColor(i, browser.group_color)
+        self.registry.register(browser)
+        if browser.queued_url:
+            self.scheduler.submit(browser, browser.queued_url, PRIORITY_FOREGROUND if focus else PRIORITY_BACKGROUND)
+        self.mark_session_dirty()
         return page
 
+    def apply_tab_visuals(self, browser):
+        # Called by UiUpdateScheduler with the batch of tabs whose URL or title changed this frame
+        qurl = browser.url()
+        if browser == self.tabs.currentWidget():
+            self.urlbar.setText(qurl.toString())
+
+        if browser.archived_url and not qurl.isLocalFile():
+            browser.archived_url = None # Followed a link out of the offline copy
+        host = qurl.host()
+        browser.content_type = classify_url(browser.page_url())
+
+        title = browser.title()
+        if not title: title = host if host else "Loading..."
+
+        idx = self.tabs.indexOf(browser)
+        if idx >= 0 and not self.tab_panel: # The hidden tab bar would still relayout
+            self.tabs.setTabToolTip(idx, title)
+
+            mark = HIBERNATED_MARK if browser.hibernated else ""
+            self.tabs.setTabText(idx, mark + tab_label(browser.content_type, title))
+
+            self.tabs.tabBar().setTabTextColor(idx, browser.group_color)
+        self.registry.update(browser)
+        self.tab_updated(browser)
+        self.index_visit(browser)
+
+    def index_visit(self, view):
+        # Live http(s) pages with a real title only; a title change on the same URL isn't another visit
+        if view.hibernated or view.archived_url or view.pending_url or view.queued_url:
+            return
+        url = view.url()
+        title = view.title()
+        if url.scheme() not in ("http", "https") or not title or title in url.toString():
+            return # Not a web page, or no <title> yet (WebEngine shows the URL meanwhile)
+        url = url.toString()
+        self.search_index.add(url, title, item_id=self.story_item_id(url), visit=url != view.indexed_url)
+        view.indexed_url = url
+
+    def index_article_text(self, view):
+        url = view.url().toString()
+        def store(text):
+            if text and view.url().toString() == url:
+                self.search_index.add(url, view.title(), body=text, item_id=self.story_item_id(url), visit=False)
+        view.page().runJavaScript("document.body ? document.body.innerText : ''", store)
+
+    def prefetch_front_page(self, view):
+        count = self.app_settings["prefetch_top_stories"]
+        if not count and not self.preconnector.max_warm:
+            return
+        js = """
+        Array.from(document.querySelectorAll('tr.athing')).map(function(row) {
+            var a = row.querySelector('.titleline > a');
+            return [row.id, a ? a.href : ''];
+        });
+        """
+        page = view.page()
+        def handle_rows(rows):
+            if not rows: return
+            self.prefetcher.remember_story_links(rows)
+            if count:
+                self.prefetcher.prefetch([int(r[0]) for r in rows[:count] if str(r[0]).isdigit()])
+            # Top articles: DNS + TLS done before the click
+            self.preconnector.front_page(page, [r[1] for r in rows])
+        page.runJavaScript(js, handle_rows)
+
     # --- CONTEXT MENU ---
     def show_tab_context_menu(self, position):
         index = self.tabs.tabBar().tabAt(position)
         if index == -1: return
+        self.show_tab_menu(index, self.tabs.mapToGlobal(position))
 
+    def show_tab_menu(self, index, global_pos):
         menu = QMenu()
         
         close_action = QAction("Close This Tab", self)
@@ -554,63 +995,222 @@ class HNBrowser(QMainWindow):
         close_all.triggered.connect(self.close_all_tabs)
         menu.addAction(close_all)
 
-        menu.exec(self.tabs.mapToGlobal(position))
+        reopen = QAction("Reopen Closed Tab", self)
+        reopen.triggered.connect(self.lifecycle.reopen)
+        reopen.setEnabled(bool(self.lifecycle.closed))
+        menu.addAction(reopen)
+
+        menu.addSeparator()
+
+        save_offline = QAction("Save for Offline", self)
+        save_offline.triggered.connect(lambda: self.save_for_offline(self.tabs.widget(index)))
+        menu.addAction(save_offline)
+        if self.tabs.widget(index).archived_url:
+            live = QAction("Load Live Page", self)
+            live.triggered.connect(lambda: self.load_live(self.tabs.widget(index)))
+            menu.addAction(live)
+
+        menu.addSeparator()
+
+        # Black is the home tab's colour, not a thread group
+        if self.tabs.widget(index).group_color.name() != "#000000":
+            self.add_group_actions(menu.addMenu("Thread Group"), index)
+
+        hibernate = QAction("Hibernate Background Tabs", self)
+        hibernate.triggered.connect(self.hibernator.hibernate_all_background)
+        menu.addAction(hibernate)
+
+        menu.exec(global_pos)
+
+    def remove_tabs(self, views):
+        # One repaint for the whole batch instead of a tab-bar relayout per removal
+        views = list(views)
+        if not views: return
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            for w in views:
+                self.registry.unregister(w)
+                self.scheduler.forget(w)
+                self.ui_updates.forget(w)
+                idx = self.tabs.indexOf(w)
+                if idx >= 0:
+                    self.tabs.removeTab(idx)
+                    self.lifecycle.close(w, idx)
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+        if self.tab_panel:
+            if len(views) == 1: self.tab_panel.model.tab_removed(views[0])
+            else: self.tab_panel.model.schedule_rebuild()
+        self.mark_session_dirty()
+
+    def tab_moved(self, _from, to):
+        # Dragged in the (hidden) tab bar, gathered into a group or reopened at its old place
+        if self.tab_panel: self.tab_panel.model.tab_moved(self.tabs.widget(to))
+
+    def tab_updated(self, view):
+        # Title / URL / hibernation changed: repaint just that row
+        if self.tab_panel: self.tab_panel.model.tab_changed(view)
+
+    def is_open(self, view):
+        # Deferred callbacks must not touch a closed tab's deleted C++ object
+        return not view.disposed and self.tabs.indexOf(view) >= 0
+
+    def widgets_in(self, indices):
+        return [self.tabs.widget(i) for i in indices]
 
     def close_tab(self, i):
-        if self.tabs.count() > 1: self.tabs.removeTab(i)
+        if self.tabs.count() > 1: self.remove_tabs([self.tabs.widget(i)])
         else: self.close()
 
     def close_all_tabs(self):
-        while self.tabs.count() > 1:
-            self.tabs.removeTab(1) 
-        if self.tabs.count() == 1 and self.tabs.widget(0).url().toString() != HOME_URL:
-             self.tabs.removeTab(0)
+        self.remove_tabs(self.widgets_in(range(1, self.tabs.count())))
+        if self.tabs.count() == 1 and self.tabs.widget(0).page_url().toString() != HOME_URL:
+             self.remove_tabs([self.tabs.widget(0)])
              self.add_new_tab(HOME_URL)
 
     def close_other_tabs(self, keep_index):
         keep_widget = self.tabs.widget(keep_index)
-        for i in range(self.tabs.count() - 1, -1, -1):
-            if self.tabs.widget(i) != keep_widget:
-                self.tabs.removeTab(i)
+        self.remove_tabs(w for w in self.widgets_in(range(self.tabs.count())) if w != keep_widget)
 
     def close_right_tabs(self, current_index):
-        for i in range(self.tabs.count() - 1, current_index, -1):
-            self.tabs.removeTab(i)
+        self.remove_tabs(self.widgets_in(range(current_index + 1, self.tabs.count())))
 
     def close_left_tabs(self, current_index):
-        for i in range(current_index - 1, -1, -1):
-            self.tabs.removeTab(i)
+        self.remove_tabs(self.widgets_in(range(current_index)))
+
+    # --- GROUP OPERATIONS ---
+    def add_group_actions(self, group_menu, index):
+        gather = QAction("Gather Group Tabs Together", self)
+        gather.triggered.connect(lambda: self.gather_group(index))
+        group_menu.addAction(gather)
+        hibernate_group = QAction("Hibernate Group", self)
+        hibernate_group.triggered.connect(lambda: self.hibernate_group(index))
+        group_menu.addAction(hibernate_group)
+        close_group = QAction("Close Group", self)
+        close_group.triggered.connect(lambda: self.close_group(index))
+        group_menu.addAction(close_group)
+
+    def close_group(self, index):
+        group = self.registry.group(self.tabs.widget(index).group_color.name())
+        if len(group) >= self.tabs.count():
+            group = group[1:] # Never close the window from a group action
+        self.remove_tabs(group)
+
+    def hibernate_group(self, index):
+        self.hibernator.hibernate_many(self.registry.group(self.tabs.widget(index).group_color.name()))
+
+    def gather_group(self, index):
+        # Pull the whole thread together, right after the clicked tab
+        anchor = self.tabs.widget(index)
+        group = [w for w in self.registry.group(anchor.group_color.name()) if w is not anchor]
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            for w in group:
+                src, dst = self.tabs.indexOf(w), self.tabs.indexOf(anchor) + 1
+                if src > dst: self.tabs.tabBar().moveTab(src, dst)
+                elif src < dst - 1: self.tabs.tabBar().moveTab(src, dst - 1)
+                anchor = w
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+        self.mark_session_dirty()
 
     def handle_tab_change(self, i):
         if i >= 0:
-            self.urlbar.setText(self.tabs.widget(i).url().toString())
+            w = self.tabs.widget(i)
+            self.watchdog.begin_tab_switch(w)
+            # Qt auto-selects the first restored tab; don't let that load it
+            if not self.restoring:
+                w.ensure_loaded()
+            self.hibernator.activated(w)
+            self.urlbar.setText(w.page_url().toString())
+            self.update_block_label()
+            self.ui_updates.mark_progress() # The progress bar follows the current tab
+
+    def on_request_blocked(self, page_url):
+        view = self.tabs.currentWidget()
+        if view and view.url().toString() == page_url and not self.block_timer.isActive():
+            self.block_timer.start()
+
+    def update_block_label(self):
+        view = self.tabs.currentWidget()
+        count, saved = self.blocker.page_stats(view.url().toString()) if view else (0, 0)
+        self.block_label.setText(f"🛡 {count} blocked (~{saved // 1024} KB)" if count else "")
+
+    def mark_session_dirty(self, *_):
+        # Restarting the single-shot timer debounces bursts (session restore, close-all, redirects)
+        if not self.restoring:
+            self.save_timer.start()
+
+    def closeEvent(self, event):
+        self.save_timer.stop()
+        self.save_session()
+        self.prefetcher.shutdown()
+        readers = [w.reader.loader for w in map(self.tabs.widget, range(self.tabs.count())) if getattr(w, "reader", None)]
+        for loader in readers: loader.cancel()
+        logging.info(self.prefetcher.summary())
+        logging.info(self.scheduler.summary())
+        logging.info(self.blocker.summary())
+        logging.info(self.lifecycle.summary())
+        logging.info(self.ui_updates.summary())
+        logging.info(self.preconnector.summary())
+        if self.debug: logging.debug(self.load_metrics.dump())
+        self.io.shutdown() # Waits for the session write queued above, and for archive / index writes
+        for loader in readers: loader.join(READER_JOIN_TIMEOUT) # They read and write through the item cache
+        self.api_fetcher.close()
+        if self.item_cache: self.item_cache.close()
+        self.archive.close()
+        self.search_index.close()
+        self.curated.close()
+        self.watchdog.stop()
+        logging.info(self.watchdog.summary())
+        super().closeEvent(event)
 
     def save_session(self):
-        tabs = []
-        for i in range(self.tabs.count()):
-            w = self.tabs.widget(i)
-            tabs.append({
-                "url": w.url().toString(),
-                "color": w.group_color.name() 
-            })
+        tabs = [self.tab_state(self.tabs.widget(i)) for i in range(self.tabs.count())]
+        data = {"version": 2, "active": self.tabs.currentIndex(), "tabs": tabs}
+        text = json.dumps(data, sort_keys=True)
+        if text == self.last_session_text:
+            return
+        self.last_session_text = text
+        # Written in order on the disk lane; a failed write is retried with the next save
+        self.io.submit(DISK, atomic_write_json, get_data_path("session.json"), data, SESSION_BACKUPS,
+                       on_error=self.on_session_save_failed)
+
+    def tab_state(self, w):
+        # Session entry; also what the reopen-closed-tab stack remembers
+        return {
+            "url": w.page_url().toString(),
+            "color": w.group_color.name(),
+            "title": w.page_title(),
+            "type": w.content_type,
+            "scroll": w.page_scroll(),
+            "history": w.history_state()
+        }
+
+    def on_session_save_failed(self, e):
+        logging.error(f"Save Session Error: {e}")
+        self.last_session_text = None
+
+    def read_session(self):
         try:
-            with open(get_data_path("session.json"), "w") as f:
-                json.dump({"active": self.tabs.currentIndex(), "tabs": tabs}, f)
+            data = read_json_with_backups(get_data_path("session.json"), backups=SESSION_BACKUPS)
+            return [t for t in data.get("tabs", []) if t.get("url")]
         except Exception as e:
-            logging.error(f"Save Session Error: {e}")
+            logging.error(f"Load Session Error: {e}")
+            return []
 
-    def load_session(self):
+    def restore_tabs(self, saved):
         try:
-            with open(get_data_path("session.json"), "r") as f:
-                data = json.load(f)
-                for t in data.get("tabs", []): 
-                    c = t.get("color")
-                    color_obj = QColor(c) if c else None
-                    self.add_new_tab(t["url"], restored_color=color_obj)
-                return True
+            self.restoring = True
+            for t in saved:
+                c = t.get("color")
+                color_obj = QColor(c) if c else None
+                self.add_new_tab(t["url"], title=t.get("title") or "New Tab", restored_color=color_obj,
+                                 focus=False, lazy=True, content_type=t.get("type", ""), restored_state=t)
         except Exception as e:
-            logging.error(f"Load Session Error: {e}")
-            return False
+            logging.error(f"Restore Session Error: {e}")
+        finally:
+            self.restoring = False
 
 if __name__ == "__main__":
     os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu"
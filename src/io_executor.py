@@ -0,0 +1,79 @@
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+DISK = "disk"
+NET = "net"
+SEARCH = "search"  # URL-bar queries: never stuck behind a session save
+
+
+class IOExecutor(QObject):
+    """Runs blocking disk / network calls off the GUI thread.
+
+    Work is submitted to a named lane; each lane is one worker thread with a
+    FIFO queue, so writes to the same file never overtake each other while
+    a slow network call can't hold up a session save. Reads on the input
+    path (URL-bar search) get their own lane, so a keystroke's query never
+    waits behind a write, and the GUI thread never touches disk. Callbacks are
+    delivered back on the GUI thread through a queued signal, so they may
+    touch widgets. submit() also returns a Future for callers that need to
+    wait (e.g. the final session save on exit).
+    """
+    delivered = pyqtSignal(object, object)  # callback, result
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lanes = {}  # name -> (queue, thread)
+        self.lock = threading.Lock()
+        self.delivered.connect(lambda callback, result: callback(result))
+
+    def submit(self, lane, fn, *args, on_done=None, on_error=None):
+        future = Future()
+        self.lane(lane).put((future, fn, args, on_done, on_error))
+        return future
+
+    def lane(self, name):
+        with self.lock:
+            if name not in self.lanes:
+                jobs = queue.Queue()
+                thread = threading.Thread(target=self.work, args=(name, jobs), name=f"io-{name}", daemon=True)
+                self.lanes[name] = (jobs, thread)
+                thread.start()
+            return self.lanes[name][0]
+
+    def work(self, name, jobs):
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            future, fn, args, on_done, on_error = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except Exception as e:
+                future.set_exception(e)
+                if on_error:
+                    self.delivered.emit(on_error, e)
+                else:
+                    logging.error(f"Background {name} Error: {e}")
+                continue
+            future.set_result(result)
+            if on_done:
+                self.delivered.emit(on_done, result)
+
+    def pending(self):
+        return sum(jobs.qsize() for jobs, _ in self.lanes.values())
+
+    def shutdown(self, timeout=5):
+        """Finish what's queued and stop the workers. Callbacks still in flight may never run."""
+        with self.lock:
+            lanes = list(self.lanes.values())
+            self.lanes = {}
+        for jobs, _ in lanes:
+            jobs.put(None)
+        for _, thread in lanes:
+            thread.join(timeout)
@@ -0,0 +1,203 @@
+import json
+import time
+import sqlite3
+import threading
+
+# --- TTL POLICY ---
+# HN items stop changing once they fall off the front page: scores and
+# comment counts settle within a day or two, after which an item is
+# effectively immutable. Young items are revalidated aggressively.
+HOUR = 3600
+DAY = 24 * HOUR
+
+TTL_RULES = {
+    # kind: [(max item age, ttl), ...] -- first matching age bracket wins
+    "story":   [(6 * HOUR, 10 * 60), (DAY, HOUR), (3 * DAY, 6 * HOUR)],
+    "job":     [(DAY, HOUR), (3 * DAY, 6 * HOUR)],
+    "poll":    [(DAY, 30 * 60), (3 * DAY, 6 * HOUR)],
+    "comment": [(6 * HOUR, 30 * 60), (2 * DAY, 6 * HOUR)],
+}
+DEFAULT_TTL = [(DAY, HOUR)]
+IMMUTABLE = None
+
+DEFAULT_MAX_ITEMS = 50_000
+
+
+def ttl_for(item, now=None):
+    """Seconds a cached copy of `item` stays fresh, or IMMUTABLE."""
+    now = now or time.time()
+    if item.get("deleted") or item.get("dead"):
+        return IMMUTABLE
+    age = now - item.get("time", now)
+    for max_age, ttl in TTL_RULES.get(item.get("type"), DEFAULT_TTL):
+        if age < max_age:
+            return ttl
+    return IMMUTABLE
+
+
+class ItemCache:
+    """SQLite-backed HN item store keyed by item id.
+
+    Entries carry their own expiry (from ttl_for) and a last-access stamp used
+    for LRU eviction once the store grows past max_items.
+    """
+
+    def __init__(self, db_path, max_items=DEFAULT_MAX_ITEMS):
+        self.db_path = db_path
+        self.max_items = max_items
+        self.lock = threading.Lock()
+        self.conn = None
+        self.closed = False
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "stores": 0, "evictions": 0}
+
+    def _db(self):
+        if self.closed:
+            # A straggling reader thread must not reopen a connection nobody will close
+            raise sqlite3.ProgrammingError("item cache is closed")
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY,
+                    kind TEXT,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS items_accessed ON items(accessed_at)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        return self.conn
+
+    # --- CHECKPOINTS ---
+    def get_meta(self, key, default=None):
+        with self.lock:
+            row = self._db().execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, key, value):
+        with self.lock:
+            db = self._db()
+            db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, json.dumps(value)))
+            db.commit()
+
+    def kinds(self, ids):
+        """id -> cached item type, for ids present in the cache (fresh or not)."""
+        ids = list(ids)
+        out = {}
+        with self.lock:
+            db = self._db()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                out.update(db.execute(f"SELECT id, kind FROM items WHERE id IN ({marks})", chunk))
+        return out
+
+    def get_many(self, ids, now=None):
+        """Returns (fresh, stale): dicts of id -> item. Ids in neither are misses."""
+        now = now or time.time()
+        fresh, stale = {}, {}
+        ids = list(ids)
+        with self.lock:
+            db = self._db()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = db.execute(f"SELECT id, data, expires_at FROM items WHERE id IN ({marks})", chunk)
+                for item_id, data, expires_at in rows:
+                    if expires_at is None or expires_at > now:
+                        fresh[item_id] = json.loads(data)
+                    else:
+                        stale[item_id] = json.loads(data)
+            if fresh:
+                db.executemany("UPDATE items SET accessed_at=? WHERE id=?", [(now, i) for i in fresh])
+                db.commit()
+            self.stats["hits"] += len(fresh)
+            self.stats["stale"] += len(stale)
+            self.stats["misses"] += len(ids) - len(fresh) - len(stale)
+        return fresh, stale
+
+    def get(self, item_id):
+        fresh, _ = self.get_many([item_id])
+        return fresh.get(item_id)
+
+    def put_many(self, items, now=None):
+        now = now or time.time()
+        rows = []
+        for item in items:
+            if not item or "id" not in item:
+                continue
+            ttl = ttl_for(item, now)
+            expires_at = None if ttl is IMMUTABLE else now + ttl
+            rows.append((item["id"], item.get("type"), json.dumps(item), now, expires_at, now))
+        if not rows:
+            return
+        with self.lock:
+            db = self._db()
+            db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?)", rows)
+            db.commit()
+            self.stats["stores"] += len(rows)
+            self._evict(db)
+
+    def put(self, item):
+        self.put_many([item])
+
+    def invalidate(self, ids):
+        """Mark ids stale without dropping them (used when the updates feed reports a change)."""
+        ids = list(ids)
+        if not ids:
+            return
+        with self.lock:
+            db = self._db()
+            db.executemany("UPDATE items SET expires_at=0 WHERE id=?", [(i,) for i in ids])
+            db.commit()
+
+    def _evict(self, db):
+        count = db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        excess = count - self.max_items
+        if excess <= 0:
+            return
+        # Trim 10% below the cap so we don't evict on every single insert
+        excess += self.max_items // 10
+        cursor = db.execute("DELETE FROM items WHERE id IN (SELECT id FROM items ORDER BY accessed_at LIMIT ?)",
+                            (excess,))
+        db.commit()
+        self.stats["evictions"] += cursor.rowcount
+
+    def fetch_items(self, fetcher, ids, failed=None):
+        """Serve ids from cache, fetching only misses and expired entries.
+
+        A stale item that has aged into immutability is fetched once more,
+        so the copy that gets frozen carries its final score, kids and
+        title; put_many then stores it with no expiry.
+        Returns dict of id -> item (None for items that failed to fetch);
+        ids whose fetch failed are also added to the `failed` set if given.
+        """
+        now = time.time()
+        fresh, stale = self.get_many(ids, now)
+        result = dict(fresh)
+        to_fetch = [i for i in ids if i not in fresh]
+        fetched = []
+        for item_id, item in fetcher.iter_items(to_fetch, failed):
+            # Keep serving the stale copy if the refresh failed
+            result[item_id] = item or stale.get(item_id)
+            if item:
+                fetched.append(item)
+        self.put_many(fetched)
+        return result
+
+    def summary(self):
+        s = self.stats
+        lookups = s["hits"] + s["stale"] + s["misses"]
+        rate = (100.0 * s["hits"] / lookups) if lookups else 0.0
+        return (f"cache hits {s['hits']}, stale {s['stale']}, misses {s['misses']} "
+                f"({rate:.0f}% hit rate), evicted {s['evictions']}")
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,257 @@
+import csv
+import json
+import time
+import logging
+from collections import deque
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget,
+                             QTableWidgetItem, QPushButton, QFileDialog, QLabel)
+
+from src.hibernation import process_rss
+
+LOAD_HISTORY = 500    # Loads kept in the ring buffer
+HOST_LATENCIES = 100  # Recent latencies kept per host for the median / p90
+
+# Navigation Timing (Level 2) for the current document, plus Chrome's JS heap figure
+NAV_TIMING_JS = """
+(function() {
+  var n = performance.getEntriesByType('navigation')[0];
+  if (!n) return null;
+  var m = performance.memory;
+  return {
+    type: n.type,
+    ttfb: Math.round(n.responseStart - n.startTime),
+    setup: Math.round(n.connectEnd - n.domainLookupStart),  // DNS + TCP + TLS; 0 on a reused connection
+    response: Math.round(n.responseEnd - n.responseStart),
+    dom_ready: Math.round(n.domContentLoadedEventEnd - n.startTime),
+    load_event: n.loadEventEnd ? Math.round(n.loadEventEnd - n.startTime) : null,
+    transfer_bytes: n.transferSize,
+    js_heap_bytes: m ? m.usedJSHeapSize : null
+  };
+})();
+"""
+
+CSV_FIELDS = ["time", "url", "host", "type", "ok", "ms", "retries", "renderer_mb",
+              "nav_type", "ttfb", "setup", "response", "dom_ready", "load_event", "transfer_bytes", "js_heap_bytes"]
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class LoadMetrics(QObject):
+    """Per-tab page-load instrumentation.
+
+    Every watched HNView gets its loadStarted -> loadFinished latency, retry
+    count and renderer RSS recorded; successful loads are then enriched with
+    Navigation Timing pulled from the page. Records live in a bounded ring
+    buffer (oldest dropped first), per-host totals are kept separately so
+    they survive the buffer wrapping.
+    """
+    timed = pyqtSignal(dict)  # Record, once its navigation timing is in
+
+    def __init__(self, parent=None, history=LOAD_HISTORY, debug=False):
+        super().__init__(parent)
+        self.records = deque(maxlen=history)
+        self.hosts = {}  # host -> {"loads", "failures", "retries", "latencies"}
+        self.debug = debug
+
+    def watch(self, view):
+        view.load_started_at = None
+        view.retries_seen = 0
+        view.loadStarted.connect(lambda: self.on_started(view))
+        view.loadFinished.connect(lambda ok: self.on_finished(view, ok))
+
+    def on_started(self, view):
+        # Redirects and retries restart the clock; the record covers the final attempt
+        view.load_started_at = time.perf_counter()
+
+    def on_finished(self, view, ok):
+        if view.load_started_at is None:
+            return
+        ms = round((time.perf_counter() - view.load_started_at) * 1000)
+        view.load_started_at = None
+        # HNView.retries is a running total; only the retries behind this load count
+        retries_seen, view.retries_seen = view.retries_seen, getattr(view, "retries", 0)
+
+        qurl = view.url()
+        host = qurl.host() or qurl.scheme()
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "url": qurl.toString(),
+            "host": host,
+            "type": getattr(view, "content_type", ""),
+            "ok": bool(ok),
+            "ms": ms,
+            "retries": view.retries_seen - retries_seen,
+            "renderer_mb": None,
+            "nav": None,
+        }
+        page = view.page()
+        rss = process_rss(page.renderProcessPid()) if page else 0
+        if rss:
+            record["renderer_mb"] = round(rss / (1024 * 1024), 1)
+        self.records.append(record)
+
+        stats = self.hosts.setdefault(host, {"loads": 0, "failures": 0, "retries": 0,
+                                             "latencies": deque(maxlen=HOST_LATENCIES)})
+        stats["loads"] += 1
+        stats["retries"] += record["retries"]
+        if ok:
+            stats["latencies"].append(ms)
+            page.runJavaScript(NAV_TIMING_JS, lambda nav: self.on_nav_timing(record, nav))
+        else:
+            stats["failures"] += 1
+            if self.debug:
+                logging.debug(f"Load failed: {record['url']} after {ms} ms (retries {record['retries']})")
+
+    def on_nav_timing(self, record, nav):
+        if isinstance(nav, dict):
+            record["nav"] = nav
+            self.timed.emit(record)
+        if self.debug:
+            ttfb = nav.get("ttfb") if isinstance(nav, dict) else None
+            logging.debug(f"Load {record['ms']} ms (ttfb {ttfb} ms): {record['url']}")
+
+    # --- REPORTING ---
+    def host_summary(self):
+        """[(host, loads, failures, retries, median ms, p90 ms)], slowest median first."""
+        rows = []
+        for host, s in self.hosts.items():
+            lat = list(s["latencies"])
+            rows.append((host, s["loads"], s["failures"], s["retries"], percentile(lat, 50), percentile(lat, 90)))
+        return sorted(rows, key=lambda r: r[4] or 0, reverse=True)
+
+    def flat_records(self):
+        rows = []
+        for r in self.records:
+            row = {k: v for k, v in r.items() if k != "nav"}
+            nav = r["nav"] or {}
+            row["nav_type"] = nav.get("type")
+            for key in ("ttfb", "setup", "response", "dom_ready", "load_event", "transfer_bytes", "js_heap_bytes"):
+                row[key] = nav.get(key)
+            rows.append(row)
+        return rows
+
+    def export_json(self, path):
+        hosts = [dict(zip(("host", "loads", "failures", "retries", "median_ms", "p90_ms"), row))
+                 for row in self.host_summary()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"loads": list(self.records), "hosts": hosts}, f, indent=2)
+
+    def export_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.flat_records())
+
+    def dump(self, limit=15):
+        """Text table of the slowest hosts, for the --debug console."""
+        lines = [f"Page loads: {len(self.records)} recorded, {len(self.hosts)} hosts"]
+        for host, loads, failures, retries, median, p90 in self.host_summary()[:limit]:
+            lines.append(f"  {host:<32} {loads:4d} loads {failures:3d} failed {retries:3d} retried "
+                         f"median {median or 0:6d} ms  p90 {p90 or 0:6d} ms")
+        return "\n".join(lines)
+
+
+class PerfPanel(QDialog):
+    """Small window over LoadMetrics: slowest hosts, recent loads, JSON/CSV export.
+
+    Given the StallWatchdog, it also shows the event-loop stall and
+    tab-switch latency histograms.
+    """
+
+    HOST_COLUMNS = ["Host", "Loads", "Failed", "Retries", "Median ms", "p90 ms"]
+    LOAD_COLUMNS = ["Time", "ms", "TTFB", "DOM ready", "OK", "Retries", "Renderer MB", "JS heap MB", "URL"]
+    LATENCY_COLUMNS = ["Duration", "Event loop lag", "Tab switches"]
+
+    def __init__(self, metrics, parent=None, watchdog=None):
+        super().__init__(parent)
+        self.metrics = metrics
+        self.watchdog = watchdog
+        self.setWindowTitle("Page Load Performance")
+        self.resize(900, 500)
+
+        layout = QVBoxLayout(self)
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+        views = QTabWidget()
+        self.host_table = self.make_table(self.HOST_COLUMNS)
+        self.load_table = self.make_table(self.LOAD_COLUMNS)
+        views.addTab(self.host_table, "Slowest Hosts")
+        views.addTab(self.load_table, "Recent Loads")
+        self.latency_table = None
+        if watchdog:
+            self.latency_table = self.make_table(self.LATENCY_COLUMNS)
+            self.latency_table.setSortingEnabled(False)  # Buckets are already in order
+            views.addTab(self.latency_table, "Responsiveness")
+        layout.addWidget(views)
+
+        buttons = QHBoxLayout()
+        for label, handler in (("Refresh", self.refresh), ("Export JSON...", self.export_json),
+                               ("Export CSV...", self.export_csv)):
+            button = QPushButton(label)
+            button.clicked.connect(handler)
+            buttons.addWidget(button)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+        self.refresh()
+
+    def make_table(self, columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSortingEnabled(True)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    def fill(self, table, rows):
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                item = QTableWidgetItem()
+                # Numbers sort numerically when set as display data
+                item.setData(Qt.ItemDataRole.DisplayRole, "" if value is None else value)
+                table.setItem(r, c, item)
+        table.setSortingEnabled(sorting)
+
+    def refresh(self):
+        self.fill(self.host_table, self.metrics.host_summary())
+        loads = []
+        for r in reversed(self.metrics.records):
+            nav = r["nav"] or {}
+            heap = nav.get("js_heap_bytes")
+            loads.append((r["time"][11:], r["ms"], nav.get("ttfb"), nav.get("dom_ready"), "yes" if r["ok"] else "NO",
+                          r["retries"], r["renderer_mb"], round(heap / (1024 * 1024), 1) if heap else None, r["url"]))
+        self.fill(self.load_table, loads)
+        failed = sum(1 for r in self.metrics.records if not r["ok"])
+        text = f"{len(self.metrics.records)} loads recorded ({failed} failed) across {len(self.metrics.hosts)} hosts"
+        if self.watchdog:
+            self.fill(self.latency_table, self.watchdog.rows())
+            text += f"\n{self.watchdog.summary()}"
+        self.summary.setText(text)
+
+    def export_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Load Metrics", "load_metrics.json", "JSON (*.json)")
+        if path:
+            self.export(self.metrics.export_json, path)
+
+    def export_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Load Metrics", "load_metrics.csv", "CSV (*.csv)")
+        if path:
+            self.export(self.metrics.export_csv, path)
+
+    def export(self, writer, path):
+        try:
+            writer(path)
+            self.summary.setText(f"Exported to {path}")
+        except OSError as e:
+            logging.error(f"Load Metrics Export Error: {e}")
+            self.summary.setText(f"Export failed: {e}")
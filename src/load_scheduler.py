@@ -0,0 +1,227 @@
+import time
+import heapq
+import random
+import logging
+import itertools
+
+from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineLoadingInfo
+
+from src.fetcher import parse_retry_after
+from src.prefetch import HN_HOST
+
+LoadStatus = QWebEngineLoadingInfo.LoadStatus
+ErrorDomain = QWebEngineLoadingInfo.ErrorDomain
+
+PRIORITY_FOREGROUND = 0  # The tab the user is looking at: ignores caps, only waits out a throttle
+PRIORITY_BACKGROUND = 10
+PRIORITY_PRELOAD = 20
+
+DEFAULT_PER_HOST = 4
+HN_START_SPACING = 0.5   # s between HN navigations started by the scheduler
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 120.0
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Chromium net errors that will not fix themselves: unknown host, bad URL/scheme
+PERMANENT_NET_ERRORS = {-105, -137, -300, -301, -302}
+NET_ERR_ABORTED = -3  # Navigated away / stopped mid-load
+# Qt 6.6+: older builds can't flag downloads (those end as ERR_ABORTED anyway) or show
+# the Retry-After header, so throttled loads there fall back to plain backoff
+HAS_DOWNLOAD_FLAG = hasattr(QWebEngineLoadingInfo, "isDownload")
+HAS_RESPONSE_HEADERS = hasattr(QWebEngineLoadingInfo, "responseHeaders")
+
+
+def backoff(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    # "Equal jitter": at least half the exponential delay, so a throttled host really gets a break
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def host_of(url):
+    return QUrl(url).host() if isinstance(url, str) else url.host()
+
+
+class LoadScheduler(QObject):
+    """Queues tab navigations per host and retries failed loads with backoff.
+
+    Background loads (bulk opens, restore preloading, the comments half of a
+    dual open) wait for a per-host slot: news.ycombinator.com gets only a few
+    concurrent loads, spaced apart, while other hosts load in parallel. Every
+    tab's loadingChanged is watched, so an HTTP 429/503 from any load pauses
+    the whole host (honouring Retry-After) and is retried with exponential
+    backoff plus jitter; dead hosts are not retried at all.
+    """
+    retrying = pyqtSignal(object, float, int)  # view, delay s, attempt
+    gave_up = pyqtSignal(object, str)
+
+    def __init__(self, main_window, host_limits=None, per_host=DEFAULT_PER_HOST, max_retries=3,
+                 slot_timeout_ms=20000, hn_bucket=None):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.host_limits = host_limits or {HN_HOST: 2}
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.slot_timeout_ms = slot_timeout_ms
+        self.hn_bucket = hn_bucket  # Background HN fetches back off together with the tabs
+        self.queue = []  # heap of (priority, seq, view, url)
+        self.seq = itertools.count()
+        self.active = {}  # view -> host
+        self.hosts = {}  # host -> {"paused_until", "next_start"}
+        self.attempts = {}  # view -> consecutive failed attempts
+        self.stats = {"started": 0, "retried": 0, "throttled": 0, "gave_up": 0}
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.pump)
+
+    # --- SUBMITTING ---
+    def watch(self, view):
+        view.page().loadingChanged.connect(lambda info: self.on_loading_changed(view, info))
+
+    def submit(self, view, url, priority=PRIORITY_BACKGROUND):
+        url = url.toString() if isinstance(url, QUrl) else url
+        self.forget_queued(view)
+        view.queued_url = url
+        heapq.heappush(self.queue, (priority, next(self.seq), view, url))
+        self.pump()
+
+    def forget_queued(self, view):
+        if any(job[2] is view for job in self.queue):
+            self.queue = [job for job in self.queue if job[2] is not view]
+            heapq.heapify(self.queue)
+
+    def forget(self, view):
+        # Tab closed: drop its queued load and free its slot
+        self.forget_queued(view)
+        view.queued_url = None
+        self.attempts.pop(view, None)
+        if self.active.pop(view, None) is not None:
+            self.pump()
+
+    def host_state(self, host):
+        return self.hosts.setdefault(host, {"paused_until": 0.0, "next_start": 0.0})
+
+    # --- DISPATCH ---
+    def pump(self):
+        now = time.monotonic()
+        wake = None
+        deferred = []
+        while self.queue:
+            job = heapq.heappop(self.queue)
+            priority, _, view, url = job
+            if not self.main_window.is_open(view):
+                view.queued_url = None
+                continue
+            host = host_of(url)
+            state = self.host_state(host)
+            ready_at = state["paused_until"]
+            if priority > PRIORITY_FOREGROUND:
+                if sum(1 for h in self.active.values() if h == host) >= self.host_limits.get(host, self.per_host):
+                    deferred.append(job)  # Woken again when a slot frees up
+                    continue
+                ready_at = max(ready_at, state["next_start"])
+            if ready_at > now:
+                deferred.append(job)
+                wake = ready_at if wake is None else min(wake, ready_at)
+                continue
+            self.start(view, url, host)
+        for job in deferred:
+            heapq.heappush(self.queue, job)
+        if wake is not None:
+            self.timer.start(max(10, int((wake - now) * 1000)))
+
+    def start(self, view, url, host):
+        self.active[view] = host
+        if host == HN_HOST:
+            self.host_state(host)["next_start"] = time.monotonic() + HN_START_SPACING
+        self.stats["started"] += 1
+        token = object()
+        view.scheduler_token = token
+        # A load that never reports back must not hold its host slot forever
+        QTimer.singleShot(self.slot_timeout_ms, lambda: self.release(view, token))
+        view.queued_url = None
+        view.setUrl(QUrl(url))
+
+    def release(self, view, token=None):
+        if token is not None and getattr(view, "scheduler_token", None) is not token:
+            return
+        if self.active.pop(view, None) is not None:
+            self.pump()
+
+    # --- OUTCOMES ---
+    def on_loading_changed(self, view, info):
+        status = info.status()
+        if status == LoadStatus.LoadStartedStatus or (HAS_DOWNLOAD_FLAG and info.isDownload()):
+            return
+        self.release(view)
+        if status == LoadStatus.LoadStoppedStatus or info.errorCode() == NET_ERR_ABORTED:
+            return
+
+        http_status = info.errorCode() if info.errorDomain() == ErrorDomain.HttpStatusCodeDomain else 0
+        if status == LoadStatus.LoadSucceededStatus and http_status not in RETRY_STATUSES:
+            self.attempts.pop(view, None)
+            return
+        if http_status and http_status not in RETRY_STATUSES:
+            return  # 404 and friends: retrying will not change the answer
+
+        url = info.url()
+        host = url.host()
+        if http_status in RETRY_STATUSES:
+            reason = f"HTTP {http_status}"
+        elif info.errorDomain() in (ErrorDomain.CertificateErrorDomain, ErrorDomain.DnsErrorDomain) \
+                or info.errorCode() in PERMANENT_NET_ERRORS:
+            self.give_up(view, f"{info.errorString() or info.errorCode()} (not retried)")
+            return
+        else:
+            reason = info.errorString() or f"error {info.errorCode()}"
+
+        attempt = self.attempts.get(view, 0)
+        if attempt >= self.max_retries:
+            self.give_up(view, f"{reason} after {attempt} retries")
+            return
+        self.attempts[view] = attempt + 1
+        delay = backoff(attempt)
+
+        if http_status in THROTTLE_STATUSES:
+            retry_after = self.retry_after(info)
+            if retry_after:
+                delay = max(delay, min(retry_after, BACKOFF_CAP))
+            # Every queued load for this host waits it out, not just this tab
+            state = self.host_state(host)
+            state["paused_until"] = max(state["paused_until"], time.monotonic() + delay)
+            self.stats["throttled"] += 1
+            if host == HN_HOST and self.hn_bucket:
+                self.hn_bucket.pause(delay)
+
+        self.stats["retried"] += 1
+        view.retries += 1
+        logging.warning(f"Load failed ({reason}): {url.toString()}; retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+        self.retrying.emit(view, delay, attempt + 1)
+        QTimer.singleShot(int(delay * 1000), lambda: self.retry(view, url))
+
+    def retry(self, view, url):
+        # Skip if the tab was closed or has moved on to another page meanwhile
+        if not self.main_window.is_open(view) or view.url() != url:
+            return
+        priority = PRIORITY_FOREGROUND if view is self.main_window.tabs.currentWidget() else PRIORITY_BACKGROUND
+        self.submit(view, url, priority)
+
+    def retry_after(self, info):
+        if not HAS_RESPONSE_HEADERS:
+            return None
+        for name, values in info.responseHeaders().items():
+            if bytes(name).decode("latin-1").lower() == "retry-after" and values:
+                return parse_retry_after(bytes(values[0]).decode("latin-1"))
+        return None
+
+    def give_up(self, view, reason):
+        self.attempts.pop(view, None)
+        self.stats["gave_up"] += 1
+        logging.warning(f"Load failed ({reason}): {view.url().toString()}")
+        self.gave_up.emit(view, reason)
+
+    def summary(self):
+        s = self.stats
+        return (f"loads: {s['started']} scheduled, {s['retried']} retried, {s['throttled']} throttled, "
+                f"{s['gave_up']} given up, {len(self.queue)} queued")
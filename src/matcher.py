@@ -0,0 +1,125 @@
+import re
+from collections import namedtuple
+
+# --- RULE SYNTAX ---
+#   rust            whole word, case-insensitive ("rust" won't match "trust")
+#   "open source"   phrase; spaces and hyphens between words are interchangeable
+#   crypt*          prefix on the last word (crypto, cryptography, ...)
+#   -crypto         exclusion: a title matching any exclusion matches nothing
+#   rust^3          weight (default 1); the story's score is the sum over matched rules
+Rule = namedtuple("Rule", "term tokens weight exclude prefix")
+
+RULE_RE = re.compile(r'^(?P<neg>-)?(?P<body>"[^"]+"|[^\^]+?)(?P<star>\*)?(?:\^(?P<weight>\d+(?:\.\d+)?))?$')
+
+# Words, plus single punctuation marks so terms like "c++" or "node.js" still work.
+# Hyphens are separators, not tokens.
+TOKEN_RE = re.compile(r"\w+|[^\w\s\-]")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def parse_rule(spec):
+    """Turn a watch-term string (or a dict with term/weight/exclude keys) into a Rule."""
+    if isinstance(spec, dict):
+        term = spec["term"].strip()
+        prefix = term.endswith("*")
+        term = term.rstrip("*").strip('"').strip().lower()
+        weight = float(spec.get("weight", 1))
+        exclude = bool(spec.get("exclude"))
+    else:
+        m = RULE_RE.match(spec.strip())
+        if not m:
+            raise ValueError(f"Invalid keyword rule: {spec!r}")
+        term = m.group("body").strip('"').strip().lower()
+        prefix = bool(m.group("star"))
+        weight = float(m.group("weight")) if m.group("weight") else 1.0
+        exclude = bool(m.group("neg"))
+        if term.endswith("*"):  # "open sour*" -- star inside the quotes
+            prefix = True
+            term = term.rstrip("*").strip()
+
+    tokens = tuple(tokenize(term))
+    if not tokens:
+        raise ValueError(f"Invalid keyword rule: {spec!r}")
+    return Rule(term, tokens, weight, exclude, prefix)
+
+
+class KeywordMatcher:
+    """Multi-pattern matcher over word tokens.
+
+    Rules are hash-indexed by token, so matching a title is a couple of set
+    intersections against its tokens rather than a scan over every rule:
+    cost grows with title length, not with the number of watch terms.
+    Phrases are indexed by their first word and only verified where that
+    word occurs; prefix rules are probed once per distinct prefix length.
+    """
+
+    def __init__(self, rules):
+        merged = {}  # Same pattern listed twice ("rust, rust^3"): one rule, the heaviest weight
+        for spec in rules:
+            rule = spec if isinstance(spec, Rule) else parse_rule(spec)
+            key = (rule.tokens, rule.prefix, rule.exclude)
+            if key not in merged or rule.weight > merged[key].weight:
+                merged[key] = rule
+        self.rules = list(merged.values())
+
+        self.words = {}    # single token -> [rule index]
+        self.phrases = {}  # first token -> [(token tuple, prefix, rule index)]
+        self.prefixes = {} # last-word prefix of single-word prefix rules -> [rule index]
+        for i, rule in enumerate(self.rules):
+            if len(rule.tokens) > 1:
+                self.phrases.setdefault(rule.tokens[0], []).append((rule.tokens, rule.prefix, i))
+            elif rule.prefix:
+                self.prefixes.setdefault(rule.tokens[0], []).append(i)
+            else:
+                self.words.setdefault(rule.tokens[0], []).append(i)
+        self.word_keys = frozenset(self.words)
+        self.phrase_keys = frozenset(self.phrases)
+        self.prefix_keys = frozenset(self.prefixes)
+        self.prefix_lengths = sorted({len(p) for p in self.prefixes})
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def matched_indices(self, text):
+        hits = set()
+        if not self.rules or not text:
+            return hits
+        tokens = tokenize(text)
+        present = set(tokens)
+
+        for word in self.word_keys.intersection(present):
+            hits.update(self.words[word])
+
+        for plen in self.prefix_lengths:
+            for head in self.prefix_keys.intersection({t[:plen] for t in present if len(t) >= plen}):
+                hits.update(self.prefixes[head])
+
+        starts = self.phrase_keys.intersection(present)
+        if starts:
+            n = len(tokens)
+            for pos, tok in enumerate(tokens):
+                if tok not in starts:
+                    continue
+                for phrase, prefix, i in self.phrases[tok]:
+                    end = pos + len(phrase)
+                    if end > n:
+                        continue
+                    if prefix:
+                        if tuple(tokens[pos:end - 1]) == phrase[:-1] and tokens[end - 1].startswith(phrase[-1]):
+                            hits.add(i)
+                    elif tuple(tokens[pos:end]) == phrase:
+                        hits.add(i)
+        return hits
+
+    def match(self, text):
+        """All matching (non-exclusion) rules, heaviest first. Empty if an exclusion matched."""
+        hits = self.matched_indices(text)
+        if any(self.rules[i].exclude for i in hits):
+            return []
+        return sorted((self.rules[i] for i in hits), key=lambda r: (-r.weight, r.term))
+
+    def score(self, text):
+        return sum(r.weight for r in self.match(text))
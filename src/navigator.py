@@ -0,0 +1,207 @@
+import logging
+
+from PyQt6.QtCore import QObject, QFile, QIODevice, pyqtSlot
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineCore import QWebEngineScript
+
+WORLD = QWebEngineScript.ScriptWorldId.ApplicationWorld  # Hidden from (and safe from) the page's own scripts
+QWEBCHANNEL_JS = ":/qtwebchannel/qwebchannel.js"
+# Runs in every page before its own scripts. The item index is rebuilt only when a
+# MutationObserver has seen items come or go (HN's collapse, the reader streaming
+# comments in), so a keypress is a step along an array, not a DOM query.
+NAVIGATOR_JS = r"""
+(function() {
+  if (window.hnNav) return;
+  var ITEMS = 'tr.athing, #c0 details';  // Stories and comments on HN; comments in the reader
+  var HN_HOST = 'news.ycombinator.com';  // Reader and prefetched pages keep the thread's URL
+  var HN_ITEM = 'https://' + HN_HOST + '/item?id=';
+  var STYLE = '.hn-nav-current:not(details), details.hn-nav-current > summary ' +
+              '{ outline: 2px solid #ff6600; outline-offset: -2px; }';
+  var bridge = null;
+  var items = [], current = -1, dirty = true;
+
+  new QWebChannel(qt.webChannelTransport, function(channel) { bridge = channel.objects.hnStation; });
+
+  function send(method) {
+    if (bridge) bridge[method].apply(bridge, Array.prototype.slice.call(arguments, 1));
+    return !!bridge;
+  }
+
+  function scroll(dy) {
+    window.scrollBy({top: dy, behavior: 'smooth'});
+    return true;
+  }
+
+  // --- INDEX ---
+  function index() {
+    if (dirty) {
+      var selected = items[current];
+      items = Array.prototype.slice.call(document.querySelectorAll(ITEMS));
+      current = selected ? items.indexOf(selected) : -1;
+      dirty = false;
+    }
+    return items;
+  }
+
+  function touches(nodes) {
+    for (var i = 0; i < nodes.length; i++) {
+      var n = nodes[i];
+      if (n.nodeType === 1 && (n.matches(ITEMS) || n.querySelector(ITEMS))) return true;
+    }
+    return false;
+  }
+
+  function observe(records) {
+    for (var i = 0; i < records.length && !dirty; i++) {
+      dirty = touches(records[i].addedNodes) || touches(records[i].removedNodes);
+    }
+  }
+
+  // --- MOVEMENT ---
+  function shown(el) { return el.offsetParent !== null; }  // Skips collapsed subthreads
+
+  function onScreen(el) {
+    var r = el.getBoundingClientRect();
+    return r.bottom > 0 && r.top < window.innerHeight;
+  }
+
+  function firstOnScreen(list) {
+    // Items are in document (top to bottom) order, so the viewport can be found by bisection
+    var lo = 0, hi = list.length;
+    while (lo < hi) {
+      var mid = (lo + hi) >> 1;
+      if (list[mid].getBoundingClientRect().bottom > 0) hi = mid; else lo = mid + 1;
+    }
+    return lo;
+  }
+
+  function select(i) {
+    if (items[current]) items[current].classList.remove('hn-nav-current');
+    current = i;
+    var el = items[i];
+    el.classList.add('hn-nav-current');
+    (el.tagName === 'DETAILS' ? el.firstElementChild : el).scrollIntoView({block: 'nearest', behavior: 'smooth'});
+  }
+
+  function step(dir) {
+    var list = index();
+    var i = current;
+    if (!list[i] || !onScreen(list[i])) {
+      // Nothing selected, or scrolled away from it: continue from what's on screen
+      i = firstOnScreen(list) - (dir > 0 ? 1 : 0);
+    }
+    do { i += dir; } while (i >= 0 && i < list.length && !shown(list[i]));
+    if (i < 0 || i >= list.length) return false;
+    select(i);
+    return true;
+  }
+
+  // --- COMMANDS ---
+  // Each returns whether it did anything; only then is the key kept from the page
+  function selected() { return index()[current] || null; }
+
+  function isStory(el) { return el && el.matches('tr.athing:not(.comtr)'); }
+
+  var nav = window.hnNav = {
+    next: function() { return step(1) || scroll(100); },
+    prev: function() { return step(-1) || scroll(-100); },
+    open: function() {
+      var link = isStory(selected()) && selected().querySelector('.titleline > a');
+      return !!link && send('open', link.href);
+    },
+    comments: function() {
+      return isStory(selected()) && send('open', HN_ITEM + selected().id);
+    },
+    collapse: function() {
+      var el = selected();
+      if (!el) return false;
+      if (el.tagName === 'DETAILS') { el.open = !el.open; return true; }
+      var toggle = el.querySelector('a.togg');
+      if (toggle) toggle.click();
+      return !!toggle;
+    }
+  };
+  var KEYS = {j: nav.next, k: nav.prev, o: nav.open, c: nav.comments, x: nav.collapse};
+
+  // Keys only on HN (and the reader); other sites keep their own single-key shortcuts
+  if (location.hostname === HN_HOST) document.addEventListener('keydown', function(e) {
+    var action = KEYS[e.key];
+    var t = e.target;
+    if (!action || e.defaultPrevented || e.ctrlKey || e.altKey || e.metaKey) return;
+    if (t && (t.isContentEditable || /^(INPUT|TEXTAREA|SELECT)$/.test(t.tagName))) return;
+    if (action()) e.preventDefault();
+  });
+
+  // Link and story under the pointer, pushed before Qt shows the context menu
+  document.addEventListener('contextmenu', function(e) {
+    var path = e.composedPath(), anchor = null;
+    for (var i = 0; i < Math.min(path.length, 5); i++) {
+      if (path[i].tagName === 'A' && path[i].href) { anchor = path[i]; break; }
+    }
+    var row = anchor && anchor.closest('.athing');
+    var story = row && row.id;
+    send('setContext', anchor ? anchor.href : '', story ? anchor.href : '', story ? HN_ITEM + row.id : '');
+  }, true);
+
+  document.addEventListener('DOMContentLoaded', function() {
+    var style = document.createElement('style');
+    style.textContent = STYLE;
+    document.head.appendChild(style);
+    new MutationObserver(observe).observe(document.body, {childList: true, subtree: true});
+  });
+})();
+"""
+
+
+def navigator_script():
+    """Profile-wide script: Qt's qwebchannel.js followed by the navigator, both in WORLD."""
+    f = QFile(QWEBCHANNEL_JS)
+    if not f.open(QIODevice.OpenModeFlag.ReadOnly):
+        logging.error(f"Navigator Error: cannot read {QWEBCHANNEL_JS}")
+        return None
+    source = bytes(f.readAll()).decode("utf-8")
+    f.close()
+    s = QWebEngineScript()
+    s.setName("StoryNavigator")
+    s.setSourceCode(source + NAVIGATOR_JS)
+    s.setWorldId(WORLD)
+    s.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+    s.setRunsOnSubFrames(False)
+    return s
+
+
+class NavigatorBridge(QObject):
+    """Python end of a page's web channel.
+
+    On HN pages the navigator handles j / k / o / c / x itself and only calls in
+    here when something has to happen outside the page (opening a tab), and
+    on right-click, so the context menu's actions already know the link and
+    story under the pointer instead of asking the page for them.
+    """
+
+    def __init__(self, view, page):
+        super().__init__(page)  # Goes with the page when the tab is disposed
+        self.view = view
+        self.context = {}  # link / article / comments under the last right-click
+
+    def clear(self):
+        # A new page's channel may not be up before the next right-click
+        self.context = {}
+
+    @pyqtSlot(str)
+    def open(self, url):
+        self.view.handle_open(url)
+
+    @pyqtSlot(str, str, str)
+    def setContext(self, link, article, comments):
+        self.context = {"link": link, "article": article, "comments": comments}
+
+
+def attach_navigator(view, page):
+    """Give page a web channel carrying view's bridge; returns the bridge."""
+    bridge = NavigatorBridge(view, page)
+    channel = QWebChannel(page)
+    channel.registerObject("hnStation", bridge)
+    page.setWebChannel(channel, WORLD)
+    page.loadStarted.connect(bridge.clear)
+    return bridge
@@ -0,0 +1,194 @@
+import os
+import time
+import uuid
+import zlib
+import shutil
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+
+MHTML = "multipart/related"
+HTML = "text/html"
+EXTENSIONS = {MHTML: ".mhtml", HTML: ".html"}
+
+
+class OfflineArchive:
+    """Content-addressed, compressed page snapshots for reading offline.
+
+    Each snapshot is stored once as blobs/<ab>/<sha256>.z (zlib) no matter how
+    many URLs point at it; index.db maps URL -> blob with title, HN item id
+    and sizes, so lookups are a primary-key hit. The archive is kept under
+    max_bytes (compressed) by evicting the least recently opened pages.
+    Opening a page inflates its blob once into open/, which later opens reuse.
+    """
+
+    def __init__(self, root, max_bytes=500 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.blob_dir = os.path.join(root, "blobs")
+        self.open_dir = os.path.join(root, "open")
+        self.tmp_dir = os.path.join(root, "tmp")
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def exists(self):
+        # Lets lookups on every tab open skip creating the archive until something is saved
+        return self.conn is not None or os.path.exists(os.path.join(self.root, "index.db"))
+
+    def _db(self):
+        if self.conn is None:
+            for d in (self.blob_dir, self.open_dir, self.tmp_dir):
+                os.makedirs(d, exist_ok=True)
+            self.conn = sqlite3.connect(os.path.join(self.root, "index.db"), check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    item_id INTEGER,
+                    title TEXT,
+                    digest TEXT NOT NULL,
+                    mime TEXT NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL,
+                    saved_at REAL NOT NULL,
+                    last_opened REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS pages_item ON pages(item_id);
+                CREATE INDEX IF NOT EXISTS pages_last_opened ON pages(last_opened);
+            """)
+        return self.conn
+
+    def temp_path(self, suffix=""):
+        """Scratch file path inside the archive (same filesystem, so os.replace stays atomic)."""
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        return os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}{suffix}")
+
+    def blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest + ".z")
+
+    # --- WRITES ---
+    def put(self, url, data, title="", item_id=None, mime=MHTML):
+        """Store data (bytes) for url, replacing any earlier snapshot. Returns the digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        with self.lock:
+            db = self._db()
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.tmp_dir, suffix=".z")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(zlib.compress(data, 6))
+                    os.replace(tmp, path)
+                except BaseException:
+                    try:
+                        os.remove(tmp)
+                    except OSError:
+                        pass
+                    raise
+            now = time.time()
+            old = db.execute("SELECT digest FROM pages WHERE url=?", (url,)).fetchone()
+            with db:
+                db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                           (url, item_id, title, digest, mime, len(data), os.path.getsize(path), now, now))
+            if old and old["digest"] != digest:
+                self._drop_blob_if_unused(db, old["digest"])
+            self._evict(db)
+        return digest
+
+    def put_file(self, url, path, title="", item_id=None, mime=MHTML):
+        with open(path, "rb") as f:
+            return self.put(url, f.read(), title, item_id, mime)
+
+    def remove(self, url):
+        with self.lock:
+            db = self._db()
+            row = db.execute("SELECT digest FROM pages WHERE url=?", (url,)).fetchone()
+            if row:
+                with db:
+                    db.execute("DELETE FROM pages WHERE url=?", (url,))
+                self._drop_blob_if_unused(db, row["digest"])
+
+    def _drop_blob_if_unused(self, db, digest):
+        if db.execute("SELECT 1 FROM pages WHERE digest=? LIMIT 1", (digest,)).fetchone():
+            return
+        for path in (self.blob_path(digest), *(os.path.join(self.open_dir, digest + ext) for ext in EXTENSIONS.values())):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.error(f"Offline Archive Delete Error: {e}")
+
+    def _evict(self, db):
+        if not self.max_bytes:
+            return
+        # Shared blobs are counted once
+        total = db.execute("SELECT COALESCE(SUM(s), 0) FROM (SELECT MAX(stored_size) s FROM pages GROUP BY digest)").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for row in db.execute("SELECT url, digest, stored_size FROM pages ORDER BY last_opened").fetchall():
+            if total <= self.max_bytes:
+                break
+            with db:
+                db.execute("DELETE FROM pages WHERE url=?", (row["url"],))
+            if not db.execute("SELECT 1 FROM pages WHERE digest=? LIMIT 1", (row["digest"],)).fetchone():
+                total -= row["stored_size"]
+            self._drop_blob_if_unused(db, row["digest"])
+            evicted += 1
+        logging.info(f"Offline archive: evicted {evicted} pages to stay under {self.max_bytes // (1024 * 1024)} MB")
+
+    # --- READS ---
+    def find(self, url):
+        if not self.exists():
+            return None
+        with self.lock:
+            row = self._db().execute("SELECT * FROM pages WHERE url=?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def for_item(self, item_id):
+        """Article and comment-thread snapshots saved for an HN item, newest first."""
+        with self.lock:
+            rows = self._db().execute("SELECT * FROM pages WHERE item_id=? ORDER BY saved_at DESC", (item_id,))
+            return [dict(r) for r in rows]
+
+    def open_path(self, url):
+        """Local path of the inflated snapshot for url (or None), marking it recently opened."""
+        if not self.exists():
+            return None
+        with self.lock:
+            db = self._db()
+            row = db.execute("SELECT digest, mime FROM pages WHERE url=?", (url,)).fetchone()
+            if not row:
+                return None
+            path = os.path.join(self.open_dir, row["digest"] + EXTENSIONS.get(row["mime"], ".bin"))
+            if not os.path.exists(path):
+                with open(self.blob_path(row["digest"]), "rb") as f:
+                    data = zlib.decompress(f.read())
+                fd, tmp = tempfile.mkstemp(dir=self.tmp_dir)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            with db:
+                db.execute("UPDATE pages SET last_opened=? WHERE url=?", (time.time(), url))
+        return path
+
+    def summary(self):
+        with self.lock:
+            count, raw, stored = self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM pages").fetchone()
+        return f"offline archive: {count} pages, {raw / (1024 * 1024):.1f} MB -> {stored / (1024 * 1024):.1f} MB compressed"
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+                # Inflated copies and half-finished saves are disposable
+                for d in (self.open_dir, self.tmp_dir):
+                    shutil.rmtree(d, ignore_errors=True)
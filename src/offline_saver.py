@@ -0,0 +1,80 @@
+import os
+import logging
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineDownloadRequest
+
+from src.offline_archive import HTML, MHTML
+from src.io_executor import DISK
+
+SaveFormat = QWebEngineDownloadRequest.SavePageFormat
+DownloadState = QWebEngineDownloadRequest.DownloadState
+
+
+class OfflineSaver(QObject):
+    """Snapshots pages into an OfflineArchive.
+
+    QWebEnginePage.save() writes an MHTML file (page plus its images and CSS)
+    via the profile's download machinery; once that download completes the
+    file is compressed into the archive on the I/O executor's disk lane so
+    big pages don't stall the UI.
+    """
+    saved = pyqtSignal(str, str, int, int)  # url, title, raw bytes, stored bytes
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, profile, archive, io, parent=None):
+        super().__init__(parent)
+        self.archive = archive
+        self.io = io
+        self.pending = {}  # temp file path -> (url, title, item id)
+        profile.downloadRequested.connect(self.on_download)
+
+    def snapshot(self, view, url, item_id=None):
+        path = self.archive.temp_path(".mhtml")
+        self.pending[os.path.normcase(path)] = (url, view.page_title(), item_id)
+        view.page().save(path, SaveFormat.MimeHtmlSaveFormat)
+
+    def store_html(self, url, html, title="", item_id=None):
+        # Already-fetched HTML (e.g. a prefetched comment page): no page save needed
+        self.store(url, lambda: self.archive.put(url, html.encode("utf-8"), title, item_id, HTML), title)
+
+    def on_download(self, request):
+        if not request.isSavePageDownload():
+            return
+        path = os.path.normcase(os.path.join(request.downloadDirectory(), request.downloadFileName()))
+        if path not in self.pending:
+            return
+        request.isFinishedChanged.connect(lambda: self.on_finished(request, path))
+
+    def on_finished(self, request, path):
+        url, title, item_id = self.pending.pop(path, (None, "", None))
+        if url is None:
+            return
+        if request.state() != DownloadState.DownloadCompleted:
+            self.failed.emit(url, request.interruptReasonString() or "save cancelled")
+            return
+
+        def put():
+            try:
+                return self.archive.put_file(url, path, title, item_id, MHTML)
+            finally:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        self.store(url, put, title)
+
+    def store(self, url, put, title):
+        def run():
+            digest = put()
+            return digest, self.archive.find(url)
+
+        def done(result):
+            digest, row = result
+            logging.info(f"Saved offline copy of {url} ({digest[:12]})")
+            self.saved.emit(url, title, row["raw_size"], row["stored_size"])
+
+        def fail(e):
+            logging.error(f"Offline Save Error for {url}: {e}")
+            self.failed.emit(url, str(e))
+        self.io.submit(DISK, run, on_done=done, on_error=fail)
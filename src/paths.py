@@ -0,0 +1,27 @@
+import os
+import sys
+
+APP_NAME = "HN Station"
+
+
+def get_base_path():
+    if getattr(sys, 'frozen', False):
+        return sys._MEIPASS
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_user_data_path():
+    # %LOCALAPPDATA% on Windows; the XDG data folder elsewhere (e.g. a headless curator on a server)
+    base_path = os.getenv('LOCALAPPDATA') or os.getenv('XDG_DATA_HOME') or os.path.join(os.path.expanduser("~"), ".local", "share")
+    app_path = os.path.join(base_path, APP_NAME)
+    if not os.path.exists(app_path):
+        os.makedirs(app_path)
+    return app_path
+
+
+def get_asset_path(filename):
+    return os.path.join(get_base_path(), "assets", filename)
+
+
+def get_data_path(filename):
+    return os.path.join(get_user_data_path(), filename)
@@ -0,0 +1,115 @@
+import json
+import time
+import statistics
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
+
+from PyQt6.QtCore import QObject
+
+from src.prefetch import HN_HOST
+
+# Chromium closes a preconnected socket that goes unused for ~10 s, so an origin can be re-warmed after that
+COOLDOWN_S = 10
+FRONT_PAGE_STORIES = 3  # Top stories warmed as soon as the front page has loaded
+MAX_HINTED = 500
+SAMPLES = 200
+# Resource hints go into the HN page itself: every tab shares the profile's network
+# context, so the socket they open is reused by the tab that opens the article
+PRECONNECT_JS = """
+(function(origins) {
+  origins.forEach(function(origin) {
+    ['dns-prefetch', 'preconnect'].forEach(function(rel) {
+      var link = document.createElement('link');
+      link.rel = rel;
+      link.href = origin;
+      document.head.appendChild(link);
+    });
+  });
+})(%s);
+"""
+
+
+def origin_of(url):
+    """scheme://host[:port] of an http(s) URL off HN, else None (HN itself is always warm)."""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.hostname or parts.hostname.endswith(HN_HOST):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class Preconnector(QObject):
+    """Speculative DNS + TCP + TLS warm-up for story links on HN pages.
+
+    Hovering a link, or the front page finishing its load, injects
+    preconnect / dns-prefetch hints for the target origins. Each origin is
+    hinted at most once per cooldown and at most max_warm origins are warm
+    at a time, so a sweep across the list doesn't open dozens of sockets.
+    observe() takes the navigation timing LoadMetrics records for each page
+    load and splits connection setup time by whether the origin had been
+    warmed, which is what the summary's "saved" figure is based on.
+    """
+
+    def __init__(self, parent=None, max_warm=6, cooldown=COOLDOWN_S):
+        super().__init__(parent)
+        self.max_warm = max_warm
+        self.cooldown = cooldown
+        self.warm = {}  # origin -> when it was hinted, while inside the cooldown
+        self.hinted = OrderedDict()  # origin -> last hint, kept longer for observe()
+        self.setup_ms = {"warm": deque(maxlen=SAMPLES), "cold": deque(maxlen=SAMPLES)}
+        self.stats = {"hover": 0, "list": 0, "cooldown": 0, "capped": 0}
+
+    def hover(self, page, url):
+        if url and page.url().host() == HN_HOST:
+            self.warm_up(page, [url], "hover")
+
+    def front_page(self, page, urls):
+        self.warm_up(page, urls[:FRONT_PAGE_STORIES], "list")
+
+    def warm_up(self, page, urls, reason):
+        if not self.max_warm:
+            return
+        now = time.monotonic()
+        self.warm = {o: t for o, t in self.warm.items() if now - t < self.cooldown}
+        origins = []
+        for url in urls:
+            origin = origin_of(url)
+            if not origin or origin in origins:
+                continue
+            if origin in self.warm:
+                self.stats["cooldown"] += 1
+                continue
+            if len(self.warm) >= self.max_warm:
+                self.stats["capped"] += 1
+                break
+            self.warm[origin] = now
+            self.hinted[origin] = now
+            self.hinted.move_to_end(origin)
+            origins.append(origin)
+        while len(self.hinted) > MAX_HINTED:
+            self.hinted.popitem(last=False)
+        if origins:
+            self.stats[reason] += len(origins)
+            page.runJavaScript(PRECONNECT_JS % json.dumps(origins))
+
+    # --- METRICS ---
+    def observe(self, record):
+        """LoadMetrics record with navigation timing: file its connection setup under warm or cold."""
+        nav = record.get("nav") or {}
+        origin = origin_of(record["url"])
+        if not origin or nav.get("type") != "navigate" or nav.get("setup") is None:
+            return
+        started = time.monotonic() - record["ms"] / 1000
+        hinted = self.hinted.get(origin)
+        warm = hinted is not None and 0 <= started - hinted < self.cooldown
+        self.setup_ms["warm" if warm else "cold"].append(nav["setup"])
+
+    def summary(self):
+        s = self.stats
+        text = (f"preconnect: {s['hover']} hover + {s['list']} front-page hints, "
+                f"{s['cooldown']} skipped (cooldown), {s['capped']} over the cap")
+        warm, cold = self.setup_ms["warm"], self.setup_ms["cold"]
+        if warm and cold:
+            saved = statistics.median(cold) - statistics.median(warm)
+            text += (f"; connection setup median {statistics.median(warm):.0f} ms warm ({len(warm)}) vs "
+                     f"{statistics.median(cold):.0f} ms cold ({len(cold)}), ~{saved:.0f} ms saved per warmed load")
+        return text
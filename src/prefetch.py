@@ -0,0 +1,214 @@
+import time
+import queue
+import logging
+import threading
+import itertools
+import urllib.request
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs
+
+from PyQt6.QtCore import QObject
+
+HN_HOST = "news.ycombinator.com"
+HN_ITEM_URL = "https://news.ycombinator.com/item?id={}"
+# QWebEnginePage.setHtml() silently refuses documents over 2 MB
+MAX_INLINE_HTML = 1_900_000
+
+PRIORITY_HOVER = 0
+PRIORITY_LIST = 10
+MAX_QUEUED = 60  # Jobs waiting for a worker; past this, new requests are dropped
+MAX_HOVERS = 3  # Hover jobs waiting for a worker; older ones go stale as the pointer moves on
+
+
+def item_id_from_url(url):
+    """HN item id for a news.ycombinator.com/item?id=... URL, else None."""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    if not parts.netloc.endswith(HN_HOST) or parts.path != "/item":
+        return None
+    try:
+        return int(parse_qs(parts.query).get("id", [""])[0])
+    except ValueError:
+        return None
+
+
+class CommentPrefetcher(QObject):
+    """Warms HN comment pages in the background so a 💬 tab can render from memory.
+
+    Pages are fetched with the profile's HN cookies (so vote/reply links are
+    the logged-in ones) on a couple of worker threads that share the app's HN
+    token bucket, and kept in a small LRU with a TTL. `take()` hands a warm
+    page to a new tab, which loads it with setHtml() instead of a network hit.
+    Only the last few hovered links are kept queued, so sweeping the pointer
+    down a long list doesn't turn into a fetch per row.
+    Nothing runs until `start()`, so startup can defer it past first paint.
+    """
+
+    def __init__(self, profile, bucket, max_entries=30, ttl=300, workers=2):
+        super().__init__()
+        self.bucket = bucket
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.user_agent = profile.httpUserAgent()
+        self.cookies = {}
+        self.cache = OrderedDict()  # item id -> (html, fetched_at)
+        self.queued = set()
+        self.hovers = OrderedDict()  # seq -> item id, hover jobs not yet picked up
+        self.cancelled = set()  # seqs of stale hover jobs, skipped by the workers
+        self.lock = threading.Lock()
+        self.jobs = queue.PriorityQueue()
+        self.seq = itertools.count()
+        self.stats = {"queued": 0, "fetched": 0, "hits": 0, "misses": 0, "wasted": 0, "failed": 0,
+                      "dropped": 0}
+        self.story_links = {}  # article URL -> item id, from the last front-page scan
+        self.profile = profile
+        self.running = False
+        self.workers = workers
+
+    def start(self):
+        """Load cookies and start the workers. Jobs queued before this simply wait."""
+        if self.running:
+            return
+        store = self.profile.cookieStore()
+        store.cookieAdded.connect(self.cookie_added)
+        store.cookieRemoved.connect(self.cookie_removed)
+        store.loadAllCookies()
+
+        self.running = True
+        for n in range(self.workers):
+            threading.Thread(target=self.worker, name=f"hn-prefetch-{n}", daemon=True).start()
+
+    # --- COOKIES (GUI thread) ---
+    def cookie_added(self, cookie):
+        if cookie.domain().lstrip(".").endswith("ycombinator.com"):
+            with self.lock:
+                self.cookies[bytes(cookie.name()).decode()] = bytes(cookie.value()).decode()
+
+    def cookie_removed(self, cookie):
+        if cookie.domain().lstrip(".").endswith("ycombinator.com"):
+            with self.lock:
+                self.cookies.pop(bytes(cookie.name()).decode(), None)
+
+    # --- QUEUEING ---
+    def prefetch(self, ids, priority=PRIORITY_LIST):
+        now = time.time()
+        with self.lock:
+            for rank, item_id in enumerate(ids):
+                self._enqueue(item_id, priority + rank, now)
+
+    def prefetch_url(self, url, priority=PRIORITY_HOVER):
+        item_id = item_id_from_url(url) or self.story_links.get(url)
+        if not item_id:
+            return
+        with self.lock:
+            seq = self._enqueue(item_id, priority, time.time())
+            if seq is None:
+                return
+            self.hovers[seq] = item_id
+            while len(self.hovers) > MAX_HOVERS:
+                stale_seq, stale_id = self.hovers.popitem(last=False)
+                self.cancelled.add(stale_seq)
+                self.queued.discard(stale_id)
+                self.stats["dropped"] += 1
+
+    def _enqueue(self, item_id, priority, now):
+        """Queue item_id unless it's queued, warm or over the cap; returns its seq or None. Hold the lock."""
+        if not item_id or item_id in self.queued:
+            return None
+        cached = self.cache.get(item_id)
+        if cached and now - cached[1] < self.ttl:
+            return None
+        if len(self.queued) >= MAX_QUEUED:
+            self.stats["dropped"] += 1
+            return None
+        seq = next(self.seq)
+        self.queued.add(item_id)
+        self.stats["queued"] += 1
+        self.jobs.put((priority, seq, item_id))
+        return seq
+
+    def remember_story_links(self, rows):
+        """rows: [[item id, article href], ...] from the front-page scan."""
+        self.story_links = {href: int(item_id) for item_id, href in rows if href}
+
+    # --- WORKERS ---
+    def worker(self):
+        while self.running:
+            _, seq, item_id = self.jobs.get()
+            if item_id is None:
+                return
+            with self.lock:
+                self.hovers.pop(seq, None)
+                if seq in self.cancelled:
+                    self.cancelled.discard(seq)
+                    continue
+            self.bucket.acquire()
+            with self.lock:
+                cookie = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            req = urllib.request.Request(HN_ITEM_URL.format(item_id), headers={"User-Agent": self.user_agent})
+            if cookie:
+                req.add_header("Cookie", cookie)
+            try:
+                with urllib.request.urlopen(req, timeout=15) as resp:
+                    html = resp.read().decode("utf-8", errors="replace")
+            except Exception as e:
+                logging.warning(f"Prefetch failed for item {item_id}: {e}")
+                with self.lock:
+                    self.queued.discard(item_id)
+                    self.stats["failed"] += 1
+                continue
+
+            with self.lock:
+                self.queued.discard(item_id)
+                if len(html.encode("utf-8")) > MAX_INLINE_HTML:
+                    # Too big for setHtml(); the tab will load normally
+                    self.stats["failed"] += 1
+                    continue
+                self.cache[item_id] = (html, time.time())
+                self.cache.move_to_end(item_id)
+                self.stats["fetched"] += 1
+                while len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
+                    self.stats["wasted"] += 1
+
+    # --- CONSUMING (GUI thread) ---
+    def take(self, item_id):
+        """Warm HTML for item_id (removed from the cache), or None."""
+        if not item_id:
+            return None
+        with self.lock:
+            entry = self.cache.pop(item_id, None)
+            if entry and time.time() - entry[1] < self.ttl:
+                self.stats["hits"] += 1
+                return entry[0]
+            if entry:
+                self.stats["wasted"] += 1
+            self.stats["misses"] += 1
+        return None
+
+    def peek(self, item_id):
+        """Warm HTML for item_id without consuming it (not counted as a hit)."""
+        with self.lock:
+            entry = self.cache.get(item_id)
+        return entry[0] if entry and time.time() - entry[1] < self.ttl else None
+
+    def is_warm(self, item_id):
+        with self.lock:
+            entry = self.cache.get(item_id)
+        return bool(entry) and time.time() - entry[1] < self.ttl
+
+    def summary(self):
+        s = self.stats
+        return (f"prefetch: {s['hits']} hits, {s['misses']} misses, {s['wasted']} wasted, "
+                f"{s['fetched']} fetched, {s['failed']} failed, {s['dropped']} dropped")
+
+    def shutdown(self):
+        started, self.running = self.running, False
+        with self.lock:
+            # Anything still cached was fetched for nothing
+            self.stats["wasted"] += len(self.cache)
+            self.cache.clear()
+        if started:
+            for _ in range(self.workers):
+                self.jobs.put((-1, next(self.seq), None))
@@ -0,0 +1,60 @@
+import logging
+from collections import deque
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.load_scheduler import PRIORITY_PRELOAD
+
+
+class TabPreloader(QObject):
+    """Loads placeholder tabs in the background, at most `concurrency` at a time.
+
+    Session restore creates every tab as an unloaded placeholder; this walks a
+    bounded number of them afterwards so the next few tabs are warm without
+    50 pages racing the one the user is looking at.
+    """
+
+    def __init__(self, main_window, concurrency=2, limit=6, start_delay_ms=1500, slot_timeout_ms=15000):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.concurrency = max(0, concurrency)
+        self.limit = max(0, limit)
+        self.start_delay_ms = start_delay_ms
+        self.slot_timeout_ms = slot_timeout_ms
+        self.queue = deque()
+        self.in_flight = set()
+        self.started = 0
+
+    def schedule(self, views):
+        if not self.concurrency or not self.limit:
+            return
+        for view in views:
+            if len(self.queue) + self.started >= self.limit:
+                break
+            self.queue.append(view)
+        QTimer.singleShot(self.start_delay_ms, self.pump)
+
+    def pump(self):
+        while self.queue and len(self.in_flight) < self.concurrency:
+            view = self.queue.popleft()
+            # Already activated (and therefore loaded) by the user, or closed meanwhile
+            if view.pending_url is None or not self.main_window.is_open(view):
+                continue
+            self.in_flight.add(view)
+            self.started += 1
+
+            def done(_ok=True, v=view):
+                if v not in self.in_flight:
+                    return
+                self.in_flight.discard(v)
+                try:
+                    v.loadFinished.disconnect(done)
+                except (TypeError, RuntimeError):
+                    pass
+                self.pump()
+            view.loadFinished.connect(done)
+            # A stalled or closed tab must not hold its slot forever
+            QTimer.singleShot(self.slot_timeout_ms, done)
+            view.ensure_loaded(PRIORITY_PRELOAD)
+        if not self.queue and not self.in_flight and self.started:
+            logging.info(f"Session preload finished ({self.started} tabs warmed)")
@@ -0,0 +1,224 @@
+import json
+import time
+import logging
+import threading
+
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+
+from src.prefetch import item_id_from_url
+
+BATCH_SIZE = 100
+
+READER_SHELL = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>💬 Loading thread...</title>
+<style>
+  body { background: #f6f6ef; font: 10pt Verdana, Geneva, sans-serif; color: #000; margin: 12px 18px; }
+  a { color: #000; } a:visited { color: #828282; }
+  #story h1 { font-size: 12pt; font-weight: normal; margin: 0 0 4px; }
+  #story .meta, summary { color: #828282; font-size: 8pt; }
+  #story .text { margin-top: 8px; }
+  #status { color: #828282; font-size: 8pt; margin: 10px 0; }
+  details { margin: 6px 0 0; content-visibility: auto; contain-intrinsic-size: auto 60px; }
+  summary { cursor: pointer; list-style: none; }
+  summary::before { content: "[–] "; }
+  details:not([open]) > summary::before { content: "[+] "; }
+  .text { margin: 2px 0 0 0; line-height: 1.35; overflow-wrap: anywhere; }
+  .text p { margin: 6px 0 0; }
+  .kids { margin-left: 28px; }
+  .dead > summary, .dead > .text { color: #aaa; }
+</style></head>
+<body>
+<div id="story"></div>
+<div id="status">Loading comments…</div>
+<div id="c0" class="root"><div class="kids"></div></div>
+<script>
+window.hnReader = {
+  count: 0,
+  container: function(parentId) {
+    var p = document.getElementById('c' + parentId);
+    return p ? p.querySelector(':scope > .kids') : document.querySelector('#c0 > .kids');
+  },
+  story: function(s) {
+    document.title = '💬 ' + (s.title || 'Thread');
+    var el = document.getElementById('story');
+    var h = document.createElement('h1');
+    var a = document.createElement('a');
+    a.href = s.url || ('https://news.ycombinator.com/item?id=' + s.id);
+    a.textContent = s.title || '';
+    h.appendChild(a);
+    var meta = document.createElement('div');
+    meta.className = 'meta';
+    meta.textContent = (s.score || 0) + ' points by ' + (s.by || '?') + ' | ' + (s.descendants || 0) + ' comments';
+    el.appendChild(h); el.appendChild(meta);
+    if (s.text) { var t = document.createElement('div'); t.className = 'text'; t.innerHTML = s.text; el.appendChild(t); }
+  },
+  add: function(batch) {
+    for (var i = 0; i < batch.length; i++) {
+      var c = batch[i];
+      var d = document.createElement('details');
+      d.open = true; d.id = 'c' + c.id;
+      if (c.dead) d.className = 'dead';
+      var s = document.createElement('summary');
+      s.textContent = (c.by || '[deleted]') + ' · ' + c.age + (c.kids ? ' · ' + c.kids + ' replies' : '');
+      var t = document.createElement('div');
+      t.className = 'text';
+      t.innerHTML = c.text || '';
+      var k = document.createElement('div');
+      k.className = 'kids';
+      d.appendChild(s); d.appendChild(t); d.appendChild(k);
+      // Batches arrive level by level, so a comment's parent is always already in the DOM
+      this.container(c.parent).appendChild(d);
+    }
+    this.count += batch.length;
+    document.getElementById('status').textContent = this.count + ' comments loaded…';
+  },
+  done: function(total, ms) {
+    document.getElementById('status').textContent = total + ' comments · loaded in ' + ms + ' ms';
+  }
+};
+</script>
+</body></html>
+"""
+
+
+def age_label(ts):
+    if not ts:
+        return ""
+    delta = max(0, time.time() - ts)
+    for unit, seconds in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if delta >= seconds:
+            n = int(delta // seconds)
+            return f"{n} {unit}{'s' if n != 1 else ''} ago"
+    return "just now"
+
+
+class ThreadLoader(QObject):
+    """Walks a comment tree breadth-first off the GUI thread and streams it out in batches.
+
+    Each level is fetched concurrently (HNFetcher) through the item cache;
+    only the current frontier of ids is held in memory, everything else is
+    handed to the view as soon as it arrives.
+    """
+    story_ready = pyqtSignal(dict)
+    batch_ready = pyqtSignal(list)
+    finished = pyqtSignal(int, int)
+
+    def __init__(self, item_id, fetcher, cache, max_comments=10_000):
+        super().__init__()
+        self.item_id = item_id
+        self.fetcher = fetcher
+        self.cache = cache
+        self.max_comments = max_comments
+        self.cancelled = False
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name=f"reader-{self.item_id}", daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def join(self, timeout=None):
+        # A cancelled walk stops after the batch it's fetching
+        if self.thread:
+            self.thread.join(timeout)
+
+    def run(self):
+        started = time.perf_counter()
+        total = 0
+        try:
+            story = self.cache.fetch_items(self.fetcher, [self.item_id]).get(self.item_id)
+            if not story:
+                self.finished.emit(0, 0)
+                return
+            self.story_ready.emit(story)
+
+            frontier = [(kid, self.item_id) for kid in story.get("kids", [])]
+            while frontier and not self.cancelled and total < self.max_comments:
+                next_level = []
+                for start in range(0, len(frontier), BATCH_SIZE):
+                    if self.cancelled or total >= self.max_comments:
+                        break
+                    chunk = frontier[start:start + BATCH_SIZE]
+                    items = self.cache.fetch_items(self.fetcher, [cid for cid, _ in chunk])
+                    batch = []
+                    for cid, parent in chunk:
+                        c = items.get(cid)
+                        if not c:
+                            continue
+                        kids = c.get("kids", [])
+                        # Deleted leaves carry nothing worth showing
+                        if (c.get("deleted") or c.get("dead")) and not kids:
+                            continue
+                        batch.append({
+                            "id": cid, "parent": parent, "by": c.get("by"),
+                            "text": c.get("text", "[deleted]" if c.get("deleted") else ""),
+                            "age": age_label(c.get("time")), "kids": len(kids),
+                            "dead": bool(c.get("dead") or c.get("deleted")),
+                        })
+                        next_level.extend((k, cid) for k in kids)
+                    if batch:
+                        total += len(batch)
+                        self.batch_ready.emit(batch)
+                frontier = next_level
+        except Exception as e:
+            logging.error(f"Reader Error for item {self.item_id}: {e}")
+        self.finished.emit(total, int((time.perf_counter() - started) * 1000))
+
+
+class ReaderSession(QObject):
+    """Binds a ThreadLoader to an HNView rendering READER_SHELL.
+
+    Batches that arrive before the shell has finished loading are queued and
+    flushed on loadFinished.
+    """
+
+    def __init__(self, view, item_id, fetcher, cache):
+        super().__init__(view)
+        self.view = view
+        self.item_id = item_id
+        self.ready = False
+        self.pending = []
+        self.opened = time.perf_counter()
+        self.first_batch_ms = None
+
+        self.loader = ThreadLoader(item_id, fetcher, cache)
+        self.loader.story_ready.connect(lambda s: self.call("story", s))
+        self.loader.batch_ready.connect(self.on_batch)
+        self.loader.finished.connect(self.on_finished)
+        view.loadFinished.connect(self.on_shell_loaded)
+        view.urlChanged.connect(self.on_url_changed)
+        view.destroyed.connect(self.loader.cancel)
+
+        view.setHtml(READER_SHELL, QUrl(f"https://news.ycombinator.com/item?id={item_id}"))
+        self.loader.start()
+
+    def call(self, fn, *args):
+        js = f"window.hnReader && hnReader.{fn}({', '.join(json.dumps(a) for a in args)});"
+        if self.ready:
+            self.view.page().runJavaScript(js)
+        else:
+            self.pending.append(js)
+
+    def on_url_changed(self, qurl):
+        # Navigated away from the reader page: stop fetching for it
+        if item_id_from_url(qurl.toString()) != self.item_id:
+            self.loader.cancel()
+
+    def on_shell_loaded(self, ok):
+        self.view.loadFinished.disconnect(self.on_shell_loaded)
+        self.ready = True
+        for js in self.pending:
+            self.view.page().runJavaScript(js)
+        self.pending = []
+
+    def on_batch(self, batch):
+        if self.first_batch_ms is None:
+            self.first_batch_ms = int((time.perf_counter() - self.opened) * 1000)
+        self.call("add", batch)
+
+    def on_finished(self, total, ms):
+        self.call("done", total, ms)
+        logging.info(f"Reader item {self.item_id}: first comments after {self.first_batch_ms} ms, "
+                     f"{total} comments in {ms} ms")
@@ -0,0 +1,192 @@
+import re
+import time
+import queue
+import sqlite3
+import logging
+import threading
+
+BATCH_SIZE = 500
+BATCH_WINDOW = 0.25  # s: documents arriving this close together share one transaction
+MAX_BODY = 20_000    # chars of article text kept per document
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL DEFAULT '',
+    item_id INTEGER,
+    source TEXT NOT NULL DEFAULT 'visit',
+    visits INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_last_seen ON docs(last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    title, url, body,
+    content='docs', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS docs_ai AFTER INSERT ON docs BEGIN
+    INSERT INTO docs_fts(rowid, title, url, body) VALUES (new.id, new.title, new.url, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_ad AFTER DELETE ON docs BEGIN
+    INSERT INTO docs_fts(docs_fts, rowid, title, url, body) VALUES ('delete', old.id, old.title, old.url, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_au AFTER UPDATE ON docs
+WHEN old.title IS NOT new.title OR old.body IS NOT new.body BEGIN
+    INSERT INTO docs_fts(docs_fts, rowid, title, url, body) VALUES ('delete', old.id, old.title, old.url, old.body);
+    INSERT INTO docs_fts(rowid, title, url, body) VALUES (new.id, new.title, new.url, new.body);
+END;
+"""
+
+# A revisit only bumps counters; text is replaced when the new copy has some
+UPSERT = """
+INSERT INTO docs (url, title, body, item_id, source, visits, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    title = CASE WHEN excluded.title != '' THEN excluded.title ELSE docs.title END,
+    body = CASE WHEN excluded.body != '' THEN excluded.body ELSE docs.body END,
+    item_id = COALESCE(excluded.item_id, docs.item_id),
+    visits = docs.visits + excluded.visits,
+    last_seen = MAX(docs.last_seen, excluded.last_seen)
+"""
+
+# The CANDIDATES most recently seen matches, so a page visited again today competes
+# with today's pages whenever it was first indexed. The FTS subquery only collects
+# matching rowids (no scoring) and bm25 is computed for the candidates alone. The
+# unary + keeps "rowid IN recent" away from FTS5, which would otherwise re-run the
+# whole MATCH once per candidate rowid (~100 ms instead of a few over 100k docs).
+CANDIDATES = 200
+SEARCH = """
+WITH recent AS (
+    SELECT id FROM docs WHERE id IN (SELECT rowid FROM docs_fts WHERE docs_fts MATCH ?1)
+    ORDER BY last_seen DESC LIMIT ?2
+)
+SELECT d.url, d.title, d.item_id, d.source, d.visits, d.last_seen, f.score
+FROM (SELECT rowid, bm25(docs_fts, 10.0, 3.0, 1.0) AS score FROM docs_fts
+      WHERE docs_fts MATCH ?1 AND +rowid IN recent) f
+JOIN docs d ON d.id = f.rowid
+"""
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(text):
+    """Free text -> FTS5 query: every word must match, words of 2+ chars as prefixes."""
+    terms = []
+    for token in TOKEN_RE.findall(text.lower()):
+        # Quoted, so words like AND / NEAR or stray operators can't break the query
+        terms.append(f'"{token}"*' if len(token) >= 2 else f'"{token}"')
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """SQLite FTS5 index over visited pages and curated stories.
+
+    add()/add_many() only enqueue; a single writer thread drains the queue in
+    batches (one transaction per BATCH_WINDOW), so the GUI thread never waits
+    on disk. search() runs on its own read connection, which WAL mode lets
+    proceed while the writer commits.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.jobs = queue.Queue()
+        self.read_conn = None
+        self.read_lock = threading.Lock()
+        self.stats = {"indexed": 0, "batches": 0}
+        self.writer = threading.Thread(target=self.write_loop, name="search-index", daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # --- WRITES (any thread) ---
+    def add(self, url, title="", body="", item_id=None, source="visit", visit=True):
+        if not url or url.startswith(("about:", "data:", "file:")):
+            return
+        self.jobs.put((url, title or "", (body or "")[:MAX_BODY], item_id, source, 1 if visit else 0, time.time()))
+
+    def add_many(self, docs, source="curated"):
+        """docs: dicts with url, title and optionally body / id (HN item id)."""
+        for d in docs:
+            self.add(d.get("url"), d.get("title"), d.get("body", ""), d.get("id"), source, visit=False)
+
+    def write_loop(self):
+        try:
+            conn = self.connect()
+            conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            logging.error(f"Search Index Error: {e}")
+            return
+        stop = False
+        while not stop:
+            job = self.jobs.get()
+            batch = {}
+            deadline = time.monotonic() + BATCH_WINDOW
+            while True:
+                if job is None:
+                    stop = True
+                    break
+                # Same URL twice in one batch (title updates while loading): keep the last, sum the visits
+                prev = batch.get(job[0])
+                if prev:
+                    job = job[:5] + (prev[5] + job[5], job[6])
+                batch[job[0]] = job
+                if len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    job = self.jobs.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            try:
+                with conn:
+                    conn.executemany(UPSERT, list(batch.values()))
+                self.stats["indexed"] += len(batch)
+                self.stats["batches"] += 1
+            except sqlite3.Error as e:
+                logging.error(f"Search Index Write Error: {e}")
+        conn.close()
+
+    # --- READS ---
+    def reader(self):
+        # Caller holds read_lock
+        if self.read_conn is None:
+            self.read_conn = self.connect()
+            self.read_conn.row_factory = sqlite3.Row
+        return self.read_conn
+
+    def search(self, text, limit=8):
+        query = fts_query(text)
+        if not query:
+            return []
+        with self.read_lock:
+            try:
+                rows = [dict(r) for r in self.reader().execute(SEARCH, (query, CANDIDATES))]
+            except sqlite3.Error as e:
+                # Index not created yet (writer still starting) or a malformed query
+                logging.debug(f"Search Index Query Error: {e}")
+                return []
+        # bm25 is negative (lower is better): title matches weigh most, frequent visits nudge up
+        rows.sort(key=lambda r: r["score"] - min(r["visits"], 20) * 0.05)
+        return rows[:limit]
+
+    def count(self):
+        with self.read_lock:
+            try:
+                return self.reader().execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+            except sqlite3.Error:
+                return 0
+
+    def close(self, timeout=5):
+        """Flush what's queued and stop the writer."""
+        self.jobs.put(None)
+        self.writer.join(timeout)
+        with self.read_lock:
+            if self.read_conn is not None:
+                self.read_conn.close()
+                self.read_conn = None
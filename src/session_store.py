@@ -0,0 +1,56 @@
+import os
+import errno
+import json
+import logging
+import tempfile
+
+
+def backup_path(path, n):
+    return f"{path}.{n}"
+
+
+def atomic_write_json(path, data, backups=2):
+    """Write JSON via temp file + rename so a crash never leaves a truncated file.
+
+    The previous `backups` versions are kept as path.1 (newest) .. path.N.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        if backups and os.path.exists(path):
+            for n in range(backups, 1, -1):
+                if os.path.exists(backup_path(path, n - 1)):
+                    os.replace(backup_path(path, n - 1), backup_path(path, n))
+            os.replace(path, backup_path(path, 1))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def read_json_with_backups(path, backups=2):
+    """Load path, falling back to the newest readable backup. Raises FileNotFoundError if none exist."""
+    candidates = [path] + [backup_path(path, n) for n in range(1, backups + 1)]
+    found = False
+    for candidate in candidates:
+        try:
+            with open(candidate, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if candidate != path:
+                logging.warning(f"Recovered session from backup {os.path.basename(candidate)}")
+            return data
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            found = True
+            logging.error(f"Unreadable session file {os.path.basename(candidate)}: {e}")
+    if found:
+        raise ValueError(f"No readable copy of {path}")
+    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
@@ -0,0 +1,45 @@
+import json
+import logging
+
+from src.paths import get_data_path
+
+# Edit settings.json in the user data folder to override; missing keys fall back to these.
+DEFAULT_SETTINGS = {
+    "max_live_tabs": 12,            # Background tabs beyond this are hibernated (0 = no cap)
+    "hibernate_after_minutes": 15,  # Hibernate background tabs idle this long (0 = never)
+    "restore_preload_tabs": 6,      # Restored tabs loaded in the background after startup (0 = only on click)
+    "restore_preload_concurrency": 2,
+    "prefetch_top_stories": 10,     # Comment pages warmed from the HN front page (0 = off)
+    "hn_requests_per_second": 0.5,  # Shared budget for background requests to news.ycombinator.com
+    "reader_mode": False,           # Open comment threads in the built-in reader instead of the HN page
+    "hn_concurrent_loads": 2,       # Background tab loads in flight against news.ycombinator.com
+    "load_retries": 3,              # Retries (with backoff) for a failed tab load; dead hosts are never retried
+    "offline_archive_mb": 500,      # Saved-for-offline pages beyond this (compressed) are evicted, least recently read first
+    "index_article_text": False,    # Also index the text of visited articles for URL-bar search (bigger search.db)
+    "preconnect_max_hosts": 6,      # Article hosts warmed (DNS + TLS) from hovered / top links at a time (0 = off)
+    "content_blocking": True,       # Block ads/trackers using assets/filters.txt plus filters.txt in the user data folder
+    "vertical_tabs": False,         # Tab list as a panel on the left, grouped by thread (for hundreds of tabs)
+    "stall_warn_ms": 250,           # Log a warning whenever the UI event loop is blocked this long (0 = off)
+    # Curator (python main.py curate): watch terms, HN lists to poll, and how often the daemon runs
+    "curator_keywords": [],
+    "curator_feeds": ["top"],
+    "curator_interval_minutes": 15,
+}
+
+
+def load_settings(path=None):
+    """settings.json (the app data folder's unless path is given) over DEFAULT_SETTINGS; written out if missing."""
+    settings = dict(DEFAULT_SETTINGS)
+    path = path or get_data_path("settings.json")
+    try:
+        with open(path, "r") as f:
+            settings.update(json.load(f))
+    except FileNotFoundError:
+        try:
+            with open(path, "w") as f:
+                json.dump(DEFAULT_SETTINGS, f, indent=2)
+        except OSError as e:
+            logging.error(f"Settings Write Error: {e}")
+    except Exception as e:
+        logging.error(f"Settings Load Error: {e}")
+    return settings
@@ -0,0 +1,60 @@
+import os
+import json
+import time
+import logging
+from datetime import datetime
+
+# Deliberately Qt-free: main.py imports this before PyQt6 so the import phase itself can be timed.
+
+
+class StartupProfiler:
+    """Records named startup phases as milliseconds since process start.
+
+    Marks are always kept (they cost a perf_counter call); the structured
+    record is only written out with --profile-startup. Each run appends one
+    JSON line to startup_profile.jsonl so cold and warm launches can be
+    compared over time.
+    """
+
+    def __init__(self, enabled=False, started=None):
+        self.enabled = enabled
+        self.started = started if started is not None else time.perf_counter()
+        self.phases = []  # (name, ms since start)
+        self.seen = set()
+
+    def mark(self, name, at=None):
+        """at: a perf_counter() value taken earlier, for phases timed before logging existed."""
+        # First occurrence wins: phases like first_paint fire repeatedly
+        if name in self.seen:
+            return
+        self.seen.add(name)
+        elapsed = ((at if at is not None else time.perf_counter()) - self.started) * 1000
+        self.phases.append((name, round(elapsed, 1)))
+        if self.enabled:
+            logging.info(f"Startup phase {name}: {elapsed:.0f} ms")
+
+    def elapsed(self, name):
+        for phase, ms in self.phases:
+            if phase == name:
+                return ms
+        return None
+
+    def record(self, **extra):
+        record = {"time": datetime.now().isoformat(timespec="seconds"), "pid": os.getpid()}
+        record.update(extra)
+        record["phases"] = dict(self.phases)
+        return record
+
+    def write(self, path, **extra):
+        if not self.enabled:
+            return None
+        record = self.record(**extra)
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            logging.error(f"Startup Profile Write Error: {e}")
+        return record
+
+    def summary(self):
+        return ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.phases)
@@ -0,0 +1,69 @@
+from collections import deque
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtGui import QColor
+
+MAX_CLOSED_TABS = 25
+# Per-tab signals HNBrowser and its helpers connect to; cut before teardown so nothing fires into a dying tab
+VIEW_SIGNALS = ("loadStarted", "loadProgress", "loadFinished", "urlChanged", "titleChanged")
+PAGE_SIGNALS = ("loadFinished", "loadingChanged", "linkHovered", "permissionRequested")
+
+
+class TabLifecycle(QObject):
+    """Tears closed tabs down and keeps the "reopen closed tab" stack.
+
+    QTabWidget.removeTab only detaches a tab: the HNView, and the HNPage
+    parented to the main window, would otherwise stay alive (renderer,
+    history, closures) until exit. dispose() cuts the tab's connections,
+    stops it and deletes the page before the view. A closed tab is
+    remembered as a session-style descriptor (URL, title, colour, history,
+    scroll), so the stack costs a few hundred bytes per entry and a reopen
+    is a placeholder tab that loads straight away.
+    """
+
+    def __init__(self, main_window, max_closed=MAX_CLOSED_TABS):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.closed = deque(maxlen=max_closed)  # (tab index, descriptor)
+        self.stats = {"disposed": 0, "reopened": 0}
+
+    def close(self, view, index):
+        """Remember a tab that was just removed from index, then dispose of it."""
+        self.closed.append((index, self.main_window.tab_state(view)))
+        self.dispose(view)
+
+    def dispose(self, view):
+        view.disposed = True  # Python references (timers, queues) may outlive the C++ object
+        reader = getattr(view, "reader", None)
+        if reader:
+            reader.loader.cancel()
+        page = view.page()
+        for obj, names in ((view, VIEW_SIGNALS), (page, PAGE_SIGNALS)):
+            for name in names:
+                try:
+                    getattr(obj, name).disconnect()
+                except TypeError:
+                    pass  # Nothing connected
+        view.stop()
+        page.deleteLater()
+        view.deleteLater()
+        self.stats["disposed"] += 1
+
+    def reopen(self):
+        if not self.closed:
+            return None
+        index, state = self.closed.pop()
+        tabs = self.main_window.tabs
+        self.main_window.add_new_tab(state["url"], title=state.get("title") or "New Tab",
+                                     restored_color=QColor(state["color"]), focus=False, lazy=True,
+                                     content_type=state.get("type", ""), restored_state=state)
+        last = tabs.count() - 1
+        view = tabs.widget(last)
+        tabs.tabBar().moveTab(last, min(index, last))
+        tabs.setCurrentWidget(view)  # handle_tab_change loads it
+        self.stats["reopened"] += 1
+        return view
+
+    def summary(self):
+        s = self.stats
+        return f"tabs: {s['disposed']} closed and disposed, {s['reopened']} reopened, {len(self.closed)} on the reopen stack"
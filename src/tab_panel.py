@@ -0,0 +1,323 @@
+import bisect
+
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QDockWidget, QTreeView, QAbstractItemView
+
+from src.hibernation import HIBERNATED_MARK
+
+HOME_COLOR = "#000000"
+
+
+class TabGroup:
+    """One thread (group colour) and its tabs in tab-bar order. Model indexes of its tabs point here."""
+
+    def __init__(self, color, row):
+        self.color = color
+        self.row = row
+        self.views = []
+
+
+class TabTreeModel(QAbstractItemModel):
+    """Two-level model over the QTabWidget: thread groups, then their tabs.
+
+    The QTabWidget stays the source of truth. Title / URL / hibernation
+    changes repaint just that row (tab_changed). A single tab being added,
+    closed or moved becomes one row insert / remove / move in its group, so
+    the view keeps its expansion state and only lays out what changed.
+    Batches (session restore, closing a group) and the rare change that
+    reorders the groups themselves coalesce into one rebuild per
+    event-loop pass, so closing 200 tabs resets the model once.
+    """
+
+    def __init__(self, main_window, label_for):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.label_for = label_for  # view -> tab text, same as the tab bar's
+        self.groups = []  # In order of each group's first tab
+        self.by_color = {}
+        self.rows = {}  # view -> (TabGroup, row)
+        self.reset_timer = QTimer(self)
+        self.reset_timer.setSingleShot(True)
+        self.reset_timer.setInterval(0)
+        self.reset_timer.timeout.connect(self.rebuild)
+
+    # --- SYNC ---
+    def schedule_rebuild(self):
+        self.reset_timer.start()
+
+    def rebuild(self):
+        tabs = self.main_window.tabs
+        by_color = {}
+        groups = []
+        for i in range(tabs.count()):
+            view = tabs.widget(i)
+            color = view.group_color.name()
+            group = by_color.get(color)
+            if group is None:
+                group = by_color[color] = TabGroup(color, len(groups))
+                groups.append(group)
+            group.views.append(view)
+        self.beginResetModel()
+        self.groups = groups
+        self.by_color = by_color
+        self.rows = {v: (g, r) for g in groups for r, v in enumerate(g.views)}
+        self.endResetModel()
+
+    # --- INCREMENTAL UPDATES ---
+    # Each runs right after the QTabWidget changed; a pending rebuild makes them no-ops
+    def tab_added(self, view):
+        if self.reset_timer.isActive():
+            return
+        tabs = self.main_window.tabs
+        pos = tabs.indexOf(view)
+        group = self.by_color.get(view.group_color.name())
+        if group is None:
+            row = bisect.bisect_left(self.groups, pos, key=lambda g: tabs.indexOf(g.views[0]))
+            self.beginInsertRows(QModelIndex(), row, row)
+            group = self.by_color[view.group_color.name()] = TabGroup(view.group_color.name(), row)
+            group.views.append(view)
+            self.groups.insert(row, group)
+            self.rows[view] = (group, 0)
+            self.renumber_groups(row + 1)
+            self.endInsertRows()
+            return
+        row = bisect.bisect_left(group.views, pos, key=tabs.indexOf)
+        if row == 0 and not self.in_group_order(group, pos):
+            self.schedule_rebuild()
+            return
+        self.beginInsertRows(self.group_index(group), row, row)
+        group.views.insert(row, view)
+        self.renumber_tabs(group, row)
+        self.endInsertRows()
+        self.group_changed(group)
+
+    def tab_removed(self, view):
+        pos = self.rows.get(view)
+        if pos is None or self.reset_timer.isActive():
+            return
+        group, row = pos
+        if len(group.views) == 1:
+            self.beginRemoveRows(QModelIndex(), group.row, group.row)
+            del self.groups[group.row]
+            del self.by_color[group.color]
+            del self.rows[view]
+            self.renumber_groups(group.row)
+            self.endRemoveRows()
+            return
+        if row == 0 and not self.in_group_order(group, self.main_window.tabs.indexOf(group.views[1])):
+            self.schedule_rebuild()
+            return
+        self.beginRemoveRows(self.group_index(group), row, row)
+        del group.views[row]
+        del self.rows[view]
+        self.renumber_tabs(group, row)
+        self.endRemoveRows()
+        self.group_changed(group)
+
+    def tab_moved(self, view):
+        pos = self.rows.get(view)
+        if pos is None or self.reset_timer.isActive():
+            return
+        tabs = self.main_window.tabs
+        group, row = pos
+        others = group.views[:row] + group.views[row + 1:]
+        new_row = bisect.bisect_left(others, tabs.indexOf(view), key=tabs.indexOf)
+        first = view if new_row == 0 else others[0]
+        if not self.in_group_order(group, tabs.indexOf(first)):
+            self.schedule_rebuild()  # The group now sorts elsewhere among the groups
+            return
+        if new_row == row:
+            return
+        parent = self.group_index(group)
+        # Qt counts the destination before the moved row is taken out
+        self.beginMoveRows(parent, row, row, parent, new_row + 1 if new_row > row else new_row)
+        group.views.insert(new_row, group.views.pop(row))
+        self.renumber_tabs(group, min(row, new_row))
+        self.endMoveRows()
+        if min(row, new_row) == 0:
+            self.group_changed(group)
+
+    def in_group_order(self, group, first_pos):
+        """Whether group, with its first tab at tab index first_pos, still sits between its neighbours."""
+        tabs = self.main_window.tabs
+        before = self.groups[group.row - 1] if group.row > 0 else None
+        after = self.groups[group.row + 1] if group.row + 1 < len(self.groups) else None
+        return ((before is None or tabs.indexOf(before.views[0]) < first_pos) and
+                (after is None or first_pos < tabs.indexOf(after.views[0])))
+
+    def renumber_groups(self, start):
+        for row in range(start, len(self.groups)):
+            self.groups[row].row = row
+
+    def renumber_tabs(self, group, start):
+        for row in range(start, len(group.views)):
+            self.rows[group.views[row]] = (group, row)
+
+    def group_index(self, group):
+        return self.createIndex(group.row, 0)
+
+    def group_changed(self, group):
+        index = self.group_index(group)
+        self.dataChanged.emit(index, index)  # Header shows the first tab's name and the tab count
+
+    def tab_changed(self, view):
+        pos = self.rows.get(view)
+        if pos is None or self.reset_timer.isActive():
+            return  # Not shown yet; the pending rebuild picks it up
+        group, row = pos
+        index = self.createIndex(row, 0, group)
+        self.dataChanged.emit(index, index)
+        if row == 0:
+            self.group_changed(group)  # Named after its first tab
+
+    def index_of(self, view):
+        pos = self.rows.get(view)
+        return self.createIndex(pos[1], 0, pos[0]) if pos else QModelIndex()
+
+    def view_at(self, index):
+        group = index.internalPointer() if index.isValid() else None
+        return group.views[index.row()] if group else None
+
+    def group_at(self, index):
+        if not index.isValid():
+            return None
+        return index.internalPointer() or self.groups[index.row()]
+
+    # --- QAbstractItemModel ---
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self.groups[parent.row()])
+
+    def parent(self, index):
+        group = index.internalPointer() if index.isValid() else None
+        return self.createIndex(group.row, 0) if group else QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalPointer() is None:
+            return len(self.groups[parent.row()].views)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        view = self.view_at(index)
+        if view is None:
+            group = self.groups[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                first = group.views[0]
+                if first.disposed:
+                    return None
+                name = "Home" if group.color == HOME_COLOR else first.page_title() or first.page_url().host()
+                return f"{name} ({len(group.views)})"
+            if role == Qt.ItemDataRole.DecorationRole:
+                return QColor(group.color)
+            return None
+        if view.disposed:
+            return None  # Closed; the rebuild that drops the row is already queued
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (HIBERNATED_MARK if view.hibernated else "") + self.label_for(view)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return view.page_url().toString()
+        if role == Qt.ItemDataRole.ForegroundRole and view.group_color.name() != HOME_COLOR:
+            return view.group_color
+        return None
+
+
+class TabTree(QTreeView):
+    middle_clicked = pyqtSignal(QModelIndex)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.MiddleButton:
+            self.middle_clicked.emit(self.indexAt(event.position().toPoint()))
+            return
+        super().mouseReleaseEvent(event)
+
+
+class TabPanel(QDockWidget):
+    """Vertical tab list, one collapsible branch per thread group.
+
+    QTreeView with uniform row heights only lays out and paints the rows on
+    screen, so it stays fast with hundreds of tabs where the horizontal tab
+    bar (hidden while the panel is up) relayouts on every change.
+    Middle-click closes a tab, or a whole group from its header row.
+    """
+
+    def __init__(self, main_window, label_for):
+        super().__init__("Tabs", main_window)
+        self.main_window = main_window
+        self.setObjectName("tab_panel")
+        self.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable)
+        self.model = TabTreeModel(main_window, label_for)
+        self.collapsed = set()  # Group colours folded by the user; kept across rebuilds
+
+        self.tree = TabTree()
+        self.tree.setModel(self.model)
+        self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tree.clicked.connect(self.on_clicked)
+        self.tree.middle_clicked.connect(self.on_middle_clicked)
+        self.tree.collapsed.connect(lambda i: self.collapsed.add(self.model.group_at(i).color))
+        self.tree.expanded.connect(lambda i: self.collapsed.discard(self.model.group_at(i).color))
+        self.tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.model.modelReset.connect(self.on_reset)
+        self.model.rowsInserted.connect(self.on_rows_inserted)
+        self.setWidget(self.tree)
+
+    def on_reset(self):
+        collapsed = set(self.collapsed)
+        self.tree.expandAll()  # Emits expanded for every group
+        self.collapsed = collapsed
+        for group in self.model.groups:
+            if group.color in collapsed:
+                self.tree.setExpanded(self.model.group_index(group), False)
+        self.select(self.main_window.tabs.currentWidget())
+
+    def on_rows_inserted(self, parent, first, last):
+        if parent.isValid():
+            return  # Tabs; their group is already expanded or not
+        for row in range(first, last + 1):
+            self.tree.setExpanded(self.model.index(row, 0), self.model.groups[row].color not in self.collapsed)
+
+    def select(self, view):
+        index = self.model.index_of(view) if view else QModelIndex()
+        if index.isValid():
+            self.tree.setCurrentIndex(index)
+            self.tree.scrollTo(index)
+
+    def on_clicked(self, index):
+        view = self.model.view_at(index)
+        if view:
+            self.main_window.tabs.setCurrentWidget(view)
+
+    def on_middle_clicked(self, index):
+        group = self.model.group_at(index)
+        if group is None:
+            return
+        view = self.model.view_at(index)
+        tabs = self.main_window.tabs
+        if view:
+            self.main_window.close_tab(tabs.indexOf(view))
+        else:
+            self.main_window.close_group(tabs.indexOf(group.views[0]))
+
+    def show_context_menu(self, position):
+        index = self.tree.indexAt(position)
+        group = self.model.group_at(index)
+        if group is None:
+            return
+        view = self.model.view_at(index) or group.views[0]
+        self.main_window.show_tab_menu(self.main_window.tabs.indexOf(view), self.tree.viewport().mapToGlobal(position))
@@ -0,0 +1,105 @@
+from PyQt6.QtCore import QObject
+
+from src.prefetch import item_id_from_url
+
+
+class TabRegistry(QObject):
+    """Hash indexes over the open tabs: by URL, HN item id, group colour and content type.
+
+    HNBrowser calls register/update/unregister as tabs are added, navigate or
+    close, so questions like "is this thread already open?" or "which tabs
+    share this colour?" are dict lookups instead of walks over QTabWidget.
+    Results come back in tab-bar order, from a view -> position map that is
+    dropped whenever tabs are added, closed or moved (tabMoved) and rebuilt
+    in one pass on the next query, rather than an indexOf scan per result.
+    """
+
+    def __init__(self, tabs):
+        super().__init__(tabs)
+        self.tabs = tabs
+        self.keys = {}  # view -> (url, item id, colour, content type)
+        self.by_url = {}
+        self.by_item = {}
+        self.by_color = {}
+        self.by_type = {}
+        self.positions = {}  # view -> tab index; empty while out of date
+        tabs.tabBar().tabMoved.connect(self.invalidate_positions)
+
+    @staticmethod
+    def _add(index, key, view):
+        if key is not None:
+            index.setdefault(key, set()).add(view)
+
+    @staticmethod
+    def _remove(index, key, view):
+        views = index.get(key)
+        if views is not None:
+            views.discard(view)
+            if not views:
+                del index[key]
+
+    def _keys_for(self, view):
+        url = view.page_url().toString()
+        return (url or None, item_id_from_url(url), view.group_color.name(), view.content_type or None)
+
+    def _indexes(self):
+        return (self.by_url, self.by_item, self.by_color, self.by_type)
+
+    # --- SYNC ---
+    def register(self, view):
+        self.invalidate_positions()
+        self.update(view)
+
+    def update(self, view):
+        new = self._keys_for(view)
+        old = self.keys.get(view)
+        if old == new:
+            return
+        for index, old_key, new_key in zip(self._indexes(), old or (None,) * 4, new):
+            if old_key != new_key:
+                self._remove(index, old_key, view)
+                self._add(index, new_key, view)
+        self.keys[view] = new
+
+    def unregister(self, view):
+        self.invalidate_positions()
+        old = self.keys.pop(view, None)
+        if old:
+            for index, key in zip(self._indexes(), old):
+                self._remove(index, key, view)
+
+    def invalidate_positions(self, *_):
+        self.positions = {}
+
+    def _positions(self):
+        # The count check also catches a tab added or removed without register / unregister
+        if len(self.positions) != self.tabs.count():
+            self.positions = {self.tabs.widget(i): i for i in range(self.tabs.count())}
+        return self.positions
+
+    # --- QUERIES ---
+    def ordered(self, views):
+        positions = self._positions()
+        return sorted((v for v in views if v in positions), key=positions.__getitem__)
+
+    def find_url(self, url):
+        views = self.by_url.get(url)
+        return self.ordered(views)[0] if views else None
+
+    def find_item(self, item_id):
+        views = self.by_item.get(item_id)
+        return self.ordered(views)[0] if views else None
+
+    def group(self, color_name):
+        return self.ordered(self.by_color.get(color_name, ()))
+
+    def of_type(self, content_type):
+        return self.ordered(self.by_type.get(content_type, ()))
+
+    def home_view(self):
+        # "HN" is any news.ycombinator.com page that isn't an item thread
+        views = self.of_type("HN")
+        return views[0] if views else None
+
+    def __len__(self):
+        return len(self.keys)
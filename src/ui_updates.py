@@ -0,0 +1,93 @@
+from PyQt6.QtCore import QObject, QTimer
+
+FRAME_MS = 16
+
+
+class UiUpdateScheduler(QObject):
+    """Batches per-tab chrome updates into one pass per frame.
+
+    Tabs fire urlChanged / titleChanged / loadProgress many times per load,
+    and a session restore or a background comments tab multiplies that. Here
+    a signal only marks the tab dirty; at most once per FRAME_MS the dirty
+    tabs get their title, colour, tooltip and URL bar refreshed in one batch
+    (HNBrowser.apply_tab_visuals), and the status bar shows the current tab's
+    progress apart from an aggregate for loads in background tabs.
+    """
+
+    def __init__(self, main_window, active_bar, background_label):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.active_bar = active_bar
+        self.background_label = background_label
+        self.dirty = {}  # view -> None; insertion-ordered set
+        self.progress = {}  # view -> percent, for tabs with a load in flight
+        self.progress_dirty = False
+        self.stats = {"marks": 0, "flushes": 0, "applied": 0}
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(FRAME_MS)
+        self.timer.timeout.connect(self.flush)
+
+    # --- MARKING ---
+    def mark(self, view):
+        self.stats["marks"] += 1
+        self.dirty[view] = None
+        self.schedule()
+
+    def load_started(self, view):
+        self.progress[view] = 0
+        self.mark_progress()
+
+    def load_progress(self, view, percent):
+        if view in self.progress:
+            self.progress[view] = percent
+            self.mark_progress()
+
+    def load_finished(self, view):
+        if self.progress.pop(view, None) is not None:
+            self.mark_progress()
+
+    def forget(self, view):
+        self.dirty.pop(view, None)
+        self.load_finished(view)
+
+    def mark_progress(self):
+        self.progress_dirty = True
+        self.schedule()
+
+    def schedule(self):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    # --- FLUSH ---
+    def flush(self):
+        self.stats["flushes"] += 1
+        views, self.dirty = list(self.dirty), {}
+        views = [v for v in views if self.main_window.is_open(v)]
+        if views:
+            bar = self.main_window.tabs.tabBar()
+            bar.setUpdatesEnabled(len(views) == 1)  # One tab-bar repaint for the batch (not the page view)
+            try:
+                for view in views:
+                    self.main_window.apply_tab_visuals(view)
+            finally:
+                bar.setUpdatesEnabled(True)
+            self.stats["applied"] += len(views)
+        if self.progress_dirty:
+            self.progress_dirty = False
+            self.show_progress()
+
+    def show_progress(self):
+        current = self.main_window.tabs.currentWidget()
+        percent = self.progress.get(current)
+        self.active_bar.setVisible(percent is not None)
+        if percent is not None:
+            self.active_bar.setValue(percent)
+        background = [p for v, p in self.progress.items() if v is not current]
+        if background:
+            self.background_label.setText(f"⟳ {len(background)} loading ({sum(background) // len(background)}%)")
+        self.background_label.setVisible(bool(background))
+
+    def summary(self):
+        s = self.stats
+        return f"ui updates: {s['marks']} marks -> {s['applied']} tab refreshes in {s['flushes']} frames"
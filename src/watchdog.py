@@ -0,0 +1,182 @@
+import sys
+import time
+import queue
+import atexit
+import logging
+import threading
+import traceback
+import logging.handlers
+from collections import deque
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, QEvent
+
+BUCKETS_MS = (16, 33, 50, 100, 250, 500, 1000, 2000, 5000)  # upper bounds; one more bucket for anything slower
+RECENT_SAMPLES = 1000
+PERF_LOG_BYTES = 1024 * 1024
+PERF_LOG_BACKUPS = 3
+SWITCH_TIMEOUT_MS = 5000  # A switch that hasn't painted by then is recorded as this slow
+
+
+class LatencyHistogram:
+    """Bucketed counts since startup plus the most recent samples for percentiles."""
+
+    def __init__(self, name, buckets=BUCKETS_MS):
+        self.name = name
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+        self.total = 0
+        self.worst = 0.0
+
+    def add(self, ms):
+        i = next((i for i, bound in enumerate(self.buckets) if ms <= bound), len(self.buckets))
+        self.counts[i] += 1
+        self.recent.append(ms)
+        self.total += 1
+        self.worst = max(self.worst, ms)
+
+    def percentile(self, p):
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 1)
+
+    def labels(self):
+        lower = (0,) + self.buckets
+        return [f"{lo}-{hi} ms" for lo, hi in zip(lower, self.buckets)] + [f"> {self.buckets[-1]} ms"]
+
+    def summary(self):
+        if not self.total:
+            return f"{self.name}: none"
+        return (f"{self.name}: {self.total}, median {self.percentile(50)} ms, p90 {self.percentile(90)} ms, "
+                f"p99 {self.percentile(99)} ms, worst {self.worst:.0f} ms")
+
+
+def perf_logger(path):
+    """Rotating perf.log, written by its own listener thread like app.log."""
+    logger = logging.getLogger("hn_station.perf")
+    if logger.handlers:
+        return logger
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=PERF_LOG_BYTES, backupCount=PERF_LOG_BACKUPS,
+                                                   encoding="utf-8")
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # Stacks stay out of app.log
+    return logger
+
+
+class StallWatchdog(QObject):
+    """Event-loop stall detector and UI latency recorder.
+
+    A heartbeat timer on the GUI thread fires every interval_ms; how late
+    each beat arrives is how long the loop was busy (or blocked on I/O), and
+    every beat goes into the lag histogram, so the panel shows the whole
+    distribution. Beats over threshold_ms are stalls: they are logged, and
+    a monitor thread watching the heartbeat grabs the GUI thread's Python
+    stack while it's still stuck, so the rotating perf log says what was
+    running, not just that something was. Tab switches are timed from
+    handle_tab_change to the first paint of the tab switched to.
+    """
+
+    def __init__(self, parent=None, threshold_ms=250, interval_ms=100, log_path=None):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.last_beat = None
+        self.lag = LatencyHistogram("event loop lag")
+        self.stall_count = 0
+        self.tab_switches = LatencyHistogram("tab switch to first paint")
+        self.switch = None  # (widget watched for its first paint, start) while a switch is in flight
+        self.pending_stack = None  # Captured by the monitor thread for the stall in progress
+        self.gui_thread = threading.get_ident()
+        self.perf_log = perf_logger(log_path) if log_path else None
+        self.stop_event = threading.Event()
+        self.monitor = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.beat)
+        self.switch_timer = QTimer(self)
+        self.switch_timer.setSingleShot(True)
+        self.switch_timer.setInterval(SWITCH_TIMEOUT_MS)
+        self.switch_timer.timeout.connect(self.end_tab_switch)
+
+    def start(self):
+        self.last_beat = time.monotonic()
+        self.timer.start()
+        self.monitor = threading.Thread(target=self.watch, name="stall-watchdog", daemon=True)
+        self.monitor.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.cancel_tab_switch()
+        self.stop_event.set()
+
+    # --- GUI THREAD ---
+    def beat(self):
+        now = time.monotonic()
+        late_ms = max(0.0, (now - self.last_beat) * 1000 - self.interval_ms)
+        self.last_beat = now
+        stack, self.pending_stack = self.pending_stack, None
+        self.lag.add(late_ms)
+        if late_ms < self.threshold_ms:
+            return
+        self.stall_count += 1
+        logging.warning(f"Event loop blocked for {late_ms:.0f} ms")
+        if self.perf_log:
+            self.perf_log.warning(f"STALL {late_ms:.0f} ms" + (f"\n{stack}" if stack else ""))
+
+    def begin_tab_switch(self, view):
+        self.cancel_tab_switch()
+        # The web content is drawn by the view's render widget (its focus proxy) once the page exists
+        widget = view.focusProxy() or view
+        widget.installEventFilter(self)
+        self.switch = (widget, time.perf_counter())
+        self.switch_timer.start()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self.switch and obj is self.switch[0]:
+            self.end_tab_switch()
+        return False
+
+    def end_tab_switch(self):
+        if not self.switch:
+            return
+        started = self.switch[1]
+        self.cancel_tab_switch()
+        ms = (time.perf_counter() - started) * 1000
+        self.tab_switches.add(ms)
+        if self.perf_log and ms >= self.threshold_ms:
+            self.perf_log.info(f"SLOW TAB SWITCH {ms:.0f} ms")
+
+    def cancel_tab_switch(self):
+        self.switch_timer.stop()
+        if self.switch:
+            widget, self.switch = self.switch[0], None
+            if not sip.isdeleted(widget):
+                widget.removeEventFilter(self)
+
+    # --- MONITOR THREAD ---
+    def watch(self):
+        while not self.stop_event.wait(self.interval_ms / 1000):
+            beat = self.last_beat
+            if self.pending_stack is not None or (time.monotonic() - beat) * 1000 - self.interval_ms < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self.gui_thread)
+            if frame is not None and self.last_beat == beat:  # Still the same stall
+                self.pending_stack = "".join(traceback.format_stack(frame))
+            del frame  # A held frame keeps every local of the call chain it was blocked in alive
+
+    def rows(self):
+        """(bucket label, heartbeats, tab switches) for display."""
+        return list(zip(self.lag.labels(), self.lag.counts, self.tab_switches.counts))
+
+    def summary(self):
+        return (f"{self.lag.summary()}, {self.stall_count} stalls over {self.threshold_ms} ms; "
+                f"{self.tab_switches.summary()}")
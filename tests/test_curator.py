@@ -0,0 +1,79 @@
+import time
+
+from src.curator import CuratorEngine, MAX_BACKFILL
+from src.item_cache import ItemCache
+
+
+class FakeFetcher:
+    """Answers maxitem / updates and serves items, failing the ids in `broken`."""
+
+    def __init__(self, max_item, broken=()):
+        self.max_item = max_item
+        self.broken = set(broken)
+        self.requested = []
+
+    def get_json(self, path):
+        if path == "maxitem.json":
+            return self.max_item
+        if path == "updates.json":
+            return {"items": []}
+        raise AssertionError(f"unexpected request {path}")
+
+    def iter_items(self, ids, failed=None):
+        for i in ids:
+            self.requested.append(i)
+            if i in self.broken:
+                if failed is not None:
+                    failed.add(i)
+                yield i, None
+            else:
+                yield i, {"id": i, "type": "story", "title": f"Story {i}", "time": time.time()}
+
+
+class FakeStore:
+    def known(self, ids):
+        return set()
+
+
+def run_pass(cache, fetcher):
+    return CuratorEngine("unused", ["rust"]).incremental_candidates(fetcher, cache, FakeStore())
+
+
+def test_cursor_advances_to_max_item(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.set_meta("curator_cursor", 100)
+    stories = run_pass(cache, FakeFetcher(110))
+    assert [s["id"] for s in stories] == list(range(101, 111))
+    assert cache.get_meta("curator_cursor") == 110
+
+
+def test_cursor_held_below_first_failed_item(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.set_meta("curator_cursor", 100)
+    run_pass(cache, FakeFetcher(110, broken={104, 107}))
+    assert cache.get_meta("curator_cursor") == 103
+
+    # Next pass retries from the failed id; the ones that worked come from the cache
+    fetcher = FakeFetcher(112)
+    run_pass(cache, fetcher)
+    assert sorted(fetcher.requested) == [104, 107, 111, 112]
+    assert cache.get_meta("curator_cursor") == 112
+
+
+def test_null_items_do_not_hold_the_cursor(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.set_meta("curator_cursor", 100)
+    fetcher = FakeFetcher(105)
+    real = fetcher.iter_items
+    fetcher.iter_items = lambda ids, failed=None: ((i, None if i == 103 else item) for i, item in real(ids, failed))
+    run_pass(cache, fetcher)
+    assert cache.get_meta("curator_cursor") == 105
+
+
+def test_backfill_is_capped(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.set_meta("curator_cursor", 0)
+    fetcher = FakeFetcher(MAX_BACKFILL + 500)
+    run_pass(cache, fetcher)
+    assert min(fetcher.requested) == 501
+    assert cache.get_meta("curator_cursor") == MAX_BACKFILL + 500
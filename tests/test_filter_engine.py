@@ -0,0 +1,55 @@
+from src.filter_engine import FilterEngine
+
+LIST = """\
+! comment
+||ads.example.com^
+&adurl=
+|https://cdn.site.org/track*.js|
+/banner\\d+\\./
+@@||ads.example.com/ok^
+@@||news.site.org^$document
+||tracker.net^$third-party,script
+example.com##.ad
+||popups.io^$popup
+"""
+
+
+def test_domain_rules_cover_subdomains_and_exceptions():
+    engine = FilterEngine.from_text(LIST)
+    assert engine.should_block("https://ads.example.com/x.gif")
+    assert engine.should_block("https://img.ads.example.com/x.gif")
+    assert not engine.should_block("https://example.com/x.gif")
+    assert not engine.should_block("https://ads.example.com/ok/x.gif")
+
+
+def test_substring_anchor_and_regex_rules():
+    engine = FilterEngine.from_text(LIST)
+    assert engine.should_block("https://a.com/click?q=1&adurl=x")
+    assert engine.should_block("https://cdn.site.org/track-v2.js")
+    assert not engine.should_block("https://cdn.site.org/track-v2.js?v=1")
+    assert engine.should_block("https://a.com/banner42.png")
+    assert not engine.should_block("https://a.com/banner.png")
+
+
+def test_options_and_document_exceptions():
+    engine = FilterEngine.from_text(LIST)
+    assert engine.should_block("https://tracker.net/t.js", "blog.org", "script")
+    assert not engine.should_block("https://tracker.net/t.js", "tracker.net", "script")
+    assert not engine.should_block("https://tracker.net/t.png", "blog.org", "image")
+    assert not engine.should_block("https://ads.example.com/x.gif", "news.site.org")
+    assert engine.skipped == 1  # $popup; the ## and ! lines aren't counted
+
+
+def test_compiled_cache_is_reused_until_the_list_changes(tmp_path):
+    lst, cache = tmp_path / "list.txt", tmp_path / "filters.pickle"
+    lst.write_text(LIST)
+    first = FilterEngine.load([str(lst), str(tmp_path / "missing.txt")], str(cache))
+    assert cache.exists()
+    again = FilterEngine.load([str(lst)], str(cache))
+    assert again.summary() == first.summary()
+    assert again.should_block("https://a.com/banner42.png")
+
+    lst.write_text("||other.com^\n")
+    changed = FilterEngine.load([str(lst)], str(cache))
+    assert changed.should_block("https://other.com/")
+    assert not changed.should_block("https://ads.example.com/x.gif")
@@ -0,0 +1,77 @@
+import time
+import sqlite3
+
+import pytest
+
+from src.item_cache import ItemCache, DAY, HOUR
+
+
+class FakeFetcher:
+    def __init__(self, items, broken=()):
+        self.items = items
+        self.broken = set(broken)
+        self.requested = []
+
+    def iter_items(self, ids, failed=None):
+        for i in ids:
+            self.requested.append(i)
+            if i in self.broken:
+                if failed is not None:
+                    failed.add(i)
+                yield i, None
+            else:
+                yield i, self.items[i]
+
+
+def expiry(cache, item_id):
+    return cache._db().execute("SELECT expires_at FROM items WHERE id=?", (item_id,)).fetchone()[0]
+
+
+def settling_story(tmp_path):
+    """A story cached 7 h ago with a 6 h TTL that is now just past the 3-day mutable window."""
+    now = time.time()
+    old = {"id": 1, "type": "story", "title": "Old title", "score": 10, "time": now - 3 * DAY - 60}
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.put_many([old], now=now - 7 * HOUR)
+    assert expiry(cache, 1) is not None
+    return cache, dict(old, title="Final title", score=250)
+
+
+def test_item_is_refetched_once_when_it_becomes_immutable(tmp_path):
+    cache, final = settling_story(tmp_path)
+    fetcher = FakeFetcher({1: final})
+    assert cache.fetch_items(fetcher, [1])[1]["score"] == 250
+    assert fetcher.requested == [1]
+    assert expiry(cache, 1) is None
+
+    # Frozen with the refetched data; no more requests
+    assert cache.fetch_items(fetcher, [1])[1]["title"] == "Final title"
+    assert fetcher.requested == [1]
+
+
+def test_failed_refetch_serves_stale_copy_without_freezing_it(tmp_path):
+    cache, _ = settling_story(tmp_path)
+    failed = set()
+    assert cache.fetch_items(FakeFetcher({}, broken={1}), [1], failed)[1]["score"] == 10
+    assert failed == {1}
+    assert expiry(cache, 1) is not None
+
+
+def test_evictions_count_rows_actually_deleted(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"), max_items=10)
+    now = time.time()
+    cache.put_many([{"id": i, "type": "comment", "time": now} for i in range(12)])
+    # 12 rows, cap 10: trims to 10% under the cap
+    assert cache._db().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 9
+    assert cache.stats["evictions"] == 3
+    cache.put_many([{"id": 5, "type": "comment", "time": now}])  # Replaces a row: nothing to evict
+    assert cache.stats["evictions"] == 3
+
+
+def test_closed_cache_does_not_reopen(tmp_path):
+    cache = ItemCache(str(tmp_path / "items.db"))
+    cache.set_meta("curator_cursor", 1)
+    cache.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get_meta("curator_cursor")
+    assert cache.conn is None
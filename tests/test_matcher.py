@@ -0,0 +1,21 @@
+from src.matcher import KeywordMatcher
+
+
+def test_duplicate_terms_keep_the_highest_weight():
+    for rules in (["rust", "rust^3"], ["rust^3", "rust"]):
+        matcher = KeywordMatcher(rules)
+        assert len(matcher.rules) == 1
+        assert matcher.score("Rewriting it in Rust") == 3
+
+
+def test_duplicate_merge_respects_prefix_and_exclusion():
+    matcher = KeywordMatcher(["crypt*^2", "crypt", "-crypto"])
+    assert len(matcher.rules) == 3
+    assert matcher.score("Cryptography basics") == 2
+    assert matcher.match("Crypto winter") == []
+
+
+def test_dict_and_string_specs_dedupe_together():
+    matcher = KeywordMatcher([{"term": "Open Source", "weight": 2}, '"open source"^5'])
+    assert [r.weight for r in matcher.rules] == [5]
+    assert matcher.score("An open-source database") == 5
@@ -0,0 +1,39 @@
+import time
+
+from src.search_index import SearchIndex, CANDIDATES
+
+
+def build(path, docs, revisit=()):
+    index = SearchIndex(str(path))
+    index.add_many(docs)
+    index.close()  # Flushes the writer
+    if revisit:
+        time.sleep(0.01)
+        index = SearchIndex(str(path))
+        for url in revisit:
+            index.add(url, "")
+        index.close()
+    return SearchIndex(str(path))
+
+
+def test_recently_revisited_old_page_is_a_candidate(tmp_path):
+    docs = [{"url": f"https://example.com/{i}", "title": f"Rust release notes {i}"} for i in range(CANDIDATES + 50)]
+    index = build(tmp_path / "search.db", docs, revisit=["https://example.com/0"])
+    try:
+        results = index.search("rust", limit=CANDIDATES + 50)
+        assert len(results) == CANDIDATES
+        assert "https://example.com/0" in [r["url"] for r in results]
+        assert index.search("rust")[0]["url"] == "https://example.com/0"  # Visits nudge it to the top
+    finally:
+        index.close()
+
+
+def test_prefix_and_title_ranking(tmp_path):
+    docs = [{"url": "https://example.com/a", "title": "Postgres internals"},
+            {"url": "https://example.com/postgres-b", "title": "Unrelated title"}]
+    index = build(tmp_path / "search.db", docs)
+    try:
+        assert [r["url"] for r in index.search("postg")] == ["https://example.com/a", "https://example.com/postgres-b"]
+        assert index.search("") == []
+    finally:
+        index.close()
@@ -0,0 +1,70 @@
+"""Offline throughput benchmark: legacy sequential curator loop vs HNFetcher.
+
+Runs against tools/stub_hn_server.py in-process, so no network is needed.
+
+    python tools/bench_fetcher.py --items 60 --rate 10 --in-flight 8 --latency 0.08
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fetcher import HNFetcher
+from tools.stub_hn_server import start_stub_server
+
+
+def legacy_pass(base, ids, delay):
+    # Mirrors the old HNCurator loop: one urlopen per item plus a fixed sleep
+    for hn_id in ids:
+        with urllib.request.urlopen(f"{base}item/{hn_id}.json", timeout=10) as r:
+            json.loads(r.read().decode())
+        time.sleep(delay)
+
+
+def fetcher_pass(base, ids, rate, in_flight):
+    fetcher = HNFetcher(base_url=base, rate=rate, burst=in_flight, max_in_flight=in_flight)
+    try:
+        items = fetcher.fetch_items(ids)
+    finally:
+        fetcher.close()
+    return items, fetcher.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=60)
+    parser.add_argument("--rate", type=float, default=10.0, help="Token bucket rate (req/s)")
+    parser.add_argument("--in-flight", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.08, help="Stub server latency per request")
+    parser.add_argument("--server-limit", type=float, default=0, help="Stub 429 threshold (req/s)")
+    parser.add_argument("--legacy-delay", type=float, default=0.5)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    server, base = start_stub_server(latency=args.latency, limit=args.server_limit)
+    with urllib.request.urlopen(base + "topstories.json") as r:
+        ids = json.loads(r.read().decode())[:args.items]
+
+    print(f"{len(ids)} items, stub latency {args.latency * 1000:.0f} ms")
+    if not args.skip_legacy:
+        t = time.perf_counter()
+        legacy_pass(base, ids, args.legacy_delay)
+        dt = time.perf_counter() - t
+        print(f"legacy   : {dt:6.2f}s  {len(ids) / dt:7.1f} items/s")
+
+    t = time.perf_counter()
+    items, stats = fetcher_pass(base, ids, args.rate, args.in_flight)
+    dt = time.perf_counter() - t
+    ok = sum(1 for v in items.values() if v)
+    print(f"fetcher  : {dt:6.2f}s  {ok / dt:7.1f} items/s  (budget {args.rate:g} req/s, "
+          f"{args.in_flight} in flight, {stats['connections']} connections, "
+          f"{stats['throttled']} throttled, {stats['retries']} retries)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
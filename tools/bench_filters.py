@@ -0,0 +1,117 @@
+"""Benchmark: FilterEngine compile / cache-load time and per-request matching cost.
+
+    python tools/bench_filters.py --domains 40000 --patterns 15000 --requests 200000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.filter_engine import FilterEngine
+
+SYLLABLES = "ad ads track pix el met ric beacon click stat tag sync serv cdn img media log count ban ner pop".split()
+PAGES = ["nytimes.com", "github.com", "lwn.net", "theverge.com", "medium.com", "arxiv.org"]
+TYPES = ["script", "image", "stylesheet", "xmlhttprequest", "subdocument", "font", "other"]
+
+
+def word(rnd, n=(2, 4)):
+    return "".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(*n)))
+
+
+def synth_list(domains, patterns, rnd):
+    """EasyList-shaped: mostly ||domain^ rules, then path patterns, a few regexes and exceptions."""
+    lines = ["[Adblock Plus 2.0]", "! Synthetic list"]
+    hosts = []
+    for i in range(domains):
+        host = f"{word(rnd)}{i}.{rnd.choice(['com', 'net', 'io', 'co.uk'])}"
+        hosts.append(host)
+        lines.append(f"||{host}^" + ("$third-party" if i % 5 == 0 else ""))
+    for i in range(patterns):
+        kind = i % 6
+        if kind == 0:
+            lines.append(f"/{word(rnd)}/{word(rnd)}.")
+        elif kind == 1:
+            lines.append(f"-{word(rnd)}-{rnd.randint(100, 999)}x{rnd.randint(50, 600)}.")
+        elif kind == 2:
+            lines.append(f"&{word(rnd)}=$script,image")
+        elif kind == 3:
+            lines.append(f"||{rnd.choice(hosts)}/{word(rnd)}/*.js$script,domain={rnd.choice(PAGES)}")
+        elif kind == 4:
+            lines.append(f"{word(rnd)}_{word(rnd)}.gif$image")
+        else:
+            lines.append(f"example.com##.{word(rnd)}")  # Element hiding: skipped
+    lines += [f"/{word(rnd, (1, 2))}[0-9]{{2,}}\\.js/" for _ in range(30)]
+    lines += [f"@@||{rnd.choice(hosts)}^$script" for _ in range(200)]
+    return "\n".join(lines), hosts
+
+
+def synth_requests(n, hosts, rnd):
+    reqs = []
+    for _ in range(n):
+        page = rnd.choice(PAGES)
+        r = rnd.random()
+        if r < 0.15:
+            host = "sub." + rnd.choice(hosts)  # Known ad/tracker domain
+        elif r < 0.55:
+            host = "static." + page
+        else:
+            host = f"{rnd.choice(['cdn', 'img', 'api', 'fonts'])}.{word(rnd)}.com"
+        path = "/".join(word(rnd, (1, 3)) for _ in range(rnd.randint(1, 4)))
+        query = f"?v={rnd.randint(1, 99999)}&{word(rnd, (1, 2))}={rnd.randint(1, 9)}" if rnd.random() < 0.5 else ""
+        reqs.append((f"https://{host}/{path}.{rnd.choice(['js', 'png', 'css', 'gif', 'json'])}{query}", page,
+                     rnd.choice(TYPES)))
+    return reqs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--domains", type=int, default=40_000)
+    parser.add_argument("--patterns", type=int, default=15_000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    rnd = random.Random(args.seed)
+
+    text, hosts = synth_list(args.domains, args.patterns, rnd)
+    requests = synth_requests(args.requests, hosts, rnd)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        list_path = os.path.join(tmp, "filters.txt")
+        cache_path = os.path.join(tmp, "filters.cache")
+        with open(list_path, "w") as f:
+            f.write(text)
+
+        t = time.perf_counter()
+        engine = FilterEngine.load([list_path], cache_path)
+        compiled = time.perf_counter() - t
+        t = time.perf_counter()
+        engine = FilterEngine.load([list_path], cache_path)
+        cached = time.perf_counter() - t
+        print(f"{len(text.splitlines())} lines -> {engine.summary()}")
+        print(f"compile from text {compiled * 1000:.0f} ms, load from cache {cached * 1000:.0f} ms "
+              f"({os.path.getsize(cache_path) // 1024} KB)")
+
+    blocked = 0
+    samples = []
+    t = time.perf_counter()
+    for i, (url, page, kind) in enumerate(requests):
+        if i % 50 == 0:
+            s = time.perf_counter()
+            blocked += engine.should_block(url, page, kind)
+            samples.append((time.perf_counter() - s) * 1e6)
+        else:
+            blocked += engine.should_block(url, page, kind)
+    total = time.perf_counter() - t
+    samples.sort()
+    print(f"{len(requests)} requests: {total / len(requests) * 1e6:.1f} us/request mean, "
+          f"median {statistics.median(samples):.1f} us, p99 {samples[int(len(samples) * 0.99)]:.1f} us "
+          f"({blocked} blocked)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Micro-benchmark: legacy first-substring keyword scan vs the compiled KeywordMatcher.
+
+    python tools/bench_matcher.py --titles 100000 --keywords 300
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.matcher import KeywordMatcher
+
+VOCAB = ("show ask hn launch release open source rust python go linux kernel compiler "
+         "database postgres sqlite llm gpu browser privacy security startup funding "
+         "remote work design performance latency cache memory allocator web assembly "
+         "distributed systems apple google microsoft meta amazon nvidia chip cpu").split()
+
+
+def synth_keywords(n, rnd):
+    words = set(VOCAB)
+    while len(words) < n:
+        words.add("".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(4, 9))))
+    terms = sorted(words)[:n]
+    # Sprinkle in phrases, prefixes and exclusions so the compiled matcher does real work
+    terms += ['"open source"', '"distributed systems"', "crypt*", "-nft", "-sponsored"]
+    return terms
+
+
+FILLER = ("the a of for in on with how why what new my our your is are to from we i "
+          "building using about after years first time making better faster small tiny "
+          "guide notes story lessons learned introducing announcing").split()
+
+
+def synth_titles(n, keywords, rnd, hit_rate):
+    # Most front-page titles match nothing, which is the legacy scan's worst case
+    hot = VOCAB + [k for k in keywords if k.isalpha()][:50]
+    titles = []
+    for _ in range(n):
+        words = [rnd.choice(FILLER) for _ in range(rnd.randint(4, 12))]
+        if rnd.random() < hit_rate:
+            words[rnd.randrange(len(words))] = rnd.choice(hot)
+        titles.append(" ".join(words).capitalize())
+    return titles
+
+
+def legacy_scan(titles, keywords):
+    # What HNCurator used to do: lowercase, then first keyword that is a substring
+    keywords = [k.lower() for k in keywords]
+    hits = 0
+    for t in titles:
+        title = t.lower()
+        if next((k for k in keywords if k in title), None):
+            hits += 1
+    return hits
+
+
+def compiled_scan(titles, matcher):
+    hits = 0
+    for t in titles:
+        if matcher.match(t):
+            hits += 1
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--titles", type=int, default=100_000)
+    parser.add_argument("--keywords", type=int, default=300)
+    parser.add_argument("--hit-rate", type=float, default=0.05, help="Fraction of titles containing a watch term")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    keywords = synth_keywords(args.keywords, rnd)
+    titles = synth_titles(args.titles, keywords, rnd, args.hit_rate)
+    plain = [k for k in keywords if k.isalpha()]
+
+    t = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    build = time.perf_counter() - t
+
+    t = time.perf_counter()
+    legacy_hits = legacy_scan(titles, plain)
+    legacy = time.perf_counter() - t
+
+    t = time.perf_counter()
+    hits = compiled_scan(titles, matcher)
+    compiled = time.perf_counter() - t
+
+    n = len(titles)
+    print(f"{n} titles x {len(keywords)} rules")
+    print(f"legacy scan : {legacy:6.2f}s  {legacy / n * 1e6:6.1f} us/title  ({legacy_hits} substring hits)")
+    print(f"compiled    : {compiled:6.2f}s  {compiled / n * 1e6:6.1f} us/title  ({hits} rule hits, "
+          f"all rules reported, built in {build * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: SearchIndex (SQLite FTS5) indexing throughput and URL-bar query latency.
+
+    python tools/bench_search.py --docs 100000 --queries 500
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.search_index import SearchIndex
+from tools.bench_matcher import VOCAB, FILLER
+
+HOSTS = ["github.com", "arxiv.org", "nytimes.com", "lwn.net", "blog.example.com", "news.ycombinator.com",
+         "medium.com", "substack.com", "theverge.com", "acm.org"]
+
+
+def synth_docs(n, rnd):
+    for i in range(n):
+        words = [rnd.choice(FILLER) for _ in range(rnd.randint(3, 8))] + rnd.sample(VOCAB, 2)
+        rnd.shuffle(words)
+        title = " ".join(words).capitalize()
+        host = rnd.choice(HOSTS)
+        yield {"url": f"https://{host}/{'-'.join(words[:4])}-{i}", "title": title, "id": 30_000_000 + i}
+
+
+def synth_queries(n, rnd):
+    # What people type: one or two words, often still half-typed
+    queries = []
+    for _ in range(n):
+        words = rnd.sample(VOCAB, rnd.choice((1, 1, 2)))
+        last = words[-1]
+        words[-1] = last[:rnd.randint(2, len(last))] if len(last) > 2 else last
+        queries.append(" ".join(words))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rnd = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "search.db")
+        index = SearchIndex(path)
+        t = time.perf_counter()
+        index.add_many(synth_docs(args.docs, rnd))
+        enqueue = time.perf_counter() - t
+        index.close(timeout=600)
+        dt = time.perf_counter() - t
+        print(f"indexed {args.docs} docs in {dt:.2f}s ({args.docs / dt:,.0f} docs/s, "
+              f"{index.stats['batches']} batches; enqueue took {enqueue * 1000:.0f} ms on the caller)")
+
+        index = SearchIndex(path)
+        queries = synth_queries(args.queries, rnd)
+        index.search(queries[0])  # Open the read connection outside the timing
+        times, hits = [], 0
+        for q in queries:
+            t = time.perf_counter()
+            results = index.search(q)
+            times.append((time.perf_counter() - t) * 1000)
+            hits += bool(results)
+        index.close()
+        times.sort()
+        print(f"{len(queries)} queries over {args.docs} docs: median {statistics.median(times):.2f} ms, "
+              f"p95 {times[int(len(times) * 0.95)]:.2f} ms, max {times[-1]:.2f} ms ({hits} with results)")
+
+
+if __name__ == "__main__":
+    main()
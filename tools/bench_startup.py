@@ -0,0 +1,99 @@
+"""Headless startup benchmark: cold vs warm launch times of main.py.
+
+Each run starts `main.py --profile-startup --quit-after-startup` under the
+offscreen Qt platform with a throwaway data folder (LOCALAPPDATA), then reads
+the phase timings the app appended to startup_profile.jsonl. The first run is
+cold (empty web profile, no caches); later runs reuse the folder and are warm.
+
+    python tools/bench_startup.py --runs 4 --session-tabs 50
+
+The first page is the live HN front page, so first_load_finished includes the
+network; the phases before it do not.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_NAME = "HN Station"  # Must match src/hn_station.py; importing it would pull in Qt
+
+
+def seed_session(data_dir, tabs):
+    # Home plus N restored tabs: the fast-launch path should not slow down with session size
+    entries = [{"url": "https://news.ycombinator.com/", "color": "#000000", "title": "Hacker News", "type": "HN"}]
+    for n in range(tabs):
+        entries.append({"url": f"https://example.com/article/{n}", "color": "#C62828",
+                        "title": f"Article {n}", "type": "📄"})
+    with open(os.path.join(data_dir, "session.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": 2, "tabs": entries}, f)
+
+
+def launch(local_app_data, timeout):
+    env = dict(os.environ, LOCALAPPDATA=local_app_data, QT_QPA_PLATFORM="offscreen")
+    # Chromium's sandbox refuses to start as root in containers/CI
+    env.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")
+    t = time.perf_counter()
+    proc = subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), "--profile-startup", "--quit-after-startup"],
+                          cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+    return proc.returncode, (time.perf_counter() - t) * 1000
+
+
+def read_last_profile(data_dir):
+    try:
+        with open(os.path.join(data_dir, "startup_profile.jsonl"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=4, help="1 cold run followed by N-1 warm runs")
+    parser.add_argument("--session-tabs", type=int, default=0, help="Seed a saved session with this many tabs")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary data folder")
+    args = parser.parse_args()
+
+    local_app_data = tempfile.mkdtemp(prefix="hn-station-bench-")
+    data_dir = os.path.join(local_app_data, APP_NAME)
+    os.makedirs(data_dir)
+    results = []
+    try:
+        for run in range(args.runs):
+            if args.session_tabs:
+                seed_session(data_dir, args.session_tabs)  # The app rewrote it on exit
+            code, wall = launch(local_app_data, args.timeout)
+            profile = read_last_profile(data_dir)
+            if code != 0 or not profile or profile["pid"] in {r["pid"] for r in results}:
+                print(f"run {run + 1}: app exited with {code} without writing a profile "
+                      f"(rerun with --keep and see {os.path.join(data_dir, 'app.log')})")
+                return 1
+            profile["wall"] = round(wall, 1)
+            results.append(profile)
+    finally:
+        if not args.keep:
+            shutil.rmtree(local_app_data, ignore_errors=True)
+
+    phases = list(results[0]["phases"]) + ["wall"]
+    print(f"{len(results)} runs, {args.session_tabs} saved tabs (ms since process start)")
+    print(f"{'phase':<20}{'cold':>9}{'warm med':>10}{'warm min':>10}")
+    for phase in phases:
+        values = [r["wall"] if phase == "wall" else r["phases"].get(phase) for r in results]
+        warm = [v for v in values[1:] if v is not None]
+        cold = f"{values[0]:9.0f}" if values[0] is not None else f"{'-':>9}"
+        if warm:
+            print(f"{phase:<20}{cold}{statistics.median(warm):10.0f}{min(warm):10.0f}")
+        else:
+            print(f"{phase:<20}{cold}{'-':>10}{'-':>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
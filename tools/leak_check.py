@@ -0,0 +1,119 @@
+"""Tab leak check: open and close hundreds of tabs headless, then compare live objects to the baseline.
+
+Runs the real HNBrowser in-process under the offscreen Qt platform with a
+throwaway data folder (LOCALAPPDATA). Each round opens --tabs tabs on small
+data: URLs (no network apart from the Home tab), closes them one by one and
+in batches, reopens a few from the closed-tab stack and closes those again.
+After a round every closed tab must be gone: no live HNView / HNPage and no
+extra QObjects under the main window. Pending single-shot timers (load slot
+timeouts, retries) may still hold the Python wrapper of a deleted tab for a
+while, so those are counted as "stale" and only have to be gone once the
+timers have had --drain seconds to fire.
+
+    python tools/leak_check.py --rounds 5 --tabs 100
+
+Exits 1 if any count stays above the baseline.
+"""
+import os
+import gc
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pump(app, seconds):
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+        # deleteLater() only runs once control is back in an event loop; flush it explicitly
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        time.sleep(0.01)
+    gc.collect()
+
+
+def live_counts(window):
+    from PyQt6 import sip
+    from PyQt6.QtCore import QObject
+    from src.hn_station import HNView, HNPage
+    tabs = [o for o in gc.get_objects() if isinstance(o, (HNView, HNPage))]
+    live = [o for o in tabs if not sip.isdeleted(o)]
+    return {
+        "views": sum(1 for o in live if isinstance(o, HNView)),
+        "pages": sum(1 for o in live if isinstance(o, HNPage)),
+        "stale": len(tabs) - len(live),
+        "qobjects": len(window.findChildren(QObject)),
+    }
+
+
+def run_round(app, window, tabs, settle):
+    for n in range(tabs):
+        window.add_new_tab(f"data:text/html,<title>Tab {n}</title><p>Leak check tab {n}</p>", focus=False)
+    pump(app, settle)
+    # Half one at a time (Ctrl+W), the rest in one batch (Close Tabs to the Right)
+    for _ in range(tabs // 2):
+        window.close_tab(window.tabs.count() - 1)
+    window.close_right_tabs(0)
+    pump(app, settle)
+    reopened = [window.lifecycle.reopen() for _ in range(min(5, len(window.lifecycle.closed)))]
+    pump(app, settle)
+    window.remove_tabs(v for v in reopened if v)
+    pump(app, settle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--tabs", type=int, default=100, help="Tabs opened (and closed) per round")
+    parser.add_argument("--settle", type=float, default=1.0, help="Seconds of event processing between steps")
+    parser.add_argument("--drain", type=float, default=21.0,
+                        help="Seconds to let pending timers fire before stale wrappers are counted (> slot timeouts)")
+    args = parser.parse_args()
+
+    local_app_data = tempfile.mkdtemp(prefix="hn-station-leak-")
+    os.environ["LOCALAPPDATA"] = local_app_data
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    # Chromium's sandbox refuses to start as root in containers/CI
+    os.environ.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")
+    sys.path.insert(0, ROOT)
+    from PyQt6.QtWidgets import QApplication
+    from src.hn_station import HNBrowser
+
+    app = QApplication(sys.argv)
+    window = HNBrowser()
+    window.show()
+    try:
+        deadline = time.monotonic() + 30
+        while not window.started and time.monotonic() < deadline:
+            pump(app, 0.1)
+        # Warm-up round: one-off objects (caches, completer popup, timers) are part of the baseline
+        run_round(app, window, min(args.tabs, 10), args.settle)
+        pump(app, args.drain)
+        baseline = live_counts(window)
+        print(f"baseline: {baseline}")
+
+        leaked = {}
+        for r in range(args.rounds):
+            t = time.perf_counter()
+            run_round(app, window, args.tabs, args.settle)
+            counts = live_counts(window)
+            leaked = {k: counts[k] - baseline[k] for k in counts if k != "stale" and counts[k] > baseline[k]}
+            print(f"round {r + 1}: {args.tabs} tabs in {time.perf_counter() - t:.1f}s, {counts}"
+                  + (f" LEAK {leaked}" if leaked else ""))
+        pump(app, args.drain)
+        counts = live_counts(window)
+        leaked = {k: counts[k] - baseline[k] for k in counts if counts[k] > baseline[k]}
+        print(f"after {args.drain:g}s drain: {counts}" + (f" LEAK {leaked}" if leaked else ""))
+        print(window.lifecycle.summary())
+        return 1 if leaked else 0
+    finally:
+        window.close()
+        shutil.rmtree(local_app_data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Local stand-in for the HN Firebase API, for offline benchmarking.
+
+Serves /v0/topstories.json, /v0/newstories.json, /v0/maxitem.json,
+/v0/updates.json and /v0/item/<id>.json with synthetic data. Per-request
+latency and a server-side rate limit (answered with 429 + Retry-After) can be
+configured so the fetcher's politeness behaviour is exercised too.
+
+    python tools/stub_hn_server.py --port 8765 --latency 0.08 --limit 20
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+WORDS = ("rust python linux kernel compiler database postgres sqlite startup show ask "
+         "llm gpu browser privacy security open source release launch hn web assembly "
+         "distributed systems performance latency cache memory allocator").split()
+
+
+def synth_item(item_id, max_item):
+    rnd = random.Random(item_id)
+    if item_id > max_item:
+        return None
+    # Roughly 1 in 5 items is a story, the rest are comments on nearby stories
+    if item_id % 5 == 0:
+        return {
+            "id": item_id, "type": "story", "by": f"user{rnd.randint(1, 5000)}",
+            "time": 1_700_000_000 + item_id, "score": rnd.randint(1, 900),
+            "title": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(4, 10))).capitalize(),
+            "url": f"https://example{rnd.randint(1, 300)}.com/{item_id}",
+            "descendants": rnd.randint(0, 400),
+            "kids": [k for k in range(item_id + 1, item_id + 5) if k <= max_item],
+        }
+    parent = item_id - (item_id % 5)
+    return {
+        "id": item_id, "type": "comment", "by": f"user{rnd.randint(1, 5000)}",
+        "time": 1_700_000_000 + item_id, "parent": parent,
+        "text": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(8, 40))),
+    }
+
+
+class StubState:
+    def __init__(self, latency=0.05, limit=0.0, max_item=40_000):
+        self.latency = latency
+        self.limit = limit
+        self.max_item = max_item
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.served = 0
+        self.throttled = 0
+
+    def admit(self):
+        """Fixed one-second window limiter. Returns seconds to wait, or 0 if admitted."""
+        if not self.limit:
+            return 0
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            if self.window_count >= self.limit:
+                self.throttled += 1
+                return max(0.05, 1.0 - (now - self.window_start))
+            self.window_count += 1
+            return 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        state = self.server.state
+        wait = state.admit()
+        if wait:
+            self.send_json(429, {"error": "Too Many Requests"}, {"Retry-After": f"{wait:.2f}"})
+            return
+        if state.latency:
+            time.sleep(state.latency)
+
+        path = self.path.split("?", 1)[0]
+        top = [i for i in range(state.max_item - state.max_item % 5, 0, -5)][:500]
+        if path in ("/v0/topstories.json", "/v0/newstories.json", "/v0/beststories.json"):
+            payload = top
+        elif path in ("/v0/askstories.json", "/v0/showstories.json"):
+            payload = top[::3][:200]
+        elif path == "/v0/maxitem.json":
+            payload = state.max_item
+        elif path == "/v0/updates.json":
+            payload = {"items": list(range(state.max_item - 50, state.max_item, 7)), "profiles": []}
+        elif path.startswith("/v0/item/") and path.endswith(".json"):
+            try:
+                payload = synth_item(int(path[len("/v0/item/"):-len(".json")]), state.max_item)
+            except ValueError:
+                self.send_json(400, {"error": "bad id"})
+                return
+        else:
+            self.send_json(404, {"error": "not found"})
+            return
+        with state.lock:
+            state.served += 1
+        self.send_json(200, payload)
+
+
+def start_stub_server(port=0, latency=0.05, limit=0.0, max_item=40_000):
+    """Start the stub on a daemon thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(latency, limit, max_item)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v0/"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub HN Firebase API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every response")
+    parser.add_argument("--limit", type=float, default=0, help="Requests/sec before answering 429 (0 = unlimited)")
+    parser.add_argument("--max-item", type=int, default=40_000)
+    args = parser.parse_args()
+
+    server, base = start_stub_server(args.port, args.latency, args.limit, args.max_item)
+    print(f"Stub HN API listening on {base}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()